@@ -0,0 +1,161 @@
+import json
+import math
+import os
+import tracemalloc
+import pytest
+from griptape.artifacts import ErrorArtifact
+from spotify_griptape_tool.mock_server import MockSpotifyServer, lognormal_latency
+from spotify_griptape_tool.tool import SpotifyClient
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+ALLOCATION_RUNS = 3
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("spotify activity benchmarks")
+    group.addoption("--latency-ms", type=float, default=10, help="Median simulated API latency. Default: 10.")
+    group.addoption(
+        "--latency-sigma", type=float, default=0.1, help="Spread of the lognormal API latency. Default: 0.1."
+    )
+    group.addoption("--rounds", type=int, default=20, help="Timed rounds per activity. Default: 20.")
+    group.addoption(
+        "--regression-threshold",
+        type=float,
+        default=0.25,
+        help="Fail when p50 latency or peak allocations exceed the baseline by more than this fraction. Default: 0.25.",
+    )
+    group.addoption(
+        "--p99-regression-threshold",
+        type=float,
+        default=None,
+        help="Also fail when p99 latency exceeds the baseline by more than this fraction. Off by default since with few "
+        "rounds p99 is the slowest round and swings with GC pauses and thread scheduling.",
+    )
+    group.addoption("--update-baseline", action="store_true", help=f"Record this run's results in {BASELINE_PATH}.")
+
+
+def percentile(data: list, q: float) -> float:
+    """Nearest-rank percentile of `data`, `q` between 0 and 100."""
+    ordered = sorted(data)
+    return ordered[max(math.ceil(q / 100 * len(ordered)) - 1, 0)]
+
+
+@pytest.fixture(scope="session")
+def baseline(request):
+    try:
+        with open(BASELINE_PATH, encoding="utf-8") as f:
+            results = json.load(f)
+    except FileNotFoundError:
+        results = {}
+
+    yield results
+
+    if request.config.getoption("--update-baseline"):
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump(dict(sorted(results.items())), f, indent=2)
+            f.write("\n")
+
+
+@pytest.fixture
+def make_server(request):
+    latency = lognormal_latency(
+        request.config.getoption("--latency-ms") / 1000, request.config.getoption("--latency-sigma")
+    )
+    return lambda: MockSpotifyServer(latency=latency, seed=0)
+
+
+@pytest.fixture
+def make_tool():
+    tools = []
+
+    def make(server: MockSpotifyServer) -> SpotifyClient:
+        tool = SpotifyClient(
+            client_id="id",
+            client_secret="secret",
+            authorization_redirect_uri="http://localhost/callback",
+            user_token="mock",
+            api_base_url=server.base_url,
+        )
+        server.mount(tool._get_client()._session)
+        tools.append(tool)
+        return tool
+
+    yield make
+
+    for tool in tools:
+        tool.executor.shutdown()
+
+
+@pytest.fixture
+def benchmark_activity(request, benchmark, baseline, make_server, make_tool):
+    """Benchmarks one activity of a new SpotifyClient per round, each backed by a new in-process mock server.
+
+    Records throughput, p50 and p99 latency, peak allocations and API calls in the benchmark's `extra_info`, and fails
+    the test when they regressed past the configured thresholds against `baseline.json`. Any extra API call fails.
+    """
+    config = request.config
+    name = request.node.callspec.id
+
+    def run(activity: str, values: dict, prepare=None) -> None:
+        servers = []
+
+        def setup():
+            server = make_server()
+            tool = make_tool(server)
+            params = {"values": prepare(tool) if prepare is not None else values}
+            server.requests.clear()
+            servers.append(server)
+            return (getattr(tool, activity), params), {}
+
+        def call(method, params):
+            result = method(params)
+            assert not isinstance(result, ErrorArtifact), result.value
+
+        # Allocations and API calls are measured on separate, untimed runs since tracing slows everything down. The peak
+        # depends on how concurrent requests interleave, so the largest of a few runs is kept.
+        peak_alloc = 0
+        for _ in range(ALLOCATION_RUNS):
+            args, _ = setup()
+            tracemalloc.start()
+            try:
+                call(*args)
+                peak_alloc = max(peak_alloc, tracemalloc.get_traced_memory()[1])
+            finally:
+                tracemalloc.stop()
+        api_calls = sum(servers[0].requests.values())
+
+        benchmark.pedantic(call, setup=setup, rounds=config.getoption("--rounds"), iterations=1, warmup_rounds=2)
+        if benchmark.disabled:
+            return
+
+        timings = benchmark.stats.stats.data
+        results = {
+            "api_calls": api_calls,
+            "ops": round(1 / benchmark.stats.stats.mean, 2),
+            "p50_ms": round(percentile(timings, 50) * 1000, 3),
+            "p99_ms": round(percentile(timings, 99) * 1000, 3),
+            "peak_alloc_kb": round(peak_alloc / 1024, 1),
+        }
+        benchmark.extra_info.update(results)
+
+        expected = baseline.get(name)
+        if config.getoption("--update-baseline") or expected is None:
+            baseline[name] = results
+            return
+
+        threshold = config.getoption("--regression-threshold")
+        limits = {
+            "api_calls": expected["api_calls"],
+            "p50_ms": expected["p50_ms"] * (1 + threshold),
+            "peak_alloc_kb": expected["peak_alloc_kb"] * (1 + threshold),
+        }
+        if config.getoption("--p99-regression-threshold") is not None:
+            limits["p99_ms"] = expected["p99_ms"] * (1 + config.getoption("--p99-regression-threshold"))
+        regressions = [
+            f"{key}: {results[key]} (baseline {expected[key]}, limit {limit:g})"
+            for key, limit in limits.items()
+            if results[key] > limit
+        ]
+        assert not regressions, f"{name} regressed: " + "; ".join(regressions)
+
+    return run
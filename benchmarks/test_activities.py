@@ -0,0 +1,157 @@
+import base64
+import pytest
+from spotify_griptape_tool.mock_server import make_id
+from spotify_griptape_tool.tool import SpotifyClient
+
+ALBUM = make_id("album", 7)
+ARTIST = make_id("artist", 7)
+PLAYLIST = make_id("playlist", 7)
+TRACK = make_id("track", 7)
+# The mock library holds the 500 tracks and 100 albums numbered from 0; higher numbers are not saved.
+SAVED_TRACKS = [make_id("track", n) for n in range(0, 200, 2)]
+UNSAVED_TRACKS = [make_id("track", n) for n in range(1000, 1100)]
+SAVED_ALBUMS = [make_id("album", n) for n in range(0, 40)]
+UNSAVED_ALBUMS = [make_id("album", n) for n in range(1000, 1040)]
+TRACK_URIS = [f"spotify:track:{id}" for id in UNSAVED_TRACKS]
+
+
+def stored_result(tool: SpotifyClient) -> dict:
+    handle = tool.result_store.put([{"id": make_id("track", n), "name": f"Track {n}"} for n in range(500)])
+    return {"handle": handle, "offset": 200, "limit": 50}
+
+
+def export_into(tool: SpotifyClient, directory) -> dict:
+    tool.export_directory = str(directory)
+    return {"path": "saved_tracks.ndjson", "market": "US"}
+
+
+CASES = [
+    pytest.param("get_album", {"id": ALBUM, "market": "US"}, None, id="get_album"),
+    pytest.param("get_albums", {"ids": SAVED_ALBUMS, "market": "US"}, None, id="get_albums"),
+    pytest.param("get_album_tracks", {"id": ALBUM, "market": "US"}, None, id="get_album_tracks"),
+    pytest.param(
+        "get_current_user_saved_albums",
+        {"limit": 50, "offset": 0, "market": "US"},
+        None,
+        id="get_current_user_saved_albums",
+    ),
+    pytest.param(
+        "add_to_current_user_saved_albums", {"ids": UNSAVED_ALBUMS}, None, id="add_to_current_user_saved_albums"
+    ),
+    pytest.param(
+        "remove_from_current_user_saved_albums", {"ids": SAVED_ALBUMS}, None, id="remove_from_current_user_saved_albums"
+    ),
+    pytest.param(
+        "check_current_user_saved_albums",
+        {"ids": SAVED_ALBUMS + UNSAVED_ALBUMS},
+        None,
+        id="check_current_user_saved_albums",
+    ),
+    pytest.param("get_new_releases", {"country": "US", "limit": 50, "offset": 0}, None, id="get_new_releases"),
+    pytest.param("get_artist", {"id": ARTIST}, None, id="get_artist"),
+    pytest.param("get_artists", {"ids": [make_id("artist", n) for n in range(50)]}, None, id="get_artists"),
+    pytest.param(
+        "get_artist_albums",
+        {"id": ARTIST, "include_groups": ["album", "single"], "market": "US", "limit": 50, "offset": 0},
+        None,
+        id="get_artist_albums",
+    ),
+    pytest.param("get_artist_top_tracks", {"id": ARTIST, "country": "US"}, None, id="get_artist_top_tracks"),
+    pytest.param(
+        "get_artist_related_artists", {"id": ARTIST, "limit": 20, "offset": 0}, None, id="get_artist_related_artists"
+    ),
+    pytest.param("get_available_genre_seeds", {}, None, id="get_available_genre_seeds"),
+    pytest.param("get_available_markets", {}, None, id="get_available_markets"),
+    pytest.param("get_playlist", {"id": PLAYLIST, "market": "US"}, None, id="get_playlist"),
+    pytest.param(
+        "change_playlist_details",
+        {"id": PLAYLIST, "name": "Renamed", "public": False, "collaborative": False, "description": "Benchmark"},
+        None,
+        id="change_playlist_details",
+    ),
+    pytest.param("get_playlist_items", {"id": PLAYLIST, "market": "US"}, None, id="get_playlist_items"),
+    pytest.param(
+        "get_playlist_items",
+        {"id": PLAYLIST, "market": "US", "all_items": True},
+        None,
+        id="get_playlist_items[all_items]",
+    ),
+    pytest.param(
+        "playlist_reorder_items",
+        {"id": PLAYLIST, "range_start": 0, "insert_before": 10, "range_length": 2},
+        None,
+        id="playlist_reorder_items",
+    ),
+    pytest.param("replace_playlist_items", {"id": PLAYLIST, "uris": TRACK_URIS}, None, id="replace_playlist_items"),
+    pytest.param(
+        "add_items_to_playlist", {"id": PLAYLIST, "uris": TRACK_URIS, "position": 0}, None, id="add_items_to_playlist"
+    ),
+    pytest.param("remove_playlist_items", {"id": PLAYLIST, "uris": TRACK_URIS}, None, id="remove_playlist_items"),
+    pytest.param("get_current_user_playlists", {"limit": 50, "offset": 0}, None, id="get_current_user_playlists"),
+    pytest.param(
+        "get_user_playlists", {"user_id": "mock-user", "limit": 50, "offset": 0}, None, id="get_user_playlists"
+    ),
+    pytest.param(
+        "create_playlist",
+        {"name": "Benchmark", "public": False, "collaborative": False, "description": "Benchmark"},
+        None,
+        id="create_playlist",
+    ),
+    pytest.param("get_featured_playlists", {"limit": 50, "offset": 0}, None, id="get_featured_playlists"),
+    pytest.param(
+        "get_category_playlists",
+        {"category_id": "jazz", "country": "US", "limit": 50, "offset": 0},
+        None,
+        id="get_category_playlists",
+    ),
+    pytest.param("get_playlist_cover_image", {"id": PLAYLIST}, None, id="get_playlist_cover_image"),
+    pytest.param(
+        "upload_custom_playlist_cover_image",
+        {"id": PLAYLIST, "image": base64.b64encode(bytes(range(256)) * 64).decode()},
+        None,
+        id="upload_custom_playlist_cover_image",
+    ),
+    pytest.param("search", {"q": "remaster track:Doxy", "type": ["track", "album"], "market": "US"}, None, id="search"),
+    pytest.param("get_track", {"id": TRACK, "market": "US"}, None, id="get_track"),
+    pytest.param("get_tracks", {"ids": SAVED_TRACKS[:50], "market": "US"}, None, id="get_tracks"),
+    pytest.param(
+        "get_current_users_saved_tracks",
+        {"limit": 50, "offset": 0, "market": "US"},
+        None,
+        id="get_current_users_saved_tracks",
+    ),
+    pytest.param(
+        "export_current_users_saved_tracks",
+        None,
+        lambda tool, tmp_path: export_into(tool, tmp_path),
+        id="export_current_users_saved_tracks",
+    ),
+    pytest.param("save_tracks_for_user", {"ids": UNSAVED_TRACKS}, None, id="save_tracks_for_user"),
+    pytest.param("remove_tracks_for_user", {"ids": SAVED_TRACKS}, None, id="remove_tracks_for_user"),
+    pytest.param(
+        "check_current_users_saved_tracks",
+        {"ids": SAVED_TRACKS + UNSAVED_TRACKS},
+        None,
+        id="check_current_users_saved_tracks",
+    ),
+    pytest.param("get_audio_features", {"ids": SAVED_TRACKS}, None, id="get_audio_features"),
+    pytest.param("get_audio_analysis", {"id": TRACK}, None, id="get_audio_analysis"),
+    pytest.param(
+        "sync_current_user_saved_library",
+        {"library": "tracks", "market": "US"},
+        None,
+        id="sync_current_user_saved_library",
+    ),
+    pytest.param("read_result_page", None, lambda tool, tmp_path: stored_result(tool), id="read_result_page"),
+]
+
+
+def test_every_activity_is_benchmarked():
+    tool = SpotifyClient(client_id="id", client_secret="secret", authorization_redirect_uri="http://localhost/callback")
+
+    assert {tool.activity_name(activity) for activity in tool.activities()} == {case.values[0] for case in CASES}
+
+
+@pytest.mark.parametrize("activity, values, prepare", CASES)
+def test_activity(benchmark_activity, tmp_path, activity, values, prepare):
+    benchmark_activity(activity, values, prepare and (lambda tool: prepare(tool, tmp_path)))
@@ -0,0 +1,41 @@
+import socket
+import pytest
+from spotify_griptape_tool.async_tool import AsyncSpotifyClient
+from spotify_griptape_tool.session import SessionPool
+from spotify_griptape_tool.tool import SpotifyClient
+
+TOOL_ARGS = {
+    "client_id": "id",
+    "client_secret": "secret",
+    "authorization_redirect_uri": "http://localhost/callback",
+    "authorization_code": "code",
+}
+
+# Tools are built per request, so building one has to stay far below the cost of a single API call.
+MAX_CONSTRUCTION_SECONDS = 0.0005
+
+
+@pytest.fixture
+def no_network(monkeypatch):
+    def connect(*args):
+        raise AssertionError("Building a tool must not open a connection")
+
+    monkeypatch.setattr(socket.socket, "connect", connect)
+
+
+@pytest.mark.parametrize("tool_class", [SpotifyClient, AsyncSpotifyClient])
+def test_construction(benchmark, no_network, tool_class):
+    """Builds a tool with an authorization code, which is only exchanged for a token on the first activity."""
+    benchmark(lambda: tool_class(**TOOL_ARGS))
+    if not benchmark.disabled:
+        benchmark.extra_info["construction_us"] = round(benchmark.stats.stats.median * 1e6, 1)
+        assert benchmark.stats.stats.median < MAX_CONSTRUCTION_SECONDS
+
+
+@pytest.mark.parametrize("pooled", [False, True], ids=["own_session", "session_pool"])
+def test_first_use(benchmark, mocker, no_network, pooled):
+    """Sets up a new tool's client the way its first activity would, with or without a pool shared between tools."""
+    mocker.patch("spotify_griptape_tool.tool.SpotifyOAuth.get_access_token", return_value="token")
+    pool = SessionPool() if pooled else None
+
+    benchmark(lambda: SpotifyClient(**TOOL_ARGS, session_pool=pool)._get_client())
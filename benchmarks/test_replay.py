@@ -0,0 +1,46 @@
+import pytest
+from spotify_griptape_tool.mock_server import MockSpotifyServer, MockTransport, make_id
+from spotify_griptape_tool.replay import RecordingTransport, ReplayTransport
+from spotify_griptape_tool.tool import SpotifyClient
+
+# A typical agent session: find something, look it up, then read a whole playlist.
+SESSION = [
+    ("search", {"q": "remaster track:Doxy", "type": ["track"], "market": "US"}),
+    ("get_album", {"id": make_id("album", 1), "market": "US"}),
+    ("get_tracks", {"ids": [make_id("track", n) for n in range(20)], "market": "US"}),
+    ("get_playlist_items", {"id": make_id("playlist", 3), "market": "US", "all_items": True}),
+]
+
+
+def make_tool(transport):
+    return SpotifyClient(
+        client_id="id",
+        client_secret="secret",
+        authorization_redirect_uri="http://localhost/callback",
+        user_token="token",
+        transport=transport,
+    )
+
+
+def run_session(tool):
+    try:
+        for activity, values in SESSION:
+            getattr(tool, activity)({"values": values})
+    finally:
+        tool.executor.shutdown()
+
+
+@pytest.fixture(scope="module")
+def cassette():
+    tool = make_tool(RecordingTransport(inner=MockTransport(MockSpotifyServer())))
+    run_session(tool)
+    return tool.transport.cassette
+
+
+def test_replay_session(benchmark, cassette):
+    """Replays a recorded session with no latency, on a new tool each round as every agent session would get."""
+    benchmark.pedantic(
+        run_session, setup=lambda: ((make_tool(ReplayTransport(cassette, latency_scale=0)),), {}), rounds=50
+    )
+    if not benchmark.disabled:
+        benchmark.extra_info["sessions_per_minute"] = round(60 / benchmark.stats.stats.mean)
@@ -1,3 +1,43 @@
+from .budget import BudgetExceededError, CallBudget
+from .cache import BaseResponseCache, MemoryResponseCache, SqliteResponseCache
+from .concurrency import AdaptiveConcurrencyLimiter
+from .membership import MembershipCache
+from .metrics import MetricsRegistry
+from .ratelimit import RateLimiter
+from .replay import Cassette, RecordingTransport, ReplayTransport
+from .results import BaseResultStore, MemoryResultStore
+from .serialization import BaseResultSerializer, JsonResultSerializer, ReprResultSerializer
+from .session import SessionPool
+from .shaping import ResultShaper
+from .singleflight import SingleFlight
+from .sync import BaseWatermarkStore, FileWatermarkStore, MemoryWatermarkStore
 from .tool import SpotifyClient
+from .async_tool import AsyncSpotifyClient
 
-__all__ = ["SpotifyClient"]
+__all__ = [
+    "BudgetExceededError",
+    "CallBudget",
+    "BaseResponseCache",
+    "MemoryResponseCache",
+    "SqliteResponseCache",
+    "AdaptiveConcurrencyLimiter",
+    "MembershipCache",
+    "MetricsRegistry",
+    "RateLimiter",
+    "Cassette",
+    "RecordingTransport",
+    "ReplayTransport",
+    "BaseResultStore",
+    "MemoryResultStore",
+    "BaseResultSerializer",
+    "JsonResultSerializer",
+    "ReprResultSerializer",
+    "SessionPool",
+    "ResultShaper",
+    "SingleFlight",
+    "BaseWatermarkStore",
+    "FileWatermarkStore",
+    "MemoryWatermarkStore",
+    "SpotifyClient",
+    "AsyncSpotifyClient",
+]
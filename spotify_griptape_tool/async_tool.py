@@ -0,0 +1,159 @@
+from __future__ import annotations
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from urllib3 import HTTPResponse
+from urllib3.util import Retry
+from urllib3.util.retry import RequestHistory
+from griptape.artifacts import BaseArtifact
+from griptape.utils import import_optional_dependency
+from attr import define, field, Factory
+from spotipy import Spotify
+from spotify_griptape_tool.ratelimit import retry_after_seconds
+from spotify_griptape_tool.tool import SpotifyClient
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
+
+
+class AsyncClientTransport(BaseAdapter):
+    """requests transport adapter that sends requests through an `httpx.AsyncClient` running on `loop`.
+
+    The thread calling `send` waits for the response while the loop gets on with other work, so requests from any
+    number of threads share the async client's connection pool. Responses with a status `inner`'s retry policy retries
+    are sent again, after their Retry-After or the policy's backoff. Requests sent while `loop` is not set or not
+    running, or from the loop's own thread, where waiting would block it, go to `inner` instead.
+    """
+
+    def __init__(self, http_client: AsyncClient, inner: HTTPAdapter) -> None:
+        super().__init__()
+        self.http_client = http_client
+        self.inner = inner
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        loop = self.loop
+        if loop is None or not loop.is_running() or _running_loop() is loop:
+            return self.inner.send(request, **kwargs)
+        return asyncio.run_coroutine_threadsafe(self._send(request, kwargs.get("timeout")), loop).result()
+
+    def close(self) -> None:
+        self.inner.close()
+
+    async def _send(self, request: requests.PreparedRequest, timeout: Any) -> requests.Response:
+        httpx = import_optional_dependency("httpx")
+        if isinstance(timeout, tuple):
+            timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+        retry = self.inner.max_retries
+        history = []
+        while True:
+            try:
+                response = await self.http_client.request(
+                    request.method, request.url, headers=dict(request.headers), content=request.body, timeout=timeout
+                )
+            except httpx.TimeoutException as e:
+                raise requests.exceptions.Timeout(e, request=request)
+            except httpx.TransportError as e:
+                raise requests.exceptions.ConnectionError(e, request=request)
+            retry_after = "Retry-After" in response.headers
+            if len(history) >= _status_retries(retry) or not retry.is_retry(
+                request.method, response.status_code, retry_after
+            ):
+                break
+            history.append(RequestHistory(request.method, request.url, None, response.status_code, None))
+            await asyncio.sleep(retry_after_seconds(response.headers, retry.backoff_factor * 2 ** (len(history) - 1)))
+
+        raw = HTTPResponse(
+            body=response.content,
+            headers=response.headers,
+            status=response.status_code,
+            reason=response.reason_phrase,
+            preload_content=False,
+            decode_content=False,
+            retries=retry.new(history=tuple(history)),
+            request_method=request.method,
+            request_url=request.url,
+        )
+        result = self.inner.build_response(request, raw)
+        # httpx has already read and decoded the body.
+        result._content = response.content
+        return result
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _status_retries(retry: Retry) -> int:
+    limits = [limit for limit in (retry.total, retry.status) if limit is not None]
+    return max(int(min(limits, default=0)), 0)
+
+
+@define
+class AsyncSpotifyClient(SpotifyClient):
+    """SpotifyClient that can be awaited from an event loop and sends its requests through a non-blocking HTTP client.
+
+    Activities are SpotifyClient's, so they run, and are instrumented, the same way through griptape's `BaseTool.run`.
+    `arun_activity` awaits one without blocking the event loop: it runs on a thread of `activity_executor`, along with
+    the token exchange of the tool's first activity, and its requests go through one `httpx.AsyncClient` on the loop.
+    Each activity in flight holds one of the executor's `max_concurrent_activities` threads while it waits for its
+    responses, and further activities queue for a free thread. Pass the same `http_client` to several tools to share
+    its connection pool. Clients passed as `client` are used as they are.
+    """
+
+    max_connections = field(type=int, default=100)
+    max_concurrent_activities = field(type=int, default=64)
+    activity_executor = field(
+        type=ThreadPoolExecutor,
+        default=Factory(
+            lambda self: ThreadPoolExecutor(max_workers=self.max_concurrent_activities, thread_name_prefix="activity"),
+            takes_self=True,
+        ),
+    )
+    # Passed as `http_client`, or created on first use by `_get_http_client`.
+    _http_client = field(type=Optional["AsyncClient"], default=None)
+    _async_transport = field(type=Optional[AsyncClientTransport], default=None, init=False)
+
+    def _get_http_client(self) -> AsyncClient:
+        if self._http_client is None:
+            httpx = import_optional_dependency("httpx")
+            self._http_client = httpx.AsyncClient(limits=httpx.Limits(max_connections=self.max_connections))
+        return self._http_client
+
+    async def arun_activity(self, activity: Union[str, Callable], params: dict) -> BaseArtifact:
+        """Runs the activity, or the activity named `activity`, with `params` and returns its artifact."""
+        if isinstance(activity, str):
+            # Looked up directly rather than with find_activity, which goes through every member of the tool.
+            name, activity = activity, getattr(self, activity, None)
+            if not getattr(activity, "is_activity", False):
+                raise ValueError(f"Unknown activity: {name}")
+        loop = asyncio.get_running_loop()
+        # The context is carried over, as asyncio.to_thread would, so the activity's span has the caller's as parent.
+        run = contextvars.copy_context().run
+        return await loop.run_in_executor(self.activity_executor, run, self._run_activity, loop, activity, params)
+
+    async def aclose(self) -> None:
+        if self._http_client is not None:
+            await self._http_client.aclose()
+
+    def _run_activity(self, loop: asyncio.AbstractEventLoop, activity: Callable, params: dict) -> BaseArtifact:
+        # Connecting may exchange an authorization code for a token, which has to happen off the loop as well.
+        self._get_client()
+        if self._async_transport is not None:
+            self._async_transport.loop = loop
+        return activity(params)
+
+    def _build_client(self) -> Spotify:
+        client = super()._build_client()
+        session = client._session
+        # Mounted for the scheme, so the transport, budget and tracing adapters mounted for the API prefix wrap it.
+        self._async_transport = AsyncClientTransport(self._get_http_client(), session.get_adapter("https://"))
+        session.mount("https://", self._async_transport)
+        session.mount("http://", self._async_transport)
+        return client
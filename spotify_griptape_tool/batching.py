@@ -0,0 +1,112 @@
+from __future__ import annotations
+from concurrent.futures import Executor, Future
+from threading import Lock, Timer
+from typing import Any, Callable, Optional
+from attr import define, field, Factory
+from spotify_griptape_tool.concurrency import map_all
+
+
+def chunked(items: list, size: int) -> list[list]:
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def fetch_in_chunks(
+    fetch: Callable[[list], list], ids: list, chunk_size: int, executor: Optional[Executor] = None
+) -> list:
+    """Calls `fetch` with slices of at most `chunk_size` IDs and concatenates the results in input order.
+
+    Chunks run concurrently on `executor` when one is given and there is more than one chunk. If a chunk fails, no other
+    chunk is left running once the error is raised.
+    """
+    chunks = chunked(ids, chunk_size)
+    if executor is None or len(chunks) <= 1:
+        results = map(fetch, chunks)
+    else:
+        results = map_all(fetch, chunks, executor)
+    return [item for chunk_result in results for item in chunk_result]
+
+
+def fill_missing(ids: list, results: list, fetch: Callable[[list], list]) -> tuple[list, dict]:
+    """Fills the None entries of `results`, which line up with `ids`, fetching each missing ID once.
+
+    Returns the filled results, still lined up with `ids` and keeping duplicate IDs, along with the fetched results by
+    ID. Runs in linear time in the number of IDs.
+    """
+    missing = list(dict.fromkeys(id for id, result in zip(ids, results) if result is None))
+    if not missing:
+        return results, {}
+    fetched = _by_id(missing, fetch(missing))
+    return [fetched[id] if result is None else result for id, result in zip(ids, results)], fetched
+
+
+def _by_id(ids: list, results: list) -> dict:
+    if len(results) != len(ids):
+        raise ValueError(f"Expected {len(ids)} results but got {len(results)}")
+    return dict(zip(ids, results))
+
+
+@define
+class MicroBatcher:
+    """Coalesces single-ID lookups that arrive within `window` seconds into one bulk request.
+
+    `fetch` receives a list of unique IDs and must return one result per ID, in order. A batch is sent as soon as it
+    holds `max_batch_size` IDs or `window` seconds after its first ID arrived, whichever comes first. IDs the API
+    returns no object for fail their futures with `missing_error(id)`.
+    """
+
+    fetch = field(type=Callable[[list], list])
+    max_batch_size = field(type=int)
+    window = field(type=float, default=0.01)
+    missing_error = field(type=Callable[[Any], Exception], default=lambda id: LookupError(f"No result for id: {id}"))
+    _pending = field(type=dict, default=Factory(dict), init=False)
+    _timer = field(type=Optional[Timer], default=None, init=False)
+    _lock = field(type=Lock, default=Factory(Lock), init=False)
+
+    def submit(self, id: Any) -> Future:
+        with self._lock:
+            future = self._pending.get(id)
+            if future is not None:
+                return future
+
+            future = Future()
+            self._pending[id] = future
+            if len(self._pending) >= self.max_batch_size:
+                batch = self._take_batch()
+            else:
+                batch = None
+                if self._timer is None:
+                    self._timer = Timer(self.window, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+
+        if batch is not None:
+            self._send(batch)
+        return future
+
+    def flush(self) -> None:
+        with self._lock:
+            batch = self._take_batch()
+        if batch:
+            self._send(batch)
+
+    def _take_batch(self) -> dict:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, {}
+        return batch
+
+    def _send(self, batch: dict) -> None:
+        try:
+            results = self.fetch(list(batch.keys()))
+        except Exception as e:
+            for future in batch.values():
+                future.set_exception(e)
+            return
+
+        for i, (id, future) in enumerate(batch.items()):
+            result = results[i] if i < len(results) else None
+            if result is None:
+                future.set_exception(self.missing_error(id))
+            else:
+                future.set_result(result)
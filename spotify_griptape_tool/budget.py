@@ -0,0 +1,164 @@
+from __future__ import annotations
+import time
+from collections import Counter, OrderedDict
+from threading import Lock
+from typing import Callable, Optional
+import requests
+from requests.adapters import BaseAdapter
+from attr import define, field, Factory
+from spotify_griptape_tool.metrics import endpoint_label
+
+REJECT = "reject"
+CACHE_ONLY = "cache_only"
+
+
+class BudgetExceededError(Exception):
+    """Raised instead of sending a Web API request that would go over a CallBudget limit."""
+
+
+@define
+class RunUsage:
+    """Web API calls made for one agent run."""
+
+    run_id = field(type=str)
+    user_id = field(type=Optional[str], default=None)
+    calls = field(type=Counter, default=Factory(Counter))
+    rejected = field(type=int, default=0)
+    last_used = field(type=float, default=0)
+
+    def to_dict(self, limit: Optional[int] = None) -> dict:
+        total = sum(self.calls.values())
+        return {
+            "run_id": self.run_id,
+            "user_id": self.user_id,
+            "calls": total,
+            "calls_by_endpoint": dict(self.calls.most_common()),
+            "rejected": self.rejected,
+            "limit": limit,
+            "remaining": None if limit is None else max(limit - total, 0),
+        }
+
+
+@define
+class CallBudget:
+    """Caps the Web API calls made per agent run, per user over `user_window` seconds, and per minute overall.
+
+    Tools sharing a budget draw on the same per-user and per-minute allowances, so share one instance across a
+    deployment to protect its quota. Every request the tool sends counts, and cached answers do not. Once a limit is
+    reached, `mode` decides what happens: with "reject" the tool's activities fail until the budget frees up,
+    with "cache_only" they keep answering from the tool's caches and only fail when they would need the network.
+    Requests with no user ID are not held to `per_user`. Runs that made no request for `run_ttl` seconds are
+    forgotten, as if ended.
+    """
+
+    per_run = field(type=Optional[int], default=None)
+    per_user = field(type=Optional[int], default=None)
+    per_minute = field(type=Optional[int], default=None)
+    user_window = field(type=float, default=86400)
+    mode = field(type=str, default=REJECT)
+    run_ttl = field(type=float, default=3600)
+    # Ordered from least to most recently used, so idle runs are found at the front.
+    _runs = field(type=OrderedDict, default=Factory(OrderedDict), init=False)
+    _user_calls = field(type=dict, default=Factory(dict), init=False)
+    _minute_calls = field(type=tuple, default=(0, 0), init=False)
+    _lock = field(type=Lock, default=Factory(Lock), init=False)
+
+    def __attrs_post_init__(self) -> None:
+        if self.mode not in (REJECT, CACHE_ONLY):
+            raise ValueError(f"mode must be '{REJECT}' or '{CACHE_ONLY}'")
+
+    def charge(self, run_id: str, user_id: Optional[str], method: str, url: str) -> None:
+        """Counts one request, or raises BudgetExceededError if sending it would go over a limit."""
+        now = time.monotonic()
+        with self._lock:
+            usage = self._usage(run_id, user_id, now)
+            self._check(usage, now)
+            usage.calls[f"{method} {endpoint_label(url)}"] += 1
+            if user_id is not None:
+                self._user_calls[user_id] = (_window(now, self.user_window), self._user_count(user_id, now) + 1)
+            self._minute_calls = (_window(now, 60), self._minute_count(now) + 1)
+
+    def check(self, run_id: str, user_id: Optional[str]) -> None:
+        """Raises BudgetExceededError if the next request for `run_id` and `user_id` would go over a limit."""
+        now = time.monotonic()
+        with self._lock:
+            self._check(self._usage(run_id, user_id, now), now)
+
+    def summary(self, run_id: str) -> dict:
+        """The calls made for `run_id` so far, by endpoint, with the requests rejected and the run's remaining calls."""
+        with self._lock:
+            return self._runs.get(run_id, RunUsage(run_id)).to_dict(self.per_run)
+
+    def end_run(self, run_id: str) -> dict:
+        """Returns the summary of `run_id` and forgets it. Its calls still count towards the per-user limit."""
+        with self._lock:
+            return self._runs.pop(run_id, RunUsage(run_id)).to_dict(self.per_run)
+
+    def _usage(self, run_id: str, user_id: Optional[str], now: float) -> RunUsage:
+        usage = self._runs.get(run_id)
+        if usage is None:
+            usage = self._runs[run_id] = RunUsage(run_id, user_id)
+        else:
+            self._runs.move_to_end(run_id)
+        usage.last_used = now
+        self._evict_idle_runs(now)
+        return usage
+
+    def _evict_idle_runs(self, now: float) -> None:
+        while self._runs:
+            usage = next(iter(self._runs.values()))
+            if now - usage.last_used < self.run_ttl:
+                return
+            del self._runs[usage.run_id]
+
+    def _check(self, usage: RunUsage, now: float) -> None:
+        exceeded = self._exceeded(usage, now)
+        if exceeded is not None:
+            usage.rejected += 1
+            raise BudgetExceededError(f"Spotify API call budget exceeded: {exceeded}")
+
+    def _exceeded(self, usage: RunUsage, now: float) -> Optional[str]:
+        if self.per_run is not None and sum(usage.calls.values()) >= self.per_run:
+            return f"{self.per_run} calls per run"
+        if (
+            self.per_user is not None
+            and usage.user_id is not None
+            and self._user_count(usage.user_id, now) >= self.per_user
+        ):
+            return f"{self.per_user} calls per user every {self.user_window:g}s"
+        if self.per_minute is not None and self._minute_count(now) >= self.per_minute:
+            return f"{self.per_minute} calls per minute"
+        return None
+
+    def _user_count(self, user_id: Optional[str], now: float) -> int:
+        window, count = self._user_calls.get(user_id, (None, 0))
+        return count if window == _window(now, self.user_window) else 0
+
+    def _minute_count(self, now: float) -> int:
+        window, count = self._minute_calls
+        return count if window == _window(now, 60) else 0
+
+
+def _window(now: float, length: float) -> int:
+    # Limits apply to fixed windows, so each check is a comparison rather than a scan of past calls.
+    return int(now // length)
+
+
+class BudgetTransport(BaseAdapter):
+    """requests transport adapter that passes each request's method and URL to `charge` before sending it to `inner`.
+
+    `charge` raises to stop a request from being sent, normally with BudgetExceededError. Retries made by urllib3
+    inside `inner` are not seen; those made by RateLimitedSession are, since it sends them again.
+    """
+
+    def __init__(self, charge: Callable[[str, str], None], inner: BaseAdapter) -> None:
+        super().__init__()
+        self.charge = charge
+        self.inner = inner
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        self.charge(request.method, request.url)
+        return self.inner.send(request, **kwargs)
+
+    def close(self) -> None:
+        self.inner.close()
@@ -0,0 +1,163 @@
+from __future__ import annotations
+import json
+import os
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from threading import Lock, local
+from typing import Any, Optional
+from attr import define, field, Factory
+
+
+@define
+class BaseResponseCache(ABC):
+    """Storage backend for Spotify API responses keyed by `(endpoint, id, market)` tuples.
+
+    `get` returns None on a miss or when the entry has expired. Values are JSON-compatible API responses.
+    """
+
+    @abstractmethod
+    def get(self, key: tuple) -> Optional[Any]:
+        ...
+
+    @abstractmethod
+    def set(self, key: tuple, value: Any, ttl: float) -> None:
+        ...
+
+    @abstractmethod
+    def delete(self, key: tuple) -> None:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+
+@define
+class MemoryResponseCache(BaseResponseCache):
+    """In-process cache of Spotify API responses with per-entry TTLs and LRU eviction.
+
+    Keys are `(endpoint, id, market)` tuples. Once `max_size` entries are stored the least recently used entry is
+    evicted to make room for a new one.
+    """
+
+    max_size = field(type=int, default=1024)
+    _entries = field(type=OrderedDict, default=Factory(OrderedDict), init=False)
+    _lock = field(type=Lock, default=Factory(Lock), init=False)
+
+    def get(self, key: tuple) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: tuple, value: Any, ttl: float) -> None:
+        if self.max_size <= 0 or ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: tuple) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@define
+class SqliteResponseCache(BaseResponseCache):
+    """Cache stored in a local SQLite database, shared by every process on the host that points at the same `path`.
+
+    The database runs in WAL mode so readers in other processes are not blocked by writers, and entries survive
+    restarts. Expiry uses wall-clock time since entries are shared across processes. When `max_size` is set, the
+    entries closest to expiring are evicted first once the table grows past it.
+    """
+
+    path = field(type=str)
+    max_size = field(type=Optional[int], default=None)
+    timeout = field(type=float, default=5.0)
+    prune_interval = field(type=int, default=256)
+    _local = field(type=local, default=Factory(local), init=False)
+    _writes = field(type=int, default=0, init=False)
+
+    def __attrs_post_init__(self) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at)")
+
+    def get(self, key: tuple) -> Optional[Any]:
+        row = (
+            self._connection()
+            .execute("SELECT value, expires_at FROM responses WHERE key = ?", (self._encode_key(key),))
+            .fetchone()
+        )
+        if row is None or row[1] <= time.time():
+            return None
+        return json.loads(row[0])
+
+    def set(self, key: tuple, value: Any, ttl: float) -> None:
+        if ttl <= 0:
+            return
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires_at) VALUES (?, ?, ?)",
+                (self._encode_key(key), json.dumps(value, separators=(",", ":")), time.time() + ttl),
+            )
+        self._writes += 1
+        if self._writes % self.prune_interval == 0:
+            self.prune()
+
+    def delete(self, key: tuple) -> None:
+        with self._connection() as conn:
+            conn.execute("DELETE FROM responses WHERE key = ?", (self._encode_key(key),))
+
+    def clear(self) -> None:
+        with self._connection() as conn:
+            conn.execute("DELETE FROM responses")
+
+    def prune(self) -> None:
+        with self._connection() as conn:
+            conn.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+            if self.max_size is not None:
+                conn.execute(
+                    "DELETE FROM responses WHERE key IN "
+                    "(SELECT key FROM responses ORDER BY expires_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_size,),
+                )
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections may not be shared between threads, so each thread opens its own.
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.timeout)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _encode_key(key: tuple) -> str:
+        return json.dumps(key, separators=(",", ":"))
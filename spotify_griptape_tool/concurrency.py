@@ -0,0 +1,159 @@
+from __future__ import annotations
+import time
+from concurrent.futures import Executor, Future, wait
+from threading import Condition
+from typing import Any, Callable, Iterable, Optional
+import requests
+from requests.adapters import BaseAdapter
+from attr import define, field, Factory
+from spotipy import SpotifyException
+
+
+def is_overload_status(status: int) -> bool:
+    """Whether a response status means Spotify is shedding load: a 429 or any 5xx."""
+    return status == 429 or status >= 500
+
+
+def is_overload_error(error: BaseException) -> bool:
+    return isinstance(error, SpotifyException) and is_overload_status(error.http_status)
+
+
+def retried_statuses(response: requests.Response) -> list[int]:
+    """Statuses of the attempts urllib3 retried inside the transport adapter before it got `response`."""
+    retries = getattr(response.raw, "retries", None)
+    return [attempt.status for attempt in getattr(retries, "history", ()) if attempt.status is not None]
+
+
+def map_all(fn: Callable[[Any], Any], items: Iterable, executor: Executor) -> list:
+    """Calls `fn` with each item concurrently on `executor` and returns the results in order.
+
+    Unlike `Executor.map`, a failed call does not leave the others running: calls not yet started are cancelled and
+    those already running are waited for before the error is raised, so no request outlives the fan-out.
+    """
+    futures = [executor.submit(fn, item) for item in items]
+    try:
+        return [future.result() for future in futures]
+    except BaseException:
+        cancel_all(futures)
+        raise
+
+
+def cancel_all(futures: Iterable[Future]) -> None:
+    """Cancels the futures that have not started and waits for the rest to finish."""
+    futures = list(futures)
+    for future in futures:
+        future.cancel()
+    wait(futures)
+
+
+@define
+class AdaptiveConcurrencyLimiter:
+    """Caps the number of requests in flight with an additive-increase/multiplicative-decrease (AIMD) limit.
+
+    Each healthy response raises the limit by `increase / limit`, so it grows by roughly `increase` per round of
+    requests. A 429 or 5xx, or a response slower than `latency_threshold` seconds when one is set, multiplies the limit
+    by `backoff_ratio`. The limit stays between `min_limit` and `max_limit`; `limit` reports its current value.
+
+    `call` adjusts the limit for the outcome of the call it makes. Calls whose responses reach the limiter some other
+    way, e.g. through a LimiterTransport, which also sees attempts retried inside the transport, use `hold` instead.
+    """
+
+    max_limit = field(type=int, default=16)
+    min_limit = field(type=int, default=1)
+    initial_limit = field(type=Optional[int], default=None)
+    increase = field(type=float, default=1.0)
+    backoff_ratio = field(type=float, default=0.5)
+    latency_threshold = field(type=Optional[float], default=None)
+    _limit = field(type=float, default=0.0, init=False)
+    _in_flight = field(type=int, default=0, init=False)
+    _condition = field(type=Condition, default=Factory(Condition), init=False)
+
+    def __attrs_post_init__(self) -> None:
+        self._limit = float(self.max_limit if self.initial_limit is None else self.initial_limit)
+
+    @property
+    def limit(self) -> int:
+        return max(self.min_limit, int(self._limit))
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def call(self, fn: Callable[..., Any], *args) -> Any:
+        self.acquire()
+        start = time.monotonic()
+        try:
+            result = fn(*args)
+        except BaseException as e:
+            self.release(time.monotonic() - start, overloaded=is_overload_error(e))
+            raise
+        self.release(time.monotonic() - start)
+        return result
+
+    def hold(self, fn: Callable[..., Any], *args) -> Any:
+        """Calls `fn` in a slot, leaving the limit to the responses passed to `record`."""
+        self.acquire()
+        try:
+            return fn(*args)
+        finally:
+            with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    def acquire(self) -> None:
+        with self._condition:
+            while self._in_flight >= self.limit:
+                self._condition.wait()
+            self._in_flight += 1
+
+    def release(self, latency: float, overloaded: bool = False) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            self._adjust(latency, overloaded)
+            self._condition.notify_all()
+
+    def record(self, latency: Optional[float], overloaded: bool = False) -> None:
+        """Adjusts the limit for one response, which took `latency` seconds, or an unknown time if None."""
+        with self._condition:
+            self._adjust(latency, overloaded)
+            self._condition.notify_all()
+
+    def _adjust(self, latency: Optional[float], overloaded: bool) -> None:
+        slow = latency is not None and self.latency_threshold is not None and latency > self.latency_threshold
+        if overloaded or slow:
+            self._limit = max(float(self.min_limit), self._limit * self.backoff_ratio)
+        else:
+            self._limit = min(float(self.max_limit), self._limit + self.increase / self._limit)
+
+
+class LimiterTransport(BaseAdapter):
+    """requests transport adapter that passes the status of every attempt sent through `inner` to `limiter`.
+
+    Attempts urllib3 retried inside `inner` are read from the response's retry history, so 429s and 5xx responses that
+    never reach the caller still lower the limit, as does urllib3 running out of retries. Those made by
+    RateLimitedSession pass through on their own.
+    """
+
+    def __init__(self, limiter: AdaptiveConcurrencyLimiter, inner: BaseAdapter) -> None:
+        super().__init__()
+        self.limiter = limiter
+        self.inner = inner
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        start = time.monotonic()
+        try:
+            response = self.inner.send(request, **kwargs)
+        except requests.exceptions.RetryError:
+            # urllib3 gave up on a status it retries, and the error does not keep the statuses it got.
+            self.limiter.record(None, overloaded=True)
+            raise
+        retried = retried_statuses(response)
+        for status in retried:
+            self.limiter.record(None, overloaded=is_overload_status(status))
+        # After retries, the time taken includes theirs and their backoff, so the last attempt's own is unknown.
+        latency = None if retried else time.monotonic() - start
+        self.limiter.record(latency, overloaded=is_overload_status(response.status_code))
+        return response
+
+    def close(self) -> None:
+        self.inner.close()
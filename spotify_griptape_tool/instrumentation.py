@@ -0,0 +1,62 @@
+from __future__ import annotations
+import functools
+import time
+from contextlib import nullcontext
+from typing import Any, Callable, Optional
+from griptape.artifacts import ErrorArtifact
+from spotify_griptape_tool.budget import BudgetExceededError
+from spotify_griptape_tool.tracing import record_error
+
+
+def instrumented(func: Callable) -> Callable:
+    """Wraps an activity so it is recorded in the tool's `metrics`, traced with its `tracer` and refused once its
+    `call_budget` is spent in reject mode, when it has them.
+
+    With none set, the activity runs after three attribute checks.
+    """
+    name = getattr(func, "name", func.__name__)
+
+    @functools.wraps(func)
+    def wrapper(self, params: dict) -> Any:
+        if self.metrics is None and self.tracer is None and self.call_budget is None:
+            return func(self, params)
+        with _activity_span(self, name) as span:
+            start = time.perf_counter()
+            result = None
+            try:
+                result = _refusal(self) or func(self, params)
+                return result
+            finally:
+                _finish(self, span, name, time.perf_counter() - start, result)
+
+    return wrapper
+
+
+def instrument_activities(cls: type) -> type:
+    """Class decorator applying `instrumented` to every activity the class defines."""
+    for attr, value in list(vars(cls).items()):
+        if getattr(value, "is_activity", False):
+            setattr(cls, attr, instrumented(value))
+    return cls
+
+
+def _refusal(tool: Any) -> Optional[ErrorArtifact]:
+    try:
+        tool._check_budget()
+    except BudgetExceededError as e:
+        return ErrorArtifact(str(e))
+    return None
+
+
+def _activity_span(tool: Any, name: str):
+    if tool.tracer is None:
+        return nullcontext()
+    return tool.tracer.start_as_current_span(f"{type(tool).__name__}.{name}", attributes={"spotify.activity": name})
+
+
+def _finish(tool: Any, span: Optional[Any], name: str, seconds: float, result: Any) -> None:
+    # A None result means the activity raised, which the span records on its own.
+    if tool.metrics is not None:
+        tool.metrics.observe_activity(name, seconds, result is None or isinstance(result, ErrorArtifact))
+    if span is not None and isinstance(result, ErrorArtifact):
+        record_error(span, result.value)
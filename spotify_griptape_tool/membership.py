@@ -0,0 +1,48 @@
+from __future__ import annotations
+import time
+from threading import Lock
+from typing import Hashable, Optional
+from attr import define, field, Factory
+
+
+@define
+class MembershipCache:
+    """Remembers whether IDs are saved in each user's library, keyed by `(user_id, library)`.
+
+    Entries come from membership checks, library listings and the tool's own save and remove calls, which update it
+    write-through. They expire after `ttl` seconds so saves made outside the tool are eventually picked up.
+    """
+
+    ttl = field(type=float, default=300)
+    _entries = field(type=dict, default=Factory(dict), init=False)
+    _lock = field(type=Lock, default=Factory(Lock), init=False)
+
+    def get_many(self, user_id: Hashable, library: str, ids: list) -> list[Optional[bool]]:
+        """Returns whether each ID is saved, or None where that is not known."""
+        now = time.monotonic()
+        with self._lock:
+            entries = self._entries.get((user_id, library), {})
+            results = []
+            for id in ids:
+                entry = entries.get(id)
+                if entry is not None and entry[0] <= now:
+                    del entries[id]
+                    entry = None
+                results.append(None if entry is None else entry[1])
+            return results
+
+    def set_many(self, user_id: Hashable, library: str, saved: dict) -> None:
+        """Records the saved state of each ID in `saved`, a mapping of ID to bool."""
+        expires_at = time.monotonic() + self.ttl
+        with self._lock:
+            entries = self._entries.setdefault((user_id, library), {})
+            for id, is_saved in saved.items():
+                entries[id] = (expires_at, is_saved)
+
+    def clear(self, user_id: Optional[Hashable] = None) -> None:
+        with self._lock:
+            if user_id is None:
+                self._entries.clear()
+            else:
+                for key in [key for key in self._entries if key[0] == user_id]:
+                    del self._entries[key]
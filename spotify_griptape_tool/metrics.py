@@ -0,0 +1,291 @@
+from __future__ import annotations
+import re
+from bisect import bisect_left
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from typing import TYPE_CHECKING, Any, Optional
+from urllib.parse import urlsplit
+from attr import define, field, Factory
+
+if TYPE_CHECKING:
+    from spotify_griptape_tool.concurrency import AdaptiveConcurrencyLimiter
+
+# Upper bounds in seconds, from a cached activity to a slow paged export.
+DEFAULT_LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Path segments that would make one label value per ID: Spotify IDs, and user and category IDs by position.
+ID_SEGMENT = re.compile(r"[0-9A-Za-z]{22}")
+NAMED_SEGMENTS = {"users": "{user_id}", "categories": "{category_id}"}
+
+
+def endpoint_label(url: str) -> str:
+    """The API path of `url` with IDs replaced by placeholders, e.g. `albums/{id}/tracks`."""
+    segments = urlsplit(url).path.strip("/").split("/")
+    if segments and segments[0] == "v1":
+        segments = segments[1:]
+    labels = []
+    for i, segment in enumerate(segments):
+        if i > 0 and segments[i - 1] in NAMED_SEGMENTS:
+            labels.append(NAMED_SEGMENTS[segments[i - 1]])
+        elif ID_SEGMENT.fullmatch(segment):
+            labels.append("{id}")
+        else:
+            labels.append(segment)
+    return "/".join(labels)
+
+
+def body_size(body: Any) -> int:
+    """Size in bytes of a request or response body, which may be text, bytes or absent."""
+    if body is None:
+        return 0
+    return len(body.encode("utf-8") if isinstance(body, str) else body)
+
+
+@define
+class Histogram:
+    buckets = field(type=tuple)
+    counts = field(type=list, default=Factory(lambda self: [0] * (len(self.buckets) + 1), takes_self=True))
+    count = field(type=int, default=0)
+    sum = field(type=float, default=0.0)
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimates the `q` quantile by interpolating within its bucket, the way Prometheus' histogram_quantile does."""
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                if i == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                return lower + (self.buckets[i] - lower) * (rank - seen) / count
+            seen += count
+        return self.buckets[-1]
+
+    def to_dict(self) -> dict:
+        return {"count": self.count, "sum": self.sum, "p50": self.quantile(0.5), "p99": self.quantile(0.99)}
+
+
+@define
+class MetricsRegistry:
+    """Latency histograms and counters for a tool's activities, its Web API requests and its caches, and gauges for
+    the concurrency limiters it watches.
+
+    Read them with `snapshot()`, render them in the Prometheus text format with `render()`, or serve that on a
+    `/metrics` endpoint with `serve()`. Tools only record into a registry set as their `metrics`, so leaving it unset
+    costs one attribute check per activity call.
+    """
+
+    buckets = field(type=tuple, default=DEFAULT_LATENCY_BUCKETS)
+    _activity_latency = field(type=dict, default=Factory(dict), init=False)
+    _activity_calls = field(type=Counter, default=Factory(Counter), init=False)
+    _request_latency = field(type=dict, default=Factory(dict), init=False)
+    _requests = field(type=Counter, default=Factory(Counter), init=False)
+    _bytes_sent = field(type=Counter, default=Factory(Counter), init=False)
+    _bytes_received = field(type=Counter, default=Factory(Counter), init=False)
+    _cache_lookups = field(type=Counter, default=Factory(Counter), init=False)
+    _limiters = field(type=dict, default=Factory(dict), init=False)
+    _lock = field(type=Lock, default=Factory(Lock), init=False)
+
+    def observe_activity(self, activity: str, seconds: float, error: bool) -> None:
+        with self._lock:
+            self._histogram(self._activity_latency, activity).observe(seconds)
+            self._activity_calls[(activity, "error" if error else "ok")] += 1
+
+    def observe_request(
+        self, method: str, url: str, status: int, seconds: float, bytes_sent: int, bytes_received: int
+    ) -> None:
+        key = (method, endpoint_label(url))
+        with self._lock:
+            self._histogram(self._request_latency, key).observe(seconds)
+            self._requests[(*key, str(status))] += 1
+            self._bytes_sent[key] += bytes_sent
+            self._bytes_received[key] += bytes_received
+
+    def observe_retried_request(self, method: str, url: str, status: int) -> None:
+        """Counts an attempt retried before the response passed to `observe_request`, whose time and sizes are unknown."""
+        with self._lock:
+            self._requests[(method, endpoint_label(url), str(status))] += 1
+
+    def observe_cache(self, cache: str, hits: int, misses: int) -> None:
+        with self._lock:
+            self._cache_lookups[(cache, "hit")] += hits
+            self._cache_lookups[(cache, "miss")] += misses
+
+    def watch_limiter(self, limiter: AdaptiveConcurrencyLimiter, name: str = "default") -> None:
+        """Reports the current limit and requests in flight of `limiter` under `name`.
+
+        A limiter watched under the same name is replaced. Share one limiter between tools to see the limit they
+        adapt together.
+        """
+        with self._lock:
+            self._limiters[name] = limiter
+
+    def cache_hit_ratio(self, cache: str) -> Optional[float]:
+        hits = self._cache_lookups[(cache, "hit")]
+        total = hits + self._cache_lookups[(cache, "miss")]
+        return hits / total if total else None
+
+    def reset(self) -> None:
+        with self._lock:
+            for values in (
+                self._activity_latency,
+                self._activity_calls,
+                self._request_latency,
+                self._requests,
+                self._bytes_sent,
+                self._bytes_received,
+                self._cache_lookups,
+            ):
+                values.clear()
+
+    def snapshot(self) -> dict:
+        """Current values as plain data, with latency percentiles estimated from the histograms."""
+        with self._lock:
+            activities = {
+                activity: {**histogram.to_dict(), "errors": self._activity_calls[(activity, "error")]}
+                for activity, histogram in self._activity_latency.items()
+            }
+            requests = {
+                f"{method} {endpoint}": {
+                    **histogram.to_dict(),
+                    "statuses": {
+                        status: count
+                        for (m, e, status), count in self._requests.items()
+                        if (m, e) == (method, endpoint)
+                    },
+                    "bytes_sent": self._bytes_sent[(method, endpoint)],
+                    "bytes_received": self._bytes_received[(method, endpoint)],
+                }
+                for (method, endpoint), histogram in self._request_latency.items()
+            }
+            caches = {cache: self.cache_hit_ratio(cache) for cache, _ in self._cache_lookups}
+            limiters = {
+                name: {"limit": limiter.limit, "in_flight": limiter.in_flight}
+                for name, limiter in self._limiters.items()
+            }
+        return {"activities": activities, "requests": requests, "cache_hit_ratios": caches, "limiters": limiters}
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            self._render_histograms(
+                lines,
+                "spotify_activity_duration_seconds",
+                "Time spent in each tool activity.",
+                {(("activity", activity),): histogram for activity, histogram in self._activity_latency.items()},
+            )
+            self._render_counter(
+                lines,
+                "spotify_activity_calls_total",
+                "Tool activity calls by outcome.",
+                {(("activity", a), ("outcome", o)): count for (a, o), count in self._activity_calls.items()},
+            )
+            self._render_histograms(
+                lines,
+                "spotify_api_request_duration_seconds",
+                "Time spent in each Web API request.",
+                {(("method", m), ("endpoint", e)): histogram for (m, e), histogram in self._request_latency.items()},
+            )
+            self._render_counter(
+                lines,
+                "spotify_api_requests_total",
+                "Web API requests by response status.",
+                {(("method", m), ("endpoint", e), ("status", s)): count for (m, e, s), count in self._requests.items()},
+            )
+            self._render_counter(
+                lines,
+                "spotify_api_request_bytes_total",
+                "Bytes sent in Web API request bodies.",
+                {(("method", m), ("endpoint", e)): count for (m, e), count in self._bytes_sent.items()},
+            )
+            self._render_counter(
+                lines,
+                "spotify_api_response_bytes_total",
+                "Bytes received in Web API response bodies.",
+                {(("method", m), ("endpoint", e)): count for (m, e), count in self._bytes_received.items()},
+            )
+            self._render_counter(
+                lines,
+                "spotify_cache_lookups_total",
+                "Cache lookups by result.",
+                {(("cache", c), ("result", r)): count for (c, r), count in self._cache_lookups.items()},
+            )
+            self._render_gauge(
+                lines,
+                "spotify_concurrency_limit",
+                "Current limit of each adaptive concurrency limiter.",
+                {(("limiter", name),): limiter.limit for name, limiter in self._limiters.items()},
+            )
+            self._render_gauge(
+                lines,
+                "spotify_concurrency_in_flight",
+                "Requests in flight through each adaptive concurrency limiter.",
+                {(("limiter", name),): limiter.in_flight for name, limiter in self._limiters.items()},
+            )
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port: int = 9464, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """Serves `render()` at `/metrics` from a background thread. Call `shutdown()` on the result to stop it."""
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                content = registry.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+    def _histogram(self, histograms: dict, key: Any) -> Histogram:
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = Histogram(self.buckets)
+        return histogram
+
+    def _render_histograms(self, lines: list, name: str, help: str, histograms: dict) -> None:
+        lines += [f"# HELP {name} {help}", f"# TYPE {name} histogram"]
+        for labels, histogram in histograms.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), histogram.counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f"{name}_bucket{_labels(labels + (('le', le),))} {cumulative}")
+            lines.append(f"{name}_sum{_labels(labels)} {histogram.sum!r}")
+            lines.append(f"{name}_count{_labels(labels)} {histogram.count}")
+
+    def _render_counter(self, lines: list, name: str, help: str, counts: dict) -> None:
+        lines += [f"# HELP {name} {help}", f"# TYPE {name} counter"]
+        lines += [f"{name}{_labels(labels)} {count}" for labels, count in counts.items()]
+
+    def _render_gauge(self, lines: list, name: str, help: str, values: dict) -> None:
+        lines += [f"# HELP {name} {help}", f"# TYPE {name} gauge"]
+        lines += [f"{name}{_labels(labels)} {value}" for labels, value in values.items()]
+
+
+def _labels(labels: tuple) -> str:
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
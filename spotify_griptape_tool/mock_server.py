@@ -0,0 +1,618 @@
+from __future__ import annotations
+import argparse
+import gzip
+import json
+import random
+import re
+import time
+import zlib
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from typing import Any, Callable, Optional
+from urllib.parse import parse_qs, urlencode, urlsplit
+import requests
+from requests.adapters import BaseAdapter
+from attr import define, field, Factory
+from griptape.utils import import_optional_dependency
+
+# Enough country codes to make catalog objects as large as the real ones, which list ~180 markets each.
+MARKETS = [f"{a}{b}" for a in "ABCDEFGHIJKLMNOPQRSTUVWXYZ" for b in "ABCDEFG"][:180]
+
+GENRES = ["acoustic", "ambient", "blues", "classical", "country", "electronic", "folk", "hip-hop", "jazz", "rock"]
+
+LIBRARY_EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+# Base URL that MockTransport answers for when a server is used without starting it.
+IN_PROCESS_BASE_URL = "http://spotify.mock/v1/"
+
+
+def _encode(body: Any) -> bytes:
+    return b"" if body is None else json.dumps(body, separators=(",", ":")).encode()
+
+
+def constant_latency(seconds: float) -> Callable[[random.Random], float]:
+    return lambda rng: seconds
+
+
+def uniform_latency(low: float, high: float) -> Callable[[random.Random], float]:
+    return lambda rng: rng.uniform(low, high)
+
+
+def lognormal_latency(median: float, sigma: float = 0.5) -> Callable[[random.Random], float]:
+    """Long-tailed latency around `median` seconds, closer to what a real API shows than a uniform spread."""
+    return lambda rng: median * rng.lognormvariate(0, sigma)
+
+
+def make_id(kind: str, n: int) -> str:
+    """A 22-character ID like the Web API's, e.g. `tr00000000000000000042`."""
+    return f"{kind[:2]}{n:020d}"
+
+
+def _number(id: str) -> int:
+    # IDs made by `make_id` map back to their number; any other ID gets a stable one from its hash.
+    return int(id[2:]) if len(id) == 22 and id[2:].isdigit() else zlib.crc32(id.encode())
+
+
+@define
+class MockSpotifyServer:
+    """Local stand-in for the Spotify Web API that serves deterministic synthetic data.
+
+    Implements the endpoints SpotifyClient uses: albums, artists, tracks, playlists, the user's library, browse,
+    search, audio features and audio analysis. Paged endpoints honor `limit` and `offset` and return `next` links.
+    Every response waits for a delay drawn from `latency`, and a `rate_limit_probability` share of requests get a 429
+    with a `retry_after` Retry-After header. `requests` counts the requests served by method and path pattern.
+
+    Point a tool at it with `SpotifyClient(..., user_token="mock", api_base_url=server.base_url)`.
+    """
+
+    host = field(type=str, default="127.0.0.1")
+    port = field(type=int, default=0)
+    latency = field(type=Callable[[random.Random], float], default=Factory(lambda: constant_latency(0)))
+    rate_limit_probability = field(type=float, default=0.0)
+    retry_after = field(type=int, default=1)
+    saved_tracks = field(type=int, default=500)
+    saved_albums = field(type=int, default=100)
+    playlist_size = field(type=int, default=250)
+    seed = field(type=int, default=0)
+    requests = field(type=Counter, default=Factory(Counter), init=False)
+    _rng = field(type=random.Random, default=None, init=False)
+    _lock = field(type=Lock, default=Factory(Lock), init=False)
+    _library = field(type=dict, default=Factory(dict), init=False)
+    _server = field(type=Optional[ThreadingHTTPServer], default=None, init=False)
+    _thread = field(type=Optional[Thread], default=None, init=False)
+    _routes = field(type=list, default=Factory(list), init=False)
+
+    def __attrs_post_init__(self) -> None:
+        self._rng = random.Random(self.seed)
+        # Newest saves first, one minute apart, as the library endpoints list them.
+        self._library = {
+            "track": {make_id("track", n): self._added_at(n) for n in range(self.saved_tracks)},
+            "album": {make_id("album", n): self._added_at(n) for n in range(self.saved_albums)},
+        }
+        self._routes = [
+            ("GET", r"albums/?", self._get_albums),
+            ("GET", r"albums/(?P<id>\w+)", self._get_album),
+            ("GET", r"albums/(?P<id>\w+)/tracks/?", self._get_album_tracks),
+            ("GET", r"artists/?", self._get_artists),
+            ("GET", r"artists/(?P<id>\w+)", self._get_artist),
+            ("GET", r"artists/(?P<id>\w+)/albums", self._get_artist_albums),
+            ("GET", r"artists/(?P<id>\w+)/top-tracks", self._get_artist_top_tracks),
+            ("GET", r"artists/(?P<id>\w+)/related-artists", self._get_related_artists),
+            ("GET", r"tracks/?", self._get_tracks),
+            ("GET", r"tracks/(?P<id>\w+)", self._get_track),
+            ("GET", r"audio-features/?", self._get_audio_features),
+            ("GET", r"audio-analysis/(?P<id>\w+)", self._get_audio_analysis),
+            ("GET", r"browse/new-releases", self._get_new_releases),
+            ("GET", r"browse/featured-playlists", self._get_featured_playlists),
+            ("GET", r"browse/categories/(?P<id>[\w-]+)/playlists", self._get_featured_playlists),
+            ("GET", r"recommendations/available-genre-seeds", lambda query: {"genres": GENRES}),
+            ("GET", r"markets", lambda query: {"markets": MARKETS}),
+            ("GET", r"search", self._search),
+            ("GET", r"me/?", lambda query: self._user("mock-user")),
+            ("GET", r"me/tracks", lambda query: self._get_saved(query, "track")),
+            ("GET", r"me/albums", lambda query: self._get_saved(query, "album")),
+            ("GET", r"me/library/contains", self._library_contains),
+            ("PUT", r"me/library", lambda query: self._update_library(query, add=True)),
+            ("DELETE", r"me/library", lambda query: self._update_library(query, add=False)),
+            ("GET", r"me/playlists", lambda query: self._get_user_playlists(query, "mock-user")),
+            ("GET", r"users/(?P<id>[\w-]+)/playlists", self._get_user_playlists),
+            ("POST", r"users/(?P<id>[\w-]+)/playlists", lambda query, id: self._playlist(make_id("playlist", 0))),
+            ("GET", r"playlists/(?P<id>\w+)", self._get_playlist),
+            ("PUT", r"playlists/(?P<id>\w+)", lambda query, id: None),
+            ("GET", r"playlists/(?P<id>\w+)/(tracks|items)", self._get_playlist_items),
+            ("POST", r"playlists/(?P<id>\w+)/(tracks|items)", self._snapshot),
+            ("PUT", r"playlists/(?P<id>\w+)/(tracks|items)", self._snapshot),
+            ("DELETE", r"playlists/(?P<id>\w+)/(tracks|items)", self._snapshot),
+            ("GET", r"playlists/(?P<id>\w+)/images", lambda query, id: self._images(id)),
+            ("PUT", r"playlists/(?P<id>\w+)/images", lambda query, id: None),
+        ]
+        self._routes = [(method, re.compile(pattern), handler) for method, pattern, handler in self._routes]
+
+    @property
+    def base_url(self) -> str:
+        """Prefix to use as the tool's `api_base_url`; `IN_PROCESS_BASE_URL` until the server is started."""
+        if self._server is None:
+            return IN_PROCESS_BASE_URL
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1/"
+
+    def mount(self, session: requests.Session) -> MockTransport:
+        """Serves `session`'s requests to `IN_PROCESS_BASE_URL` in-process, without starting the HTTP server."""
+        transport = MockTransport(self)
+        session.mount(IN_PROCESS_BASE_URL, transport)
+        return transport
+
+    def start(self) -> MockSpotifyServer:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                server._handle(self)
+
+            do_PUT = do_POST = do_DELETE = do_GET
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self._thread = Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> MockSpotifyServer:
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def dispatch(self, method: str, target: str) -> tuple[int, Any]:
+        """Serves one request for `target`, a path under `/v1/` with its query string, and returns its status and body.
+
+        Used by the HTTP server and by MockTransport, which calls it in-process.
+        """
+        url = urlsplit(target)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+
+        with self._lock:
+            delay = self.latency(self._rng)
+            throttled = self._rng.random() < self.rate_limit_probability
+        time.sleep(delay)
+
+        path = url.path.removeprefix("/v1/")
+        for route_method, pattern, handler in self._routes:
+            match = pattern.fullmatch(path)
+            if route_method == method and match:
+                with self._lock:
+                    self.requests[f"{method} {pattern.pattern}"] += 1
+                if throttled:
+                    return 429, {"error": {"status": 429, "message": "API rate limit exceeded"}}
+                try:
+                    return 200, handler(query, **match.groupdict())
+                except (KeyError, ValueError) as e:
+                    return 400, {"error": {"status": 400, "message": f"Invalid request: {e}"}}
+
+        return 404, {"error": {"status": 404, "message": "Service not found"}}
+
+    def _handle(self, request: BaseHTTPRequestHandler) -> None:
+        if "Content-Length" in request.headers:
+            request.rfile.read(int(request.headers["Content-Length"]))
+        self._respond(request, *self.dispatch(request.command, request.path))
+
+    def _respond(self, request: BaseHTTPRequestHandler, status: int, body: Any) -> None:
+        content = _encode(body)
+        request.send_response(status)
+        for name, value in self._headers(status, content).items():
+            request.send_header(name, value)
+        request.end_headers()
+        request.wfile.write(content)
+
+    def _headers(self, status: int, content: bytes) -> dict:
+        headers = {"Content-Type": "application/json", "Content-Length": str(len(content))}
+        if status == 429:
+            headers["Retry-After"] = str(self.retry_after)
+        return headers
+
+    #####################
+    ###    OBJECTS    ###
+    #####################
+
+    def _track(self, id: str) -> dict:
+        n = _number(id)
+        return {
+            **self._simple("track", id, f"Track {n}"),
+            "duration_ms": 120_000 + n % 240_000,
+            "explicit": n % 7 == 0,
+            "popularity": n % 100,
+            "track_number": n % 12 + 1,
+            "disc_number": 1,
+            "preview_url": f"https://p.scdn.co/mp3-preview/{id}",
+            "available_markets": MARKETS,
+            "external_ids": {"isrc": f"US{n:010d}"},
+            "artists": [self._simple("artist", make_id("artist", n % 997), f"Artist {n % 997}")],
+            "album": self._simplified_album(make_id("album", n % 4999)),
+        }
+
+    def _simplified_album(self, id: str) -> dict:
+        n = _number(id)
+        return {
+            **self._simple("album", id, f"Album {n}"),
+            "album_type": "album",
+            "total_tracks": 12,
+            "release_date": f"{1960 + n % 64}-01-01",
+            "release_date_precision": "day",
+            "available_markets": MARKETS,
+            "images": self._images(id),
+            "artists": [self._simple("artist", make_id("artist", n % 997), f"Artist {n % 997}")],
+        }
+
+    def _album(self, id: str) -> dict:
+        return {
+            **self._simplified_album(id),
+            "label": "Mock Records",
+            "popularity": _number(id) % 100,
+            "genres": [],
+            "copyrights": [{"text": "(C) Mock Records", "type": "C"}],
+            "tracks": self._page([self._track(make_id("track", _number(id) * 12 + n)) for n in range(12)], 12, 0, 12),
+        }
+
+    def _artist(self, id: str) -> dict:
+        n = _number(id)
+        return {
+            **self._simple("artist", id, f"Artist {n}"),
+            "genres": [GENRES[n % len(GENRES)]],
+            "popularity": n % 100,
+            "followers": {"href": None, "total": n * 31},
+            "images": self._images(id),
+        }
+
+    def _playlist(self, id: str) -> dict:
+        n = _number(id)
+        return {
+            **self._simple("playlist", id, f"Playlist {n}"),
+            "description": f"Synthetic playlist {n}",
+            "collaborative": False,
+            "public": True,
+            "snapshot_id": f"snapshot-{n}",
+            "owner": self._user("mock-user"),
+            "images": self._images(id),
+            "tracks": {"href": f"{self.base_url}playlists/{id}/tracks", "total": self.playlist_size},
+        }
+
+    def _simple(self, type: str, id: str, name: str) -> dict:
+        return {
+            "type": type,
+            "id": id,
+            "name": name,
+            "uri": f"spotify:{type}:{id}",
+            "href": f"{self.base_url}{type}s/{id}",
+            "external_urls": {"spotify": f"https://open.spotify.com/{type}/{id}"},
+        }
+
+    def _user(self, id: str) -> dict:
+        return {
+            "type": "user",
+            "id": id,
+            "display_name": "Mock User",
+            "uri": f"spotify:user:{id}",
+            "external_urls": {"spotify": f"https://open.spotify.com/user/{id}"},
+        }
+
+    def _images(self, id: str) -> list:
+        return [
+            {"url": f"https://i.scdn.co/image/{id}-{size}", "height": size, "width": size} for size in (640, 300, 64)
+        ]
+
+    def _added_at(self, n: int) -> str:
+        return (LIBRARY_EPOCH - timedelta(minutes=n)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    def _page(self, items: list, total: int, offset: int, limit: int, path: str = "", query: Optional[dict] = None):
+        next_url = None
+        if offset + limit < total:
+            next_url = f"{self.base_url}{path}?{urlencode({**(query or {}), 'offset': offset + limit, 'limit': limit})}"
+        return {
+            "href": f"{self.base_url}{path}",
+            "items": items,
+            "limit": limit,
+            "offset": offset,
+            "total": total,
+            "next": next_url,
+            "previous": None,
+        }
+
+    def _paged(self, query: dict, total: int, make_item: Callable[[int], Any], path: str, default_limit: int = 20):
+        limit = int(query.get("limit", default_limit))
+        offset = int(query.get("offset", 0))
+        items = [make_item(n) for n in range(offset, min(offset + limit, total))]
+        return self._page(items, total, offset, limit, path, query)
+
+    ######################
+    ###    HANDLERS    ###
+    ######################
+
+    def _ids(self, query: dict) -> list:
+        return query["ids"].split(",") if query.get("ids") else []
+
+    def _get_albums(self, query: dict) -> dict:
+        return {"albums": [self._album(id) for id in self._ids(query)]}
+
+    def _get_album(self, query: dict, id: str) -> dict:
+        return self._album(id)
+
+    def _get_album_tracks(self, query: dict, id: str) -> dict:
+        return self._album(id)["tracks"]
+
+    def _get_artists(self, query: dict) -> dict:
+        return {"artists": [self._artist(id) for id in self._ids(query)]}
+
+    def _get_artist(self, query: dict, id: str) -> dict:
+        return self._artist(id)
+
+    def _get_artist_albums(self, query: dict, id: str) -> dict:
+        base = _number(id) * 40
+        return self._paged(
+            query, 40, lambda n: self._simplified_album(make_id("album", base + n)), f"artists/{id}/albums"
+        )
+
+    def _get_artist_top_tracks(self, query: dict, id: str) -> dict:
+        return {"tracks": [self._track(make_id("track", _number(id) * 10 + n)) for n in range(10)]}
+
+    def _get_related_artists(self, query: dict, id: str) -> dict:
+        return {"artists": [self._artist(make_id("artist", _number(id) + n + 1)) for n in range(20)]}
+
+    def _get_tracks(self, query: dict) -> dict:
+        return {"tracks": [self._track(id) for id in self._ids(query)]}
+
+    def _get_track(self, query: dict, id: str) -> dict:
+        return self._track(id)
+
+    def _get_audio_features(self, query: dict) -> dict:
+        return {"audio_features": [self._audio_features(id) for id in self._ids(query)]}
+
+    def _audio_features(self, id: str) -> dict:
+        n = _number(id)
+        return {
+            "type": "audio_features",
+            "id": id,
+            "uri": f"spotify:track:{id}",
+            "danceability": n % 100 / 100,
+            "energy": n % 89 / 89,
+            "key": n % 12,
+            "loudness": -(n % 30),
+            "mode": n % 2,
+            "tempo": 60 + n % 120,
+            "time_signature": 4,
+            "duration_ms": 120_000 + n % 240_000,
+        }
+
+    def _get_audio_analysis(self, query: dict, id: str) -> dict:
+        n = _number(id)
+        duration = (120_000 + n % 240_000) / 1000
+        return {
+            "track": {"duration": duration, "tempo": 60 + n % 120, "key": n % 12, "mode": n % 2},
+            "sections": [{"start": start, "duration": 30.0} for start in range(0, int(duration), 30)],
+        }
+
+    def _get_new_releases(self, query: dict) -> dict:
+        return {
+            "albums": self._paged(
+                query, 100, lambda n: self._simplified_album(make_id("album", n)), "browse/new-releases"
+            )
+        }
+
+    def _get_featured_playlists(self, query: dict, id: Optional[str] = None) -> dict:
+        base = 0 if id is None else zlib.crc32(id.encode()) % 10_000
+        return {
+            "message": "Mock playlists",
+            "playlists": self._paged(query, 60, lambda n: self._playlist(make_id("playlist", base + n)), "browse"),
+        }
+
+    def _search(self, query: dict) -> dict:
+        base = zlib.crc32(query.get("q", "").encode()) % 100_000
+        makers = {
+            "album": lambda n: self._simplified_album(make_id("album", base + n)),
+            "artist": lambda n: self._artist(make_id("artist", base + n)),
+            "playlist": lambda n: self._playlist(make_id("playlist", base + n)),
+            "track": lambda n: self._track(make_id("track", base + n)),
+        }
+        types = [type for type in query.get("type", "track").split(",") if type in makers]
+        return {f"{type}s": self._paged(query, 1000, makers[type], "search", default_limit=10) for type in types}
+
+    def _get_saved(self, query: dict, type: str) -> dict:
+        with self._lock:
+            saved = list(self._library[type].items())
+        make_object = self._track if type == "track" else self._album
+        return self._paged(
+            query, len(saved), lambda n: {"added_at": saved[n][1], type: make_object(saved[n][0])}, f"me/{type}s"
+        )
+
+    def _uris(self, query: dict) -> list:
+        return [uri.split(":") for uri in query.get("uris", "").split(",") if uri.count(":") == 2]
+
+    def _library_contains(self, query: dict) -> list:
+        with self._lock:
+            return [id in self._library.get(type, {}) for _, type, id in self._uris(query)]
+
+    def _update_library(self, query: dict, add: bool) -> None:
+        now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        with self._lock:
+            for _, type, id in self._uris(query):
+                library = self._library.setdefault(type, {})
+                if add:
+                    # Recent saves are listed first.
+                    self._library[type] = {id: now, **{k: v for k, v in library.items() if k != id}}
+                else:
+                    library.pop(id, None)
+
+    def _get_user_playlists(self, query: dict, id: str) -> dict:
+        base = zlib.crc32(id.encode()) % 10_000
+        return self._paged(query, 30, lambda n: self._playlist(make_id("playlist", base + n)), f"users/{id}/playlists")
+
+    def _get_playlist(self, query: dict, id: str) -> dict:
+        playlist = self._playlist(id)
+        playlist["tracks"] = self._get_playlist_items({"limit": 100}, id)
+        return playlist
+
+    def _get_playlist_items(self, query: dict, id: str, *args) -> dict:
+        base = _number(id) * self.playlist_size
+
+        def item(n: int) -> dict:
+            return {"added_at": self._added_at(n), "is_local": False, "track": self._track(make_id("track", base + n))}
+
+        return self._paged(query, self.playlist_size, item, f"playlists/{id}/items", default_limit=100)
+
+    def _snapshot(self, query: dict, id: str, *args) -> dict:
+        return {"snapshot_id": f"snapshot-{_number(id)}"}
+
+
+class MockTransport(BaseAdapter):
+    """requests transport adapter that answers from a MockSpotifyServer in the calling thread, with no sockets.
+
+    Responses still wait for the server's simulated latency, so timings reflect the tool's own request pattern.
+    """
+
+    def __init__(self, server: MockSpotifyServer) -> None:
+        super().__init__()
+        self.server = server
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        status, body = self.server.dispatch(
+            request.method, urlsplit(request.url)._replace(scheme="", netloc="").geturl()
+        )
+        content = _encode(body)
+        response = requests.Response()
+        response.status_code = status
+        response.reason = HTTPStatus(status).phrase
+        response.headers.update(self.server._headers(status, content))
+        response._content = content
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+@define
+class MockOtlpCollector:
+    """Local stand-in for an OpenTelemetry collector that keeps the spans exported to it over OTLP/HTTP.
+
+    Point an exporter at it with `OTLPSpanExporter(endpoint=collector.traces_url)`. Each received span is kept in
+    `spans` as a dict with its name, hex trace, span and parent IDs, status code and attributes. Decoding needs the
+    `opentelemetry-proto` package.
+    """
+
+    host = field(type=str, default="127.0.0.1")
+    port = field(type=int, default=0)
+    spans = field(type=list, default=Factory(list), init=False)
+    _lock = field(type=Lock, default=Factory(Lock), init=False)
+    _server = field(type=Optional[ThreadingHTTPServer], default=None, init=False)
+
+    @property
+    def traces_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1/traces"
+
+    def start(self) -> MockOtlpCollector:
+        collector = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self) -> None:
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                if self.headers.get("Content-Encoding") == "gzip":
+                    body = gzip.decompress(body)
+                status = 200 if self.path == "/v1/traces" else 404
+                if status == 200:
+                    collector.receive(body)
+                self.send_response(status)
+                self.send_header("Content-Type", "application/x-protobuf")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> MockOtlpCollector:
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def receive(self, body: bytes) -> None:
+        """Decodes a protobuf ExportTraceServiceRequest and keeps its spans."""
+        trace_service = import_optional_dependency("opentelemetry.proto.collector.trace.v1.trace_service_pb2")
+        request = trace_service.ExportTraceServiceRequest.FromString(body)
+        spans = [
+            {
+                "name": span.name,
+                "trace_id": span.trace_id.hex(),
+                "span_id": span.span_id.hex(),
+                "parent_span_id": span.parent_span_id.hex() or None,
+                "status_code": span.status.code,
+                "attributes": {attribute.key: _any_value(attribute.value) for attribute in span.attributes},
+            }
+            for resource_spans in request.resource_spans
+            for scope_spans in resource_spans.scope_spans
+            for span in scope_spans.spans
+        ]
+        with self._lock:
+            self.spans.extend(spans)
+
+
+def _any_value(value: Any) -> Any:
+    kind = value.WhichOneof("value")
+    if kind == "array_value":
+        return [_any_value(item) for item in value.array_value.values]
+    return getattr(value, kind) if kind is not None else None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve a local mock of the Spotify Web API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0, help="Median response latency in milliseconds.")
+    parser.add_argument("--rate-limit-probability", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = MockSpotifyServer(
+        host=args.host,
+        port=args.port,
+        latency=lognormal_latency(args.latency_ms / 1000) if args.latency_ms else constant_latency(0),
+        rate_limit_probability=args.rate_limit_probability,
+        seed=args.seed,
+    ).start()
+    print(f"Mock Spotify Web API listening on {server.base_url}")
+    try:
+        server._thread.join()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
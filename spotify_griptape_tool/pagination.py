@@ -0,0 +1,87 @@
+from __future__ import annotations
+from collections import deque
+from concurrent.futures import Executor
+from typing import Any, Callable, Iterator, Optional
+from spotify_griptape_tool.concurrency import cancel_all, map_all
+
+
+def fetch_all_pages(
+    fetch_page: Callable[[int], dict],
+    page_size: int,
+    executor: Optional[Executor] = None,
+    fetch_next: Optional[Callable[[dict], Optional[dict]]] = None,
+) -> list:
+    """Returns the items of every page of a paging object, in order.
+
+    `fetch_page` is called with an offset and must return a paging object of at most `page_size` items. When the first
+    page reports a `total`, the remaining offsets are requested up front, concurrently on `executor` if one is given.
+    If a page fails, no other page is left running once the error is raised. Without a `total`, the `next` links are
+    followed one page at a time with `fetch_next`.
+    """
+    first = fetch_page(0)
+    items = list(first["items"])
+
+    total = first.get("total")
+    if total is None:
+        page = first
+        while fetch_next is not None and page.get("next"):
+            page = fetch_next(page)
+            if page is None:
+                break
+            items.extend(page["items"])
+        return items
+
+    offsets = range(page_size, total, page_size)
+    if executor is None or len(offsets) <= 1:
+        pages = map(fetch_page, offsets)
+    else:
+        pages = map_all(fetch_page, offsets, executor)
+    for page in pages:
+        items.extend(page["items"])
+    return items
+
+
+def iter_items(
+    fetch_page: Callable[[int], dict], page_size: int, executor: Optional[Executor] = None, prefetch: int = 1
+) -> Iterator[Any]:
+    """Lazily yields the items of every page of a paging object, in order.
+
+    While the items of one page are consumed, up to `prefetch` following pages are requested on `executor`, so only
+    `prefetch + 1` pages are held in memory at a time. When iteration stops early, pages requested but not yet started
+    are cancelled and those already running are waited for. Without a `total` on the first page, pages are requested
+    one at a time until a page has no `next` link.
+    """
+    page = fetch_page(0)
+    total = page.get("total")
+
+    if total is None:
+        offset = 0
+        while True:
+            yield from page["items"]
+            if not page.get("next") or not page["items"]:
+                return
+            offset += page_size
+            page = fetch_page(offset)
+
+    offsets = iter(range(page_size, total, page_size))
+    pending = deque()
+    try:
+        while True:
+            if executor is not None:
+                while len(pending) < prefetch:
+                    offset = next(offsets, None)
+                    if offset is None:
+                        break
+                    pending.append(executor.submit(fetch_page, offset))
+
+            yield from page["items"]
+
+            if pending:
+                page = pending.popleft().result()
+            else:
+                offset = next(offsets, None)
+                if offset is None:
+                    return
+                page = fetch_page(offset)
+    finally:
+        cancel_all(pending)
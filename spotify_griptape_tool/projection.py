@@ -0,0 +1,77 @@
+from __future__ import annotations
+import re
+from typing import Any, Iterable, Optional
+
+
+def parse_fields(fields: Iterable[str]) -> dict:
+    """Builds a tree from dotted field paths: `["id", "album.name"]` becomes `{"id": None, "album": {"name": None}}`.
+
+    A None leaf keeps the whole value of that field.
+    """
+    tree = {}
+    for path in fields:
+        node = tree
+        *parents, leaf = path.split(".")
+        for part in parents:
+            if node.get(part, {}) is None:
+                # The whole parent is already kept.
+                break
+            node = node.setdefault(part, {})
+        else:
+            node[leaf] = None
+    return tree
+
+
+def api_field_names(fields: Optional[str]) -> frozenset:
+    """Names of the fields a Web API `fields` filter asks for, leaving out those excluded with `!`.
+
+    `items(track(name,album(!images)))` gives items, track, name and album.
+    """
+    if not fields:
+        return frozenset()
+    return frozenset(re.findall(r"(?<![!\w])\w+", fields))
+
+
+def with_fields(fields: Optional[str], names: Iterable[str]) -> Optional[str]:
+    """Adds the top-level `names` a Web API `fields` filter leaves out, so responses keep them.
+
+    `with_fields("items(track(name))", ["total", "next"])` gives `items(track(name)),total,next`.
+    """
+    if not fields:
+        return fields
+    top_level = fields
+    while "(" in top_level:
+        top_level = re.sub(r"\([^()]*\)", "", top_level)
+    present = {part.strip().split(".")[0] for part in top_level.split(",")}
+    return ",".join([fields, *(name for name in names if name not in present)])
+
+
+def select_fields(value: Any, tree: dict) -> Any:
+    """Keeps only the fields in `tree`, applying it to every element of lists along the way."""
+    if isinstance(value, list):
+        return [select_fields(item, tree) for item in value]
+    if not isinstance(value, dict):
+        return value
+    return {
+        key: value[key] if subtree is None else select_fields(value[key], subtree)
+        for key, subtree in tree.items()
+        if key in value
+    }
+
+
+def drop_fields(value: Any, excluded: frozenset) -> Any:
+    """Removes every field named in `excluded`, at any depth."""
+    if isinstance(value, list):
+        return [drop_fields(item, excluded) for item in value]
+    if not isinstance(value, dict):
+        return value
+    return {key: drop_fields(item, excluded) for key, item in value.items() if key not in excluded}
+
+
+def project(value: Any, fields: Optional[Iterable[str]] = None, excluded: frozenset = frozenset()) -> Any:
+    """Keeps only `fields` when they are given, otherwise removes the `excluded` fields."""
+    if fields is not None:
+        return select_fields(value, parse_fields(fields))
+    if excluded:
+        return drop_fields(value, excluded)
+    return value
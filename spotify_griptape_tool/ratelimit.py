@@ -0,0 +1,111 @@
+from __future__ import annotations
+import time
+from threading import Lock
+import requests
+from attr import define, field, Factory
+from urllib3.util import Retry
+
+
+@define
+class RateLimiter:
+    """Token bucket that paces requests to `rate` per second, allowing bursts of up to `burst` requests.
+
+    Callers reserve a slot and sleep until it arrives, so waiting requests are released in arrival order. A 429
+    response passed to `pause` stops every caller sharing the limiter until its Retry-After has elapsed. Share one
+    instance between tools to pace a whole process.
+    """
+
+    rate = field(type=float, default=10.0)
+    burst = field(type=int, default=10)
+    _theoretical_arrival = field(type=float, default=0.0, init=False)
+    _paused_until = field(type=float, default=0.0, init=False)
+    _waiting = field(type=int, default=0, init=False)
+    _lock = field(type=Lock, default=Factory(Lock), init=False)
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of requests currently waiting for a slot."""
+        return self._waiting
+
+    def reserve(self) -> float:
+        """Claims the next slot and returns how many seconds the caller must wait before sending its request."""
+        interval = 1 / self.rate
+        tolerance = (self.burst - 1) * interval
+        with self._lock:
+            now = time.monotonic()
+            arrival = max(self._theoretical_arrival, now, self._paused_until)
+            slot = max(now, self._paused_until, arrival - tolerance)
+            self._theoretical_arrival = max(arrival, slot) + interval
+            return slot - now
+
+    def acquire(self) -> None:
+        delay = self.reserve()
+        if delay > 0:
+            self._track_waiting(1)
+            try:
+                while delay > 0:
+                    time.sleep(delay)
+                    delay = self._pause_remaining()
+            finally:
+                self._track_waiting(-1)
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def _pause_remaining(self) -> float:
+        # A 429 may have paused the limiter while this caller was already waiting for its slot.
+        return self._paused_until - time.monotonic()
+
+    def _track_waiting(self, delta: int) -> None:
+        with self._lock:
+            self._waiting += delta
+
+
+class RateLimitedSession(requests.Session):
+    """requests session that takes a slot from `rate_limiter` before every request.
+
+    429 responses are not slept on inside the calling thread the way urllib3's retry would; their Retry-After pauses
+    the shared limiter and the request is queued again, up to `max_retries` times. Server errors are still retried by
+    the mounted adapter with exponential backoff.
+    """
+
+    def __init__(
+        self,
+        rate_limiter: RateLimiter,
+        max_retries: int = 3,
+        backoff_factor: float = 0.3,
+        default_retry_after: float = 1,
+    ) -> None:
+        super().__init__()
+        self.rate_limiter = rate_limiter
+        self.max_retries = max_retries
+        self.default_retry_after = default_retry_after
+        retry = Retry(
+            total=max_retries,
+            connect=None,
+            read=False,
+            allowed_methods=frozenset(["GET", "POST", "PUT", "DELETE"]),
+            status=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(500, 502, 503, 504),
+        )
+        adapter = requests.adapters.HTTPAdapter(max_retries=retry)
+        self.mount("http://", adapter)
+        self.mount("https://", adapter)
+
+    def request(self, method: str, url: str, *args, **kwargs) -> requests.Response:
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.acquire()
+            response = super().request(method, url, *args, **kwargs)
+            if response.status_code != 429 or attempt == self.max_retries:
+                return response
+            self.rate_limiter.pause(retry_after_seconds(response.headers, self.default_retry_after))
+        return response
+
+
+def retry_after_seconds(headers, default: float) -> float:
+    try:
+        return float(headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return default
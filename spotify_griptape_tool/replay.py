@@ -0,0 +1,173 @@
+from __future__ import annotations
+import gzip
+import hashlib
+import json
+import os
+import time
+from collections import defaultdict
+from http import HTTPStatus
+from threading import Lock
+from typing import Optional, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from attr import define, field, Factory
+
+CASSETTE_VERSION = 1
+
+# Response headers worth keeping; the rest only describe the original connection.
+RECORDED_HEADERS = ("Content-Type", "Retry-After")
+
+
+def request_key(method: str, url: str, body: Union[str, bytes, None] = None) -> str:
+    """Identifies a request by method, path, sorted query and a digest of its body, ignoring scheme and host.
+
+    Ignoring the host lets traffic recorded against the Web API replay under any `api_base_url`.
+    """
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    if isinstance(body, str):
+        body = body.encode()
+    digest = hashlib.sha1(body).hexdigest()[:16] if body else ""
+    return f"{method} {parts.path}?{query} {digest}"
+
+
+@define
+class Interaction:
+    key = field(type=str)
+    status = field(type=int)
+    headers = field(type=dict)
+    content = field(type=bytes)
+    elapsed = field(type=float)
+
+    def to_dict(self) -> dict:
+        return {
+            "key": self.key,
+            "status": self.status,
+            "headers": self.headers,
+            "content": self.content.decode("utf-8"),
+            "elapsed": round(self.elapsed, 6),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Interaction:
+        return cls(data["key"], data["status"], data["headers"], data["content"].encode("utf-8"), data["elapsed"])
+
+
+@define
+class Cassette:
+    """Recorded request and response pairs, in the order they were made, with how long each response took.
+
+    Saved as gzip-compressed JSON lines. Request headers are never recorded, so access tokens stay out of the file.
+    """
+
+    interactions = field(type=list, default=Factory(list))
+    _index = field(type=dict, default=Factory(dict), init=False)
+    _lock = field(type=Lock, default=Factory(Lock), init=False)
+
+    def __attrs_post_init__(self) -> None:
+        for interaction in self.interactions:
+            self._index.setdefault(interaction.key, []).append(interaction)
+
+    def add(self, interaction: Interaction) -> None:
+        with self._lock:
+            self.interactions.append(interaction)
+            self._index.setdefault(interaction.key, []).append(interaction)
+
+    def responses(self, key: str) -> list[Interaction]:
+        """The interactions recorded for requests with `key`, in the order they were made."""
+        return self._index.get(key, [])
+
+    def save(self, path: str) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        partial_path = f"{path}.partial"
+        with gzip.open(partial_path, "wt", encoding="utf-8") as f:
+            f.write(json.dumps({"version": CASSETTE_VERSION}) + "\n")
+            for interaction in list(self.interactions):
+                f.write(json.dumps(interaction.to_dict(), separators=(",", ":")) + "\n")
+        os.replace(partial_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> Cassette:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            header = json.loads(f.readline())
+            if header.get("version") != CASSETTE_VERSION:
+                raise ValueError(f"Unsupported cassette version: {header.get('version')}")
+            return cls([Interaction.from_dict(json.loads(line)) for line in f if line.strip()])
+
+    def __len__(self) -> int:
+        return len(self.interactions)
+
+
+class RecordingTransport(BaseAdapter):
+    """requests transport adapter that passes requests to `inner` and records every response into `cassette`.
+
+    When set as SpotifyClient's `transport`, `inner` defaults to the adapter the client's session already had for the
+    API, so retries and any other transport set up by the session keep working while recording.
+    """
+
+    def __init__(self, cassette: Optional[Cassette] = None, inner: Optional[BaseAdapter] = None) -> None:
+        super().__init__()
+        self.cassette = cassette if cassette is not None else Cassette()
+        self.inner = inner
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        if self.inner is None:
+            self.inner = HTTPAdapter()
+        start = time.perf_counter()
+        response = self.inner.send(request, **kwargs)
+        content = response.content
+        elapsed = time.perf_counter() - start
+        headers = {name: response.headers[name] for name in RECORDED_HEADERS if name in response.headers}
+        self.cassette.add(
+            Interaction(
+                request_key(request.method, request.url, request.body), response.status_code, headers, content, elapsed
+            )
+        )
+        return response
+
+    def close(self) -> None:
+        if self.inner is not None:
+            self.inner.close()
+
+
+class ReplayTransport(BaseAdapter):
+    """requests transport adapter that answers from a `cassette` instead of the network.
+
+    Each response waits for its recorded time multiplied by `latency_scale`; 0 replays as fast as possible. A request
+    made several times gets the recorded responses in order and then keeps getting the last one. A request that was
+    never recorded raises KeyError. One cassette can back any number of transports, one per replayed session.
+    """
+
+    def __init__(self, cassette: Cassette, latency_scale: float = 1.0) -> None:
+        super().__init__()
+        self.cassette = cassette
+        self.latency_scale = latency_scale
+        self._positions = defaultdict(int)
+        self._lock = Lock()
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        key = request_key(request.method, request.url, request.body)
+        recorded = self.cassette.responses(key)
+        if not recorded:
+            raise KeyError(f"No recorded response for: {key}")
+        with self._lock:
+            position = self._positions[key]
+            self._positions[key] = min(position + 1, len(recorded) - 1)
+        interaction = recorded[position]
+
+        if self.latency_scale > 0:
+            time.sleep(interaction.elapsed * self.latency_scale)
+
+        response = requests.Response()
+        response.status_code = interaction.status
+        response.reason = HTTPStatus(interaction.status).phrase
+        response.headers.update(interaction.headers)
+        response._content = interaction.content
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        pass
@@ -0,0 +1,151 @@
+from __future__ import annotations
+import json
+import os
+import secrets
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional
+from attr import define, field, Factory
+
+
+@define
+class BaseResultStore(ABC):
+    """Keeps large activity results out of the prompt so they can be read back a page at a time by handle."""
+
+    @abstractmethod
+    def put(self, items: list) -> str:
+        """Stores `items` and returns the handle to read them back with."""
+        ...
+
+    @abstractmethod
+    def get(self, handle: str, offset: int, limit: int) -> tuple[list, int]:
+        """Returns up to `limit` items starting at `offset`, and the total number of items stored under `handle`.
+
+        Raises KeyError if the handle is unknown or has expired, and ValueError if `offset` is negative or `limit` is
+        not positive.
+        """
+        ...
+
+    @abstractmethod
+    def delete(self, handle: str) -> None:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+
+@define
+class _StoredResult:
+    total = field(type=int)
+    size = field(type=int)
+    expires_at = field(type=float)
+    lines = field(type=Optional[list], default=None)
+    path = field(type=Optional[str], default=None)
+    offsets = field(type=Optional[list], default=None)
+
+
+@define
+class MemoryResultStore(BaseResultStore):
+    """Result store that holds results in memory and spills the oldest ones to disk past `max_memory_size` bytes.
+
+    Items are encoded as JSON lines when stored. A spilled result is written to one NDJSON file in `spill_directory`
+    (a temporary directory by default) with the byte offset of every line kept in memory, so reading a page seeks
+    straight to it. Results expire after `ttl` seconds, and the least recently read are dropped past `max_results`.
+    """
+
+    max_memory_size = field(type=int, default=32 * 1024 * 1024)
+    max_results = field(type=int, default=256)
+    ttl = field(type=float, default=3600)
+    spill_directory = field(type=Optional[str], default=None)
+    _results = field(type=OrderedDict, default=Factory(OrderedDict), init=False)
+    _memory_size = field(type=int, default=0, init=False)
+    _lock = field(type=Lock, default=Factory(Lock), init=False)
+
+    @property
+    def memory_size(self) -> int:
+        """Bytes of encoded items currently held in memory."""
+        return self._memory_size
+
+    def put(self, items: list) -> str:
+        lines = [json.dumps(item, separators=(",", ":"), default=str).encode() for item in items]
+        handle = secrets.token_hex(8)
+        result = _StoredResult(
+            total=len(lines), size=sum(len(line) for line in lines), expires_at=time.monotonic() + self.ttl, lines=lines
+        )
+        with self._lock:
+            self._prune()
+            self._results[handle] = result
+            self._memory_size += result.size
+            while len(self._results) > self.max_results:
+                self._remove(next(iter(self._results)))
+            self._spill()
+        return handle
+
+    def get(self, handle: str, offset: int, limit: int) -> tuple[list, int]:
+        if offset < 0:
+            raise ValueError(f"offset must not be negative, got {offset}")
+        if limit <= 0:
+            raise ValueError(f"limit must be positive, got {limit}")
+        with self._lock:
+            self._prune()
+            result = self._results.get(handle)
+            if result is None:
+                raise KeyError(f"No stored result with handle: {handle}")
+            self._results.move_to_end(handle)
+            end = min(offset + limit, result.total)
+            if offset >= end:
+                return [], result.total
+            if result.lines is not None:
+                lines = result.lines[offset:end]
+            else:
+                with open(result.path, "rb") as f:
+                    f.seek(result.offsets[offset])
+                    lines = f.read(result.offsets[end] - result.offsets[offset]).splitlines()
+        return [json.loads(line) for line in lines], result.total
+
+    def delete(self, handle: str) -> None:
+        with self._lock:
+            if handle in self._results:
+                self._remove(handle)
+
+    def clear(self) -> None:
+        with self._lock:
+            for handle in list(self._results):
+                self._remove(handle)
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def _spill(self) -> None:
+        for handle, result in self._results.items():
+            if self._memory_size <= self.max_memory_size:
+                return
+            if result.lines is None:
+                continue
+            if self.spill_directory is None:
+                self.spill_directory = tempfile.mkdtemp(prefix="spotify-results-")
+            os.makedirs(self.spill_directory, exist_ok=True)
+            result.path = os.path.join(self.spill_directory, f"{handle}.ndjson")
+            result.offsets = [0]
+            with open(result.path, "wb") as f:
+                for line in result.lines:
+                    f.write(line + b"\n")
+                    result.offsets.append(result.offsets[-1] + len(line) + 1)
+            result.lines = None
+            self._memory_size -= result.size
+
+    def _prune(self) -> None:
+        now = time.monotonic()
+        for handle in [handle for handle, result in self._results.items() if result.expires_at <= now]:
+            self._remove(handle)
+
+    def _remove(self, handle: str) -> None:
+        result = self._results.pop(handle)
+        if result.lines is not None:
+            self._memory_size -= result.size
+        elif result.path is not None and os.path.exists(result.path):
+            os.remove(result.path)
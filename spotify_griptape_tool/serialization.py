@@ -0,0 +1,47 @@
+from __future__ import annotations
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+from attr import define, field, Factory
+from griptape.utils import import_optional_dependency
+
+
+def _load_orjson() -> Optional[Any]:
+    try:
+        return import_optional_dependency("orjson")
+    except ImportError:
+        return None
+
+
+@define
+class BaseResultSerializer(ABC):
+    """Turns Spotify API responses into the text placed in activity artifacts."""
+
+    @abstractmethod
+    def serialize(self, value: Any) -> str:
+        ...
+
+
+@define
+class JsonResultSerializer(BaseResultSerializer):
+    """Serializes results as compact JSON, using orjson when it is installed and the standard library otherwise.
+
+    Both produce equivalent JSON, with no whitespace between tokens and non-ASCII characters left unescaped. The text
+    can still differ, e.g. in how some floats are written or in orjson writing NaN as null.
+    """
+
+    use_orjson = field(type=bool, default=True)
+    _orjson = field(type=Optional[Any], default=Factory(lambda: _load_orjson()), init=False)
+
+    def serialize(self, value: Any) -> str:
+        if self.use_orjson and self._orjson is not None:
+            return self._orjson.dumps(value, default=str).decode()
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+@define
+class ReprResultSerializer(BaseResultSerializer):
+    """Serializes results with `str`, the Python repr format activities produced before JSON output."""
+
+    def serialize(self, value: Any) -> str:
+        return str(value)
@@ -0,0 +1,36 @@
+from __future__ import annotations
+from typing import Any, Callable, Hashable
+from attr import define, field, Factory
+from spotify_griptape_tool.singleflight import SingleFlight
+
+
+@define
+class SessionPool:
+    """Access tokens and HTTP connections shared by every tool given this pool as its `session_pool`.
+
+    Tools built per request then reuse the client credentials token, the user token an authorization code was
+    exchanged for and the pooled keep-alive connections of earlier tools, instead of setting them up again on their
+    first activity. Each is created by the first tool that needs it.
+    """
+
+    _values = field(type=dict, default=Factory(dict), init=False)
+    _single_flight = field(type=SingleFlight, default=Factory(SingleFlight), init=False)
+
+    def get(self, key: Hashable, create: Callable[[], Any]) -> Any:
+        """Returns the value shared under `key`, calling `create` for it only once even when tools race for it."""
+        try:
+            return self._values[key]
+        except KeyError:
+            return self._single_flight.do(key, lambda: self._create(key, create))
+
+    def clear(self) -> None:
+        self._values.clear()
+
+    def _create(self, key: Hashable, create: Callable[[], Any]) -> Any:
+        # A caller that missed above may only get here after the value was stored by another flight.
+        if key not in self._values:
+            self._values[key] = create()
+        return self._values[key]
+
+    def __len__(self) -> int:
+        return len(self._values)
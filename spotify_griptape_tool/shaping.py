@@ -0,0 +1,177 @@
+from __future__ import annotations
+from typing import Any, Callable, Optional
+from attr import define, field
+from griptape.tokenizers import BaseTokenizer
+
+# Fields kept, at any depth, when results are slimmed to fit the output budget.
+SLIM_FIELDS = frozenset(
+    {
+        "added_at",
+        "album",
+        "artists",
+        "display_name",
+        "duration_ms",
+        "episode",
+        "id",
+        "name",
+        "owner",
+        "release_date",
+        "show",
+        "total",
+        "total_tracks",
+        "track",
+        "tracks",
+        "type",
+        "uri",
+    }
+)
+
+# Fields kept when audio features are slimmed: every feature value, without the links to the track and its analysis.
+AUDIO_FEATURES_SLIM_FIELDS = frozenset(
+    {
+        "acousticness",
+        "danceability",
+        "duration_ms",
+        "energy",
+        "id",
+        "instrumentalness",
+        "key",
+        "liveness",
+        "loudness",
+        "mode",
+        "speechiness",
+        "tempo",
+        "time_signature",
+        "valence",
+    }
+)
+
+# Fields kept, at any depth, when an audio analysis is slimmed: the track-wide values and the sections, without the
+# thousands of bars, beats, tatums and segments.
+AUDIO_ANALYSIS_SLIM_FIELDS = frozenset(
+    {
+        "duration",
+        "end_of_fade_in",
+        "key",
+        "loudness",
+        "mode",
+        "sections",
+        "start",
+        "start_of_fade_out",
+        "tempo",
+        "time_signature",
+        "track",
+    }
+)
+
+# Keys under which saved items and playlist items wrap the object they are about. The wrappers have no `type` field.
+WRAPPED_ENTITY_KEYS = ("track", "episode", "album", "show")
+
+
+def slim(value: Any, fields: frozenset = SLIM_FIELDS) -> Any:
+    """Keeps only the `fields`, by default the identifying fields in `SLIM_FIELDS`, at any depth."""
+    if isinstance(value, list):
+        return [slim(item, fields) for item in value]
+    if not isinstance(value, dict):
+        return value
+    return {key: slim(item, fields) for key, item in value.items() if key in fields}
+
+
+def summarize(value: Any) -> str:
+    """Describes an item in one line, e.g. `track: Doxy by Miles Davis (7Ev5...)`."""
+    if not isinstance(value, dict):
+        return str(value)
+
+    entity = value
+    if "type" not in value:
+        entity = next((value[key] for key in WRAPPED_ENTITY_KEYS if isinstance(value.get(key), dict)), value)
+    line = f"{entity.get('type', 'item')}: {entity.get('name') or entity.get('display_name') or entity.get('id')}"
+    creators = [artist.get("name") for artist in entity.get("artists", []) if isinstance(artist, dict)]
+    if not creators and isinstance(entity.get("owner"), dict):
+        creators = [entity["owner"].get("display_name")]
+    if any(creators):
+        line += " by " + ", ".join(creator for creator in creators if creator)
+    if entity.get("id"):
+        line += f" ({entity['id']})"
+    return line
+
+
+@define
+class ResultShaper:
+    """Degrades activity output step by step until it fits in `max_size`.
+
+    Results are tried as full objects, then slimmed to their identifying fields, then as one-line summaries. If even
+    the summaries are too large, as many as fit are kept and a final note gives the count of items left out. Shortened
+    items get a note as well. Callers that can serve the full items pass a `note` saying how. Size is measured in tokens
+    when a `tokenizer` is set and in UTF-8 bytes otherwise.
+    """
+
+    max_size = field(type=int, default=16_000)
+    tokenizer = field(type=Optional[BaseTokenizer], default=None, kw_only=True)
+
+    def shape(
+        self,
+        items: list,
+        serialize: Callable[[Any], str],
+        labels: Optional[list[str]] = None,
+        truncate: bool = True,
+        note: Optional[Callable[[int, bool], Optional[str]]] = None,
+        slim_fields: Optional[frozenset] = SLIM_FIELDS,
+        summaries: bool = True,
+    ) -> list[str]:
+        """Returns the text for each item's artifact. `labels` are prefixed to the items they line up with.
+
+        Items are slimmed to `slim_fields`, or never if it is None, and summarized only if `summaries` is set: both
+        keep just the fields that identify an entity, which leaves nothing of other payloads. `note` is called with
+        the number of items shown and whether they were shortened, and may return a trailing note, which counts
+        towards the budget. It replaces the default notes added when items are shortened or left out.
+        """
+        prefixes = [f"{label}: " for label in labels] if labels is not None else [""] * len(items)
+        note = note or self.default_note(len(items))
+        renders = [serialize]
+        if slim_fields is not None:
+            renders.append(lambda item: serialize(slim(item, slim_fields)))
+        if summaries:
+            renders.append(summarize)
+
+        for step, render in enumerate(renders):
+            texts = [prefix + render(item) for prefix, item in zip(prefixes, items)]
+            last_note = note(len(items), step > 0)
+            trailer = [] if last_note is None else [last_note]
+            if self.measure(texts + trailer) <= self.max_size:
+                return texts + trailer
+
+        if not truncate:
+            return texts + trailer
+        return self.truncate(texts, lambda shown: note(shown, len(renders) > 1))
+
+    def truncate(self, texts: list[str], note: Callable[[int], Optional[str]]) -> list[str]:
+        """Keeps the longest prefix of `texts` that fits next to the note on the items left out, and at least one."""
+        kept = []
+        size = 0
+        for text in texts:
+            trailer = note(len(kept) + 1)
+            if kept and size + self.measure([text] if trailer is None else [text, trailer]) > self.max_size:
+                break
+            kept.append(text)
+            size += self.measure([text])
+        trailer = note(len(kept))
+        return kept if trailer is None else kept + [trailer]
+
+    def default_note(self, total: int) -> Callable[[int, bool], Optional[str]]:
+        def note(shown: int, shortened: bool) -> Optional[str]:
+            if shown < total:
+                return self.omitted_note(shown, total)
+            if shortened:
+                return "Items were shortened to fit the output size limit."
+            return None
+
+        return note
+
+    def omitted_note(self, shown: int, total: int) -> str:
+        return f"Showing {shown} of {total} items to fit the output size limit. {total - shown} more were left out."
+
+    def measure(self, texts: list[str]) -> int:
+        if self.tokenizer is not None:
+            return sum(self.tokenizer.count_tokens(text) for text in texts)
+        return sum(len(text.encode("utf-8")) for text in texts)
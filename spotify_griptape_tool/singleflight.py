@@ -0,0 +1,53 @@
+from __future__ import annotations
+from concurrent.futures import Future
+from threading import Lock
+from typing import Any, Callable, Hashable
+from attr import define, field, Factory
+
+
+def normalize_params(value: Any) -> Hashable:
+    """Turns call arguments into a hashable key that is equal for equal arguments, regardless of dict order."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, normalize_params(val)) for key, val in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(normalize_params(val) for val in value)
+    if isinstance(value, set):
+        return tuple(sorted(normalize_params(val) for val in value))
+    return value
+
+
+@define
+class SingleFlight:
+    """Collapses concurrent calls that share a key into one execution.
+
+    The first caller for a key runs the function; callers that arrive while it is in flight wait for and receive the
+    same result, or the same exception. Results are not retained once the call completes.
+    """
+
+    _calls = field(type=dict, default=Factory(dict), init=False)
+    _lock = field(type=Lock, default=Factory(Lock), init=False)
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self._finish(key)
+            future.set_exception(e)
+            raise
+        self._finish(key)
+        future.set_result(result)
+        return result
+
+    def _finish(self, key: Hashable) -> None:
+        with self._lock:
+            self._calls.pop(key, None)
@@ -0,0 +1,90 @@
+from __future__ import annotations
+import json
+import os
+from abc import ABC, abstractmethod
+from threading import Lock
+from typing import Iterable, Iterator, Optional
+from attr import define, field, Factory
+
+
+@define
+class BaseWatermarkStore(ABC):
+    """Remembers how far each user's saved library has been synced, keyed by `(user_id, library)`.
+
+    A watermark is a dict with the newest `added_at` timestamp seen and the `ids` saved at exactly that time.
+    """
+
+    @abstractmethod
+    def get(self, user_id: str, library: str) -> Optional[dict]:
+        ...
+
+    @abstractmethod
+    def set(self, user_id: str, library: str, watermark: dict) -> None:
+        ...
+
+
+@define
+class MemoryWatermarkStore(BaseWatermarkStore):
+    _watermarks = field(type=dict, default=Factory(dict), init=False)
+
+    def get(self, user_id: str, library: str) -> Optional[dict]:
+        return self._watermarks.get((user_id, library))
+
+    def set(self, user_id: str, library: str, watermark: dict) -> None:
+        self._watermarks[(user_id, library)] = watermark
+
+
+@define
+class FileWatermarkStore(BaseWatermarkStore):
+    """Watermarks kept in a JSON file at `path`, so incremental syncs carry over between runs."""
+
+    path = field(type=str)
+    _lock = field(type=Lock, default=Factory(Lock), init=False)
+
+    def get(self, user_id: str, library: str) -> Optional[dict]:
+        with self._lock:
+            return self._load().get(user_id, {}).get(library)
+
+    def set(self, user_id: str, library: str, watermark: dict) -> None:
+        with self._lock:
+            watermarks = self._load()
+            watermarks.setdefault(user_id, {})[library] = watermark
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            partial_path = f"{self.path}.partial"
+            with open(partial_path, "w", encoding="utf-8") as f:
+                json.dump(watermarks, f)
+            os.replace(partial_path, self.path)
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+
+def take_new_items(items: Iterable[dict], entity_key: str, watermark: Optional[dict]) -> Iterator[dict]:
+    """Yields saved items from a newest-first listing until reaching those already covered by `watermark`.
+
+    Stops consuming `items` at the first item saved before the watermark, so no further pages are fetched. Items
+    saved at the watermark's own timestamp are skipped only if their IDs were already seen.
+    """
+    for item in items:
+        if watermark is not None:
+            if item["added_at"] < watermark["added_at"]:
+                return
+            if item["added_at"] == watermark["added_at"] and item[entity_key]["id"] in watermark["ids"]:
+                continue
+        yield item
+
+
+def advance_watermark(watermark: Optional[dict], new_items: list, entity_key: str) -> Optional[dict]:
+    """Moves `watermark` up to the newest of `new_items`, which are ordered newest first."""
+    if not new_items:
+        return watermark
+
+    newest = new_items[0]["added_at"]
+    ids = [item[entity_key]["id"] for item in new_items if item["added_at"] == newest]
+    if watermark is not None and watermark["added_at"] == newest:
+        ids = watermark["ids"] + ids
+    return {"added_at": newest, "ids": ids}
@@ -4,13 +4,85 @@ from textwrap import dedent
 from griptape.artifacts import TextArtifact, ErrorArtifact, ListArtifact
 from griptape.tools import BaseTool
 from griptape.utils.decorators import activity
-from schema import Schema, Literal, Or, Optional
+from schema import Schema, Literal, Or, Optional as SchemaOptional
 from attr import define, field, Factory
 from spotipy import Spotify, SpotifyClientCredentials, SpotifyOAuth, SpotifyException, MemoryCacheHandler
 from urllib.parse import quote as url_encode
 from json import loads as to_dict
-
-
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Iterator, Optional
+from concurrent.futures import ThreadPoolExecutor
+from requests import Response
+from requests.adapters import BaseAdapter
+from threading import Lock
+from uuid import uuid4
+from spotify_griptape_tool.batching import MicroBatcher, chunked, fetch_in_chunks, fill_missing
+from spotify_griptape_tool.budget import REJECT, BudgetTransport, CallBudget
+from spotify_griptape_tool.cache import BaseResponseCache, MemoryResponseCache
+from spotify_griptape_tool.concurrency import AdaptiveConcurrencyLimiter, LimiterTransport, retried_statuses
+from spotify_griptape_tool.membership import MembershipCache
+from spotify_griptape_tool.instrumentation import instrument_activities
+from spotify_griptape_tool.metrics import MetricsRegistry, body_size
+from spotify_griptape_tool.pagination import fetch_all_pages, iter_items
+from spotify_griptape_tool.projection import api_field_names, project, with_fields
+from spotify_griptape_tool.ratelimit import RateLimitedSession, RateLimiter
+from spotify_griptape_tool.replay import RecordingTransport
+from spotify_griptape_tool.results import BaseResultStore, MemoryResultStore
+from spotify_griptape_tool.serialization import BaseResultSerializer, JsonResultSerializer
+from spotify_griptape_tool.session import SessionPool
+from spotify_griptape_tool.shaping import (
+    AUDIO_ANALYSIS_SLIM_FIELDS,
+    AUDIO_FEATURES_SLIM_FIELDS,
+    SLIM_FIELDS,
+    ResultShaper,
+)
+from spotify_griptape_tool.singleflight import SingleFlight, normalize_params
+from spotify_griptape_tool.sync import BaseWatermarkStore, MemoryWatermarkStore, advance_watermark, take_new_items
+from spotify_griptape_tool.tracing import (
+    TracingTransport,
+    add_cache_event,
+    numbered_chunks,
+    numbered_pages,
+    with_current_context,
+)
+
+if TYPE_CHECKING:
+    from opentelemetry.trace import Tracer
+
+# Seconds a cached response stays fresh, per endpoint. Catalog metadata rarely changes, top tracks drift daily.
+DEFAULT_CACHE_TTLS = {
+    "album": 3600,
+    "album_tracks": 3600,
+    "artist": 3600,
+    "artist_top_tracks": 600,
+    "audio_features": 86400,
+    "track": 3600,
+}
+
+# Maximum number of IDs the Web API accepts in a single bulk request, per endpoint.
+MAX_IDS_PER_REQUEST = {
+    "album": 20,
+    "artist": 50,
+    "audio_features": 100,
+    "saved_albums": 20,
+    "saved_tracks": 50,
+    "track": 50,
+}
+
+# Fields left out of activity output unless a projection asks for them. They are large and rarely useful to an agent:
+# available_markets alone lists ~180 country codes per album and track.
+DEFAULT_EXCLUDED_FIELDS = frozenset({"available_markets", "images", "external_urls"})
+
+# Paged endpoint listing each saved library newest first, and the key its items wrap the saved object under.
+SAVED_LIBRARIES = {"albums": ("current_user_saved_albums", "album"), "tracks": ("current_user_saved_tracks", "track")}
+
+# Largest page size accepted by the paged playlist items endpoint.
+PLAYLIST_ITEMS_PAGE_SIZE = 100
+
+# Largest page size accepted by the other paged endpoints.
+PAGE_SIZE = 50
+
+
+@instrument_activities
 @define
 class SpotifyClient(BaseTool):
     client_id = field(type=str)
@@ -19,36 +91,469 @@ class SpotifyClient(BaseTool):
     authorization_state = field(type=str, default=None)
     authorization_redirect_uri = field(type=str, default=None)
     authorization_scopes = field(type=str, default=None)
-    oauth_manager = field(type=SpotifyOAuth, default=None)
+    # Passed as `oauth_manager` and `client`, or created on first use by `_get_oauth_manager` and `_get_client`.
+    _oauth_manager = field(type=Optional[SpotifyOAuth], default=None)
     user_token = field(type=str, default=None)
-    client = field(
-        type=Spotify,
-        default=Factory(
-            lambda self: Spotify(
-                auth=self.user_token, 
-                client_credentials_manager=SpotifyClientCredentials(
-                    client_id=self.client_id,
-                    client_secret=self.client_secret,
-                    cache_handler=MemoryCacheHandler()
-                )
-            ), 
-            takes_self=True
-        )
+    rate_limiter = field(type=Optional[RateLimiter], default=None)
+    api_base_url = field(type=Optional[str], default=None)
+    transport = field(type=Optional[BaseAdapter], default=None)
+    _client = field(type=Optional[Spotify], default=None)
+    session_pool = field(type=Optional[SessionPool], default=None)
+    _connected = field(type=bool, default=False, init=False)
+    _connect_lock = field(type=Lock, default=Factory(Lock), init=False)
+    cache_max_size = field(type=int, default=1024)
+    cache_ttls = field(type=dict, default=Factory(lambda: dict(DEFAULT_CACHE_TTLS)))
+    response_cache = field(
+        type=Optional[BaseResponseCache],
+        default=Factory(lambda self: MemoryResponseCache(max_size=self.cache_max_size), takes_self=True),
+    )
+    max_concurrency = field(type=int, default=8)
+    executor = field(
+        type=ThreadPoolExecutor,
+        default=Factory(lambda self: ThreadPoolExecutor(max_workers=self.max_concurrency), takes_self=True),
+    )
+    concurrency_limiter = field(
+        type=Optional[AdaptiveConcurrencyLimiter],
+        default=Factory(lambda self: AdaptiveConcurrencyLimiter(max_limit=self.max_concurrency), takes_self=True),
     )
+    batch_window = field(type=Optional[float], default=None)
+    _batchers = field(type=dict, default=Factory(dict), init=False)
+    _batchers_lock = field(type=Lock, default=Factory(Lock), init=False)
+    single_flight = field(type=Optional[SingleFlight], default=Factory(SingleFlight))
+    prefetch_pages = field(type=int, default=1)
+    serializer = field(type=BaseResultSerializer, default=Factory(JsonResultSerializer))
+    excluded_fields = field(type=frozenset, default=DEFAULT_EXCLUDED_FIELDS)
+    projections = field(type=dict, default=Factory(dict))
+    result_shaper = field(type=Optional[ResultShaper], default=Factory(ResultShaper))
+    result_store = field(type=Optional[BaseResultStore], default=Factory(MemoryResultStore))
+    result_page_size = field(type=int, default=50)
+    watermark_store = field(type=BaseWatermarkStore, default=Factory(MemoryWatermarkStore))
+    # Files written by activities go here: the paths they are given come from the model, so they may not leave it.
+    export_directory = field(type=str, default="exports")
+    membership_cache = field(type=Optional[MembershipCache], default=Factory(MembershipCache))
+    metrics = field(type=Optional[MetricsRegistry], default=None)
+    tracer = field(type=Optional["Tracer"], default=None)
+    call_budget = field(type=Optional[CallBudget], default=None)
+    run_id = field(type=str, default=Factory(lambda: uuid4().hex))
+    # Who the tool acts for, as far as the call budget's per-user limit is concerned.
+    budget_user_id = field(type=Optional[str], default=None)
+    _current_user_id = field(type=Optional[str], default=None, init=False)
 
     def __attrs_post_init__(self):
         super().__attrs_post_init__()
         if self.client_id is None or self.client_secret is None:
             raise ValueError("client_id and client_secret must be set")
-        self.oauth_manager=SpotifyOAuth(
-            client_id=self.client_id,
-            client_secret=self.client_secret,
-            redirect_uri=self.authorization_redirect_uri,
-            state=self.authorization_state,
-            scope=self.authorization_scopes,
+
+    def _get_oauth_manager(self) -> SpotifyOAuth:
+        if self._oauth_manager is None:
+            self._oauth_manager = SpotifyOAuth(
+                client_id=self.client_id,
+                client_secret=self.client_secret,
+                redirect_uri=self.authorization_redirect_uri,
+                state=self.authorization_state,
+                scope=self.authorization_scopes,
+                # Each manager holds the token of one authorization code, rather than whichever was saved last.
+                cache_handler=MemoryCacheHandler(),
+            )
+        return self._oauth_manager
+
+    def _get_client(self) -> Spotify:
+        """The Web API client, set up on first use so that building a tool never touches the network.
+
+        This is a method rather than a property because griptape reads every property of a tool when it lists the
+        tool's activities, which would connect it before any activity is called.
+        """
+        if not self._connected:
+            self._connect()
+        return self._client
+
+    def _connect(self) -> None:
+        with self._connect_lock:
+            if self._connected:
+                return
+            client = self._client if self._client is not None else self._build_client()
+            if self.api_base_url is not None:
+                # spotipy resolves every relative endpoint against its prefix, e.g. to point at MockSpotifyServer.
+                client.prefix = self.api_base_url
+            session = client._session
+            if self.transport is not None:
+                # Only API requests go through it: spotipy fetches access tokens with a session of its own.
+                if isinstance(self.transport, RecordingTransport) and self.transport.inner is None:
+                    self.transport.inner = session.get_adapter(client.prefix)
+                session.mount(client.prefix, self.transport)
+            if self.call_budget is not None:
+                session.mount(client.prefix, BudgetTransport(self._charge, session.get_adapter(client.prefix)))
+            if self.concurrency_limiter is not None:
+                # Every attempt's status reaches the limiter, including the 429s and 5xx urllib3 retries on its own.
+                limiter_transport = LimiterTransport(self.concurrency_limiter, session.get_adapter(client.prefix))
+                session.mount(client.prefix, limiter_transport)
+            if self.metrics is not None:
+                session.hooks["response"].append(self._observe_response)
+                if self.concurrency_limiter is not None:
+                    self.metrics.watch_limiter(self.concurrency_limiter)
+            if self.tracer is not None:
+                # Wraps whatever transport is mounted by now, so replayed and recorded requests are traced too.
+                session.mount(client.prefix, TracingTransport(self.tracer, session.get_adapter(client.prefix)))
+            self._client = client
+            self._connected = True
+
+    def _build_client(self) -> Spotify:
+        client = Spotify(
+            auth=self.user_token,
+            requests_session=RateLimitedSession(self.rate_limiter) if self.rate_limiter is not None else True,
+            client_credentials_manager=self._shared(
+                ("client_credentials", self.client_id, self.client_secret),
+                lambda: SpotifyClientCredentials(
+                    client_id=self.client_id, client_secret=self.client_secret, cache_handler=MemoryCacheHandler()
+                ),
+            ),
         )
         if self.authorization_code is not None:
-            self.client.set_auth(self.oauth_manager.get_access_token(self.authorization_code, as_dict=False))
+            # Codes can only be exchanged once, so tools sharing a pool share the manager holding the resulting token,
+            # which refreshes it once it expires.
+            client.auth_manager = self._shared(
+                ("user_auth", self.client_id, self.authorization_code), self._exchange_authorization_code
+            )
+        if self.session_pool is not None:
+            session = client._session
+            adapter = self.session_pool.get(("adapter", type(session)), lambda: session.get_adapter("https://"))
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        return client
+
+    def _exchange_authorization_code(self) -> SpotifyOAuth:
+        oauth_manager = self._get_oauth_manager()
+        oauth_manager.get_access_token(self.authorization_code, as_dict=False)
+        return oauth_manager
+
+    def _shared(self, key: tuple, create: Callable[[], Any]) -> Any:
+        return create() if self.session_pool is None else self.session_pool.get(key, create)
+
+    def cost_summary(self) -> dict:
+        """The Web API calls made in the current run, by endpoint, with the requests the call budget rejected."""
+        if self.call_budget is None:
+            raise ValueError("No call budget is set")
+        return self.call_budget.summary(self.run_id)
+
+    def end_run(self) -> dict:
+        """Returns the cost summary of the current run and starts a new one under a new `run_id`."""
+        if self.call_budget is None:
+            raise ValueError("No call budget is set")
+        summary = self.call_budget.end_run(self.run_id)
+        self.run_id = uuid4().hex
+        return summary
+
+    def _charge(self, method: str, url: str) -> None:
+        self.call_budget.charge(self.run_id, self.budget_user_id, method, url)
+
+    def _check_budget(self) -> None:
+        """Raises BudgetExceededError when the call budget is spent and set to reject activities outright."""
+        if self.call_budget is not None and self.call_budget.mode == REJECT:
+            self.call_budget.check(self.run_id, self.budget_user_id)
+
+    def _observe_response(self, response: Response, *args, **kwargs) -> None:
+        request = response.request
+        for status in retried_statuses(response):
+            self.metrics.observe_retried_request(request.method, request.url, status)
+        self.metrics.observe_request(
+            request.method,
+            request.url,
+            response.status_code,
+            response.elapsed.total_seconds(),
+            body_size(request.body),
+            len(response.content),
+        )
+
+    def _get_current_user_id(self) -> str:
+        if self._current_user_id is None:
+            self._current_user_id = self._request("current_user")["id"]
+        return self._current_user_id
+
+    def _request(self, method: str, *args, **kwargs) -> Any:
+        """Performs a read-only Web API call, sharing one upstream request between identical concurrent calls."""
+        fetch = getattr(self._get_client(), method)
+        if self.single_flight is None:
+            return fetch(*args, **kwargs)
+
+        # Calls made with different credentials are kept apart, as user-scoped endpoints answer each user differently.
+        key = (self._auth_identity(), method, normalize_params(args), normalize_params(kwargs))
+        return self.single_flight.do(key, lambda: fetch(*args, **kwargs))
+
+    def _auth_identity(self) -> Hashable:
+        client = self._get_client()
+        if client._auth is not None:
+            return client._auth
+        # Managers are shared by tools acting with the same credentials, and hold a token for no one else.
+        return id(client.auth_manager)
+
+    def _cached(self, endpoint: str, id: str, market: Optional[str], fetch: Callable[[], Any]) -> Any:
+        ttl = self.cache_ttls.get(endpoint, 0)
+        if self.response_cache is None or ttl <= 0:
+            return fetch()
+
+        key = (endpoint, id, market)
+        result = self.response_cache.get(key)
+        self._observe_cache("response", [result])
+        if result is None:
+            result = fetch()
+            self.response_cache.set(key, result, ttl)
+        return result
+
+    def _cached_many(self, endpoint: str, ids: list, market: Optional[str], fetch: Callable[[list], list]) -> list:
+        ttl = self.cache_ttls.get(endpoint, 0)
+        if self.response_cache is None or ttl <= 0:
+            return self._fetch_many(endpoint, ids, fetch)
+
+        results = [self.response_cache.get((endpoint, id, market)) for id in ids]
+        self._observe_cache("response", results)
+        results, fetched = fill_missing(ids, results, lambda missing: self._fetch_many(endpoint, missing, fetch))
+        for id, result in fetched.items():
+            if result is not None:
+                self.response_cache.set((endpoint, id, market), result, ttl)
+        return results
+
+    def _contains(self, library: str, ids: list, fetch: Callable[[list], list]) -> list:
+        """Whether each ID is saved in the current user's library, asking the API only about IDs not already known."""
+        if self.membership_cache is None:
+            return self._fetch_many(f"saved_{library}", ids, fetch)
+
+        user_id = self._membership_user()
+        results = self.membership_cache.get_many(user_id, library, ids)
+        self._observe_cache("membership", results)
+        results, fetched = fill_missing(
+            ids, results, lambda missing: self._fetch_many(f"saved_{library}", missing, fetch)
+        )
+        self.membership_cache.set_many(user_id, library, fetched)
+        return results
+
+    def _observe_cache(self, cache: str, results: list) -> None:
+        if self.metrics is None and self.tracer is None:
+            return
+        misses = results.count(None)
+        if self.metrics is not None:
+            self.metrics.observe_cache(cache, len(results) - misses, misses)
+        if self.tracer is not None:
+            add_cache_event(cache, len(results) - misses, misses)
+
+    def _remember_saved(self, library: str, ids: list, saved: bool) -> None:
+        if self.membership_cache is not None:
+            self.membership_cache.set_many(self._membership_user(), library, dict.fromkeys(ids, saved))
+
+    def _membership_user(self) -> Hashable:
+        # Looking the user up would cost every new tool a GET /me before its first check, so unless the tool already
+        # knows who it acts for, the cache is keyed by the access token instead.
+        if self._current_user_id is not None:
+            return self._current_user_id
+        if self.budget_user_id is not None:
+            return self.budget_user_id
+        client = self._get_client()
+        return ("token", client._auth or client.auth_manager.get_access_token(as_dict=False))
+
+    def _fetch_many(self, endpoint: str, ids: list, fetch: Callable[[list], list]) -> list:
+        chunk_size = MAX_IDS_PER_REQUEST[endpoint]
+        if self.tracer is not None:
+            fetch = numbered_chunks(fetch, ids, chunk_size)
+        return fetch_in_chunks(self._limited(fetch), ids, chunk_size, executor=self.executor)
+
+    def _write_many(self, endpoint: str, ids: list, write: Callable[[list], Any]) -> None:
+        chunk_size = MAX_IDS_PER_REQUEST[endpoint]
+        if self.tracer is not None:
+            write = numbered_chunks(write, ids, chunk_size)
+        for chunk in chunked(ids, chunk_size):
+            write(chunk)
+
+    def _paged(self, fetch_page: Callable[[int], Any], page_size: int) -> Callable[[int], Any]:
+        """Makes the request spans of a page fetch carry the page number, when tracing."""
+        if self.tracer is None:
+            return fetch_page
+        return numbered_pages(fetch_page, page_size)
+
+    def _limited(self, fetch: Callable) -> Callable:
+        """Makes one request of a fan-out wait for a slot from the adaptive concurrency limiter."""
+        if self.tracer is not None:
+            # Fan-outs run on the executor's threads, where the activity's span is not current.
+            fetch = with_current_context(fetch)
+        if self.concurrency_limiter is None:
+            return fetch
+        # The limit is adjusted by LimiterTransport, for each attempt rather than for the outcome of the request.
+        return lambda *args: self.concurrency_limiter.hold(fetch, *args)
+
+    def _get_entity(
+        self,
+        endpoint: str,
+        id: str,
+        market: Optional[str],
+        fetch: Callable[[], Any],
+        fetch_many: Callable[[list], list],
+    ) -> Any:
+        if self.batch_window is None:
+            return self._cached(endpoint, id, market, fetch)
+        return self._cached(endpoint, id, market, lambda: self._batched(endpoint, id, market, fetch_many))
+
+    def _batched(self, endpoint: str, id: str, market: Optional[str], fetch_many: Callable[[list], list]) -> Any:
+        with self._batchers_lock:
+            batcher = self._batchers.get((endpoint, market))
+            if batcher is None:
+                batcher = MicroBatcher(
+                    fetch=fetch_many,
+                    max_batch_size=MAX_IDS_PER_REQUEST[endpoint],
+                    window=self.batch_window,
+                    missing_error=lambda id: SpotifyException(404, -1, f"No {endpoint} found with id: {id}"),
+                )
+                self._batchers[(endpoint, market)] = batcher
+        return batcher.submit(id).result()
+
+    def _fields(self, activity: str, vals: dict) -> Optional[list]:
+        """Fields requested in the activity call, falling back to the projection configured for the activity."""
+        return vals.get("fields", self.projections.get(activity))
+
+    def _to_artifact(
+        self,
+        result: Any,
+        fields: Optional[list] = None,
+        api_fields: Optional[str] = None,
+        slim_fields: Optional[frozenset] = SLIM_FIELDS,
+        summaries: bool = True,
+    ) -> TextArtifact:
+        value = project(result, fields, self._excluded_fields(api_fields))
+        note = self._stored_value_note(value) if self.result_store is not None else None
+        texts = self._render([value], truncate=False, note=note, slim_fields=slim_fields, summaries=summaries)
+        return TextArtifact("\n".join(texts))
+
+    def _to_list_artifact(
+        self,
+        items: list,
+        fields: Optional[list] = None,
+        api_fields: Optional[str] = None,
+        slim_fields: Optional[frozenset] = SLIM_FIELDS,
+        summaries: bool = True,
+    ) -> ListArtifact:
+        excluded = self._excluded_fields(api_fields)
+        values = [project(item, fields, excluded) for item in items]
+        if self.result_store is None:
+            texts = self._render(values, slim_fields=slim_fields, summaries=summaries)
+            return ListArtifact([TextArtifact(text) for text in texts])
+        if len(values) <= self.result_page_size:
+            texts = self._render(values, note=self._stored_note(values), slim_fields=slim_fields, summaries=summaries)
+            return ListArtifact([TextArtifact(text) for text in texts])
+
+        handle = self.result_store.put(values)
+        page = values[: self.result_page_size]
+        return self._to_page_artifact(handle, page, 0, len(values), slim_fields=slim_fields, summaries=summaries)
+
+    def _excluded_fields(self, api_fields: Optional[str]) -> frozenset:
+        """The fields left out of output, except those the call asked the API for with its `fields` filter."""
+        return self.excluded_fields - api_field_names(api_fields) if api_fields else self.excluded_fields
+
+    def _to_page_artifact(
+        self,
+        handle: str,
+        page: list,
+        offset: int,
+        total: int,
+        slim_fields: Optional[frozenset] = None,
+        summaries: bool = False,
+    ) -> ListArtifact:
+        """Renders one page of a stored result, ending with a note on how to read the next one.
+
+        Items are only shortened to fit the output budget if `slim_fields` or `summaries` is set, as stored items are
+        read back to get them in full.
+        """
+
+        def note(shown: int, shortened: bool) -> Optional[str]:
+            if offset + shown >= total and not shortened:
+                return None
+            return self._page_note(handle, offset, shown, total, shortened)
+
+        texts = self._render(page, note=note, slim_fields=slim_fields, summaries=summaries)
+        return ListArtifact([TextArtifact(text) for text in texts])
+
+    def _stored_note(self, values: list) -> Callable[[int, bool], Optional[str]]:
+        """Note for a result cut short or shortened to fit the output budget.
+
+        The result is stored the first time the note is needed, so all of it can be read with read_result_page.
+        """
+        handle = None
+
+        def note(shown: int, shortened: bool) -> Optional[str]:
+            nonlocal handle
+            if shown >= len(values) and not shortened:
+                return None
+            if handle is None:
+                handle = self.result_store.put(values)
+            return self._page_note(handle, 0, shown, len(values), shortened)
+
+        return note
+
+    def _stored_value_note(self, value: Any) -> Callable[[int, bool], Optional[str]]:
+        """Note for a single result shortened to fit the output budget, which stores it to be read in full."""
+
+        def note(shown: int, shortened: bool) -> Optional[str]:
+            if not shortened:
+                return None
+            handle = self.result_store.put([value])
+            return (
+                "The result was shortened to fit the output size limit. To read it in full, use read_result_page "
+                f"with handle {handle} and offset 0."
+            )
+
+        return note
+
+    def _page_note(self, handle: str, offset: int, shown: int, total: int, shortened: bool = False) -> str:
+        if shortened:
+            rest = " and read the rest" if offset + shown < total else ""
+            return (
+                f"Showing items {offset + 1}-{offset + shown} of {total}, shortened to fit the output size limit. "
+                f"To read them in full{rest}, use read_result_page with handle {handle} and offset {offset}."
+            )
+        return (
+            f"Showing items {offset + 1}-{offset + shown} of {total}. To read more, use read_result_page "
+            f"with handle {handle} and offset {offset + shown}."
+        )
+
+    def _to_search_artifact(self, result: dict, fields: Optional[list] = None) -> ListArtifact:
+        labels = [key for key in result.keys() for _ in result[key]["items"]]
+        values = [project(item, fields, self.excluded_fields) for key in result.keys() for item in result[key]["items"]]
+        return ListArtifact([TextArtifact(text) for text in self._render(values, labels)])
+
+    def _render(
+        self,
+        values: list,
+        labels: Optional[list] = None,
+        truncate: bool = True,
+        note: Optional[Callable[[int, bool], Optional[str]]] = None,
+        slim_fields: Optional[frozenset] = SLIM_FIELDS,
+        summaries: bool = True,
+    ) -> list:
+        """Serializes activity output, shaping it to fit the output budget when a result shaper is set."""
+        if self.result_shaper is not None:
+            return self.result_shaper.shape(
+                values,
+                self.serializer.serialize,
+                labels,
+                truncate=truncate,
+                note=note,
+                slim_fields=slim_fields,
+                summaries=summaries,
+            )
+        if labels is None:
+            texts = [self.serializer.serialize(value) for value in values]
+        else:
+            texts = [f"{label}: {self.serializer.serialize(value)}" for label, value in zip(labels, values)]
+        last_note = note(len(values), False) if note is not None else None
+        return texts if last_note is None else texts + [last_note]
+
+    def _iter_pages(
+        self, method: str, *args, key: Optional[str] = None, prefetch: Optional[int] = None, **kwargs
+    ) -> Iterator[Any]:
+        def fetch_page(offset: int) -> dict:
+            result = self._request(method, *args, limit=PAGE_SIZE, offset=offset, **kwargs)
+            return result if key is None else result[key]
+
+        prefetch = self.prefetch_pages if prefetch is None else prefetch
+        return iter_items(
+            self._limited(self._paged(fetch_page, PAGE_SIZE)), PAGE_SIZE, executor=self.executor, prefetch=prefetch
+        )
         
     ####################
     ###    ALBUMS    ###
@@ -66,6 +571,10 @@ class SpotifyClient(BaseTool):
                     An ISO 3166-1 alpha-2 country code. If a country code is specified, only content that is playable in that market is returned. Note: Playlist results are not affected by the market parameter.
                     Examples: market=US
                 """)): str,
+                SchemaOptional(Literal("fields", description=dedent("""
+                    A list of the fields to return for each object. Use dots to select nested fields, e.g. ["name", "artists.name", "album.name"].
+                    Default: every field except available_markets, images and external_urls.
+                """))): list,
             }),
         }
     )
@@ -75,8 +584,14 @@ class SpotifyClient(BaseTool):
         market: str = vals.get("market", "US")
 
         try:
-            result = self.client.album(id, market=market)
-            return TextArtifact(str(result))
+            result = self._get_entity(
+                "album",
+                id,
+                market,
+                lambda: self._request("album", id, market=market),
+                lambda ids: self._request("albums", ids, market=market)["albums"],
+            )
+            return self._to_artifact(result, self._fields("get_album", vals))
 
         except Exception as e:
             return ErrorArtifact(str(e))
@@ -86,13 +601,17 @@ class SpotifyClient(BaseTool):
             "description": "Can be used to get Spotify catalog information for several albums.",
             "schema": Schema({
                 Literal("ids", description=dedent("""
-                    A list of the Spotify IDs for the albums. Maximum: 20 IDs.
+                    A list of the Spotify IDs for the albums. Lists longer than 20 IDs are fetched in batches of 20.
                     Spotify IDs are 22-character strings that start with sp.
                 """)): list,
                 Literal("market", description=dedent("""
                     An ISO 3166-1 alpha-2 country code. If a country code is specified, only content that is playable in that market is returned. Note: Playlist results are not affected by the market parameter.
                     Examples: market=US
                 """)): str,
+                SchemaOptional(Literal("fields", description=dedent("""
+                    A list of the fields to return for each object. Use dots to select nested fields, e.g. ["name", "artists.name", "album.name"].
+                    Default: every field except available_markets, images and external_urls.
+                """))): list,
             }),
         }
     )
@@ -102,11 +621,10 @@ class SpotifyClient(BaseTool):
         market: str = vals.get("market", "US")
 
         try:
-            result = self.client.albums(ids, market=market)
-            artifacts = list()
-            for album in result["albums"]:
-                artifacts.append(TextArtifact(str(album)))
-            return ListArtifact(artifacts)
+            result = self._cached_many(
+                "album", ids, market, lambda ids: self._request("albums", ids, market=market)["albums"]
+            )
+            return self._to_list_artifact(result, self._fields("get_albums", vals))
 
         except Exception as e:
             return ErrorArtifact(str(e))
@@ -123,6 +641,10 @@ class SpotifyClient(BaseTool):
                     An ISO 3166-1 alpha-2 country code. If a country code is specified, only content that is playable in that market is returned. Note: Playlist results are not affected by the market parameter.
                     Examples: market=US
                 """)): str,
+                SchemaOptional(Literal("fields", description=dedent("""
+                    A list of the fields to return for each object. Use dots to select nested fields, e.g. ["name", "artists.name", "album.name"].
+                    Default: every field except available_markets, images and external_urls.
+                """))): list,
             }),
         }
     )
@@ -132,11 +654,8 @@ class SpotifyClient(BaseTool):
         market: str = vals.get("market", "US")
 
         try:
-            result = self.client.album_tracks(id, market=market)
-            artifacts = list()
-            for track in result["items"]:
-                artifacts.append(TextArtifact(str(track)))
-            return ListArtifact(artifacts)
+            result = self._cached("album_tracks", id, market, lambda: self._request("album_tracks", id, market=market))
+            return self._to_list_artifact(result["items"], self._fields("get_album_tracks", vals))
 
         except Exception as e:
             return ErrorArtifact(str(e))
@@ -156,6 +675,10 @@ class SpotifyClient(BaseTool):
                     Provide this parameter if you want to apply Track Relinking.
                     Because min_*, max_* and market are applied to the results but not considered when determining the number of returned objects, it is possible that the response will contain less than limit items. In this case, the response will contain a next link to continue paging.
                 """)): str,
+                SchemaOptional(Literal("fields", description=dedent("""
+                    A list of the fields to return for each object. Use dots to select nested fields, e.g. ["name", "artists.name", "album.name"].
+                    Default: every field except available_markets, images and external_urls.
+                """))): list,
             }),
         }
     )
@@ -166,21 +689,22 @@ class SpotifyClient(BaseTool):
         market: str = vals.get("market", "US")
 
         try:
-            result = self.client.current_user_saved_albums(limit=limit, offset=offset, market=market)
-            artifacts = list()
-            for album in result["items"]:
-                artifacts.append(TextArtifact(str(album)))
-            return ListArtifact(artifacts)
+            result = self._request("current_user_saved_albums", limit=limit, offset=offset, market=market)
+            return self._to_list_artifact(result["items"], self._fields("get_current_user_saved_albums", vals))
 
         except Exception as e:
             return ErrorArtifact(str(e))
 
+    def iter_saved_albums(self, market: Optional[str] = "US") -> Iterator[dict]:
+        """Yields every album saved in the current user's library, fetching pages as they are consumed."""
+        return self._iter_pages("current_user_saved_albums", market=market)
+
     @activity(
         config={
             "description": "Can be used to add one or more albums to the current user's library.",
             "schema": Schema({
                 Literal("ids", description=dedent("""
-                    A list of the Spotify IDs for the albums. Maximum: 50 IDs.
+                    A list of the Spotify IDs for the albums. Lists longer than 20 IDs are sent in batches of 20.
                     Spotify IDs are 22-character strings that start with sp.
                 """)): list,
             }),
@@ -191,11 +715,9 @@ class SpotifyClient(BaseTool):
         ids: list = vals.get("ids")
 
         try:
-            self.client.current_user_saved_albums_add(ids)
-            artifacts = list()
-            for id in ids:
-                artifacts.append(TextArtifact(f"Successfully added album with id: {id}"))
-            return ListArtifact(artifacts)
+            self._write_many("saved_albums", ids, self._get_client().current_user_saved_albums_add)
+            self._remember_saved("albums", ids, True)
+            return ListArtifact([TextArtifact(f"Successfully added album with id: {id}") for id in ids])
 
         except Exception as e:
             return ErrorArtifact(str(e))
@@ -205,7 +727,7 @@ class SpotifyClient(BaseTool):
             "description": "Can be used to remove one or more albums from the current user's library.",
             "schema": Schema({
                 Literal("ids", description=dedent("""
-                    A list of the Spotify IDs for the albums. Maximum: 50 IDs.
+                    A list of the Spotify IDs for the albums. Lists longer than 20 IDs are sent in batches of 20.
                     Spotify IDs are 22-character strings that start with sp.
                 """)): list,
             }),
@@ -216,11 +738,9 @@ class SpotifyClient(BaseTool):
         ids: list = vals.get("ids")
 
         try:
-            self.client.current_user_saved_albums_delete(ids)
-            artifacts = list()
-            for id in ids:
-                artifacts.append(TextArtifact(f"Successfully removed album with id: {id}"))
-            return ListArtifact(artifacts)
+            self._write_many("saved_albums", ids, self._get_client().current_user_saved_albums_delete)
+            self._remember_saved("albums", ids, False)
+            return ListArtifact([TextArtifact(f"Successfully removed album with id: {id}") for id in ids])
         
         except Exception as e:
             return ErrorArtifact(str(e))
@@ -230,7 +750,7 @@ class SpotifyClient(BaseTool):
             "description": "Can be used to check if one or more albums is already saved in the current Spotify user's 'Your Music' library.",
             "schema": Schema({
                 Literal("ids", description=dedent("""
-                    A list of the Spotify IDs for the albums. Maximum: 50 IDs.
+                    A list of the Spotify IDs for the albums. Lists longer than 20 IDs are checked in batches of 20.
                     Spotify IDs are 22-character strings that start with sp.
                 """)): list,
             }),
@@ -241,11 +761,10 @@ class SpotifyClient(BaseTool):
         ids: list = vals.get("ids")
 
         try:
-            result = self.client.current_user_saved_albums_contains(ids)
-            artifacts = list()
-            for id in ids:
-                artifacts.append(TextArtifact(f"Album with id: {id} is saved: {result[ids.index(id)]}"))
-            return ListArtifact(artifacts)
+            result = self._contains("albums", ids, lambda ids: self._request("current_user_saved_albums_contains", ids))
+            return ListArtifact(
+                [TextArtifact(f"Album with id: {id} is saved: {is_saved}") for id, is_saved in zip(ids, result)]
+            )
         
         except Exception as e:
             return ErrorArtifact(str(e))
@@ -265,6 +784,10 @@ class SpotifyClient(BaseTool):
                 Literal("offset", description=dedent("""
                     The index of the first item to return. Default: 0 (i.e., the first track). Use with limit to get the next set of items.
                 """)): int,
+                SchemaOptional(Literal("fields", description=dedent("""
+                    A list of the fields to return for each object. Use dots to select nested fields, e.g. ["name", "artists.name", "album.name"].
+                    Default: every field except available_markets, images and external_urls.
+                """))): list,
             }),
         }
     )
@@ -275,13 +798,15 @@ class SpotifyClient(BaseTool):
         offset: int = vals.get("offset", 0)
 
         try:
-            result = self.client.new_releases(country=country, limit=limit, offset=offset)
-            artifacts = list()
-            for album in result["albums"]["items"]:
-                artifacts.append(TextArtifact(str(album)))
+            result = self._request("new_releases", country=country, limit=limit, offset=offset)
+            return self._to_list_artifact(result["albums"]["items"], self._fields("get_new_releases", vals))
 
         except Exception as e:
             return ErrorArtifact(str(e))
+
+    def iter_new_releases(self, country: Optional[str] = None) -> Iterator[dict]:
+        """Yields every new album release, fetching pages as they are consumed."""
+        return self._iter_pages("new_releases", key="albums", country=country)
         
     ####################
     ###    ARTISTS   ###
@@ -295,6 +820,10 @@ class SpotifyClient(BaseTool):
                     The Spotify ID for the artist.
                     Spotify IDs are 22-character strings that start with sp.
                 """)): str,
+                SchemaOptional(Literal("fields", description=dedent("""
+                    A list of the fields to return for each object. Use dots to select nested fields, e.g. ["name", "artists.name", "album.name"].
+                    Default: every field except available_markets, images and external_urls.
+                """))): list,
             }),
         }
     )
@@ -303,8 +832,14 @@ class SpotifyClient(BaseTool):
         id: str = vals.get("id")
 
         try:
-            result = self.client.artist(id)
-            return TextArtifact(str(result))
+            result = self._get_entity(
+                "artist",
+                id,
+                None,
+                lambda: self._request("artist", id),
+                lambda ids: self._request("artists", ids)["artists"],
+            )
+            return self._to_artifact(result, self._fields("get_artist", vals))
 
         except Exception as e:
             return ErrorArtifact(str(e))
@@ -314,9 +849,13 @@ class SpotifyClient(BaseTool):
             "description": "Can be used to get Spotify catalog information for several artists based on their Spotify IDs.",
             "schema": Schema({
                 Literal("ids", description=dedent("""
-                    A list of the Spotify IDs for the artists. Maximum: 50 IDs.
+                    A list of the Spotify IDs for the artists. Lists longer than 50 IDs are fetched in batches of 50.
                     Spotify IDs are 22-character strings that start with sp.
                 """)): list,
+                SchemaOptional(Literal("fields", description=dedent("""
+                    A list of the fields to return for each object. Use dots to select nested fields, e.g. ["name", "artists.name", "album.name"].
+                    Default: every field except available_markets, images and external_urls.
+                """))): list,
             }),
         }
     )
@@ -325,11 +864,8 @@ class SpotifyClient(BaseTool):
         ids: list = vals.get("ids")
 
         try:
-            result = self.client.artists(ids)
-            artifacts = list()
-            for artist in result["artists"]:
-                artifacts.append(TextArtifact(str(artist)))
-            return ListArtifact(artifacts)
+            result = self._cached_many("artist", ids, None, lambda ids: self._request("artists", ids)["artists"])
+            return self._to_list_artifact(result, self._fields("get_artists", vals))
 
         except Exception as e:
             return ErrorArtifact(str(e))
@@ -363,6 +899,10 @@ class SpotifyClient(BaseTool):
                 Literal("offset", description=dedent("""
                     The index of the first object to return. Default: 0 (i.e., the first object). Use with limit to get the next set of objects.
                 """)): int,
+                SchemaOptional(Literal("fields", description=dedent("""
+                    A list of the fields to return for each object. Use dots to select nested fields, e.g. ["name", "artists.name", "album.name"].
+                    Default: every field except available_markets, images and external_urls.
+                """))): list,
             }),
         }
     )
@@ -375,14 +915,17 @@ class SpotifyClient(BaseTool):
         offset: int = vals.get("offset", 0)
 
         try:
-            result = self.client.artist_albums(id, include_groups=include_groups, market=market, limit=limit, offset=offset)
-            artifacts = list()
-            for album in result["items"]:
-                artifacts.append(TextArtifact(str(album)))
-            return ListArtifact(artifacts)
+            result = self._request("artist_albums", id, include_groups=include_groups, country=market, limit=limit, offset=offset)
+            return self._to_list_artifact(result["items"], self._fields("get_artist_albums", vals))
 
         except Exception as e:
             return ErrorArtifact(str(e))
+
+    def iter_artist_albums(
+        self, id: str, include_groups: Optional[list] = None, market: Optional[str] = "US"
+    ) -> Iterator[dict]:
+        """Yields every album of an artist, fetching pages as they are consumed."""
+        return self._iter_pages("artist_albums", id, include_groups=include_groups, country=market)
         
         
     @activity(
@@ -397,6 +940,10 @@ class SpotifyClient(BaseTool):
                     An ISO 3166-1 alpha-2 country code or the string from_token.
                     Provide this parameter if you want to apply Track Relinking.
                 """)): str,
+                SchemaOptional(Literal("fields", description=dedent("""
+                    A list of the fields to return for each object. Use dots to select nested fields, e.g. ["name", "artists.name", "album.name"].
+                    Default: every field except available_markets, images and external_urls.
+                """))): list,
             }),
         }
     )
@@ -406,11 +953,10 @@ class SpotifyClient(BaseTool):
         country: str = vals.get("country", "US")
 
         try:
-            result = self.client.artist_top_tracks(id, country=country)
-            artifacts = list()
-            for track in result["tracks"]:
-                artifacts.append(TextArtifact(str(track)))
-            return ListArtifact(artifacts)
+            result = self._cached(
+                "artist_top_tracks", id, country, lambda: self._request("artist_top_tracks", id, country=country)
+            )
+            return self._to_list_artifact(result["tracks"], self._fields("get_artist_top_tracks", vals))
 
         except Exception as e:
             return ErrorArtifact(str(e))
@@ -429,6 +975,10 @@ class SpotifyClient(BaseTool):
                 Literal("offset", description=dedent("""
                     The index of the first item to return. Default: 0 (i.e., the first track). Use with limit to get the next set of items.
                 """)): int,
+                SchemaOptional(Literal("fields", description=dedent("""
+                    A list of the fields to return for each object. Use dots to select nested fields, e.g. ["name", "artists.name", "album.name"].
+                    Default: every field except available_markets, images and external_urls.
+                """))): list,
             }),
         }
     )
@@ -439,11 +989,10 @@ class SpotifyClient(BaseTool):
         offset: int = vals.get("offset", 0)
 
         try:
-            result = self.client.artist_related_artists(id, limit=limit, offset=offset)
-            artifacts = list()
-            for artist in result["artists"]:
-                artifacts.append(TextArtifact(str(artist)))
-            return ListArtifact(artifacts)
+            # The endpoint is not paged, so limit and offset are applied to the full list it returns.
+            result = self._request("artist_related_artists", id)
+            artists = result["artists"][offset : offset + limit]
+            return self._to_list_artifact(artists, self._fields("get_artist_related_artists", vals))
 
         except Exception as e:
             return ErrorArtifact(str(e))
@@ -483,11 +1032,8 @@ class SpotifyClient(BaseTool):
     )
     def get_available_genre_seeds(self, params: dict) -> TextArtifact | ErrorArtifact:
         try:
-            result = self.client.recommendation_genre_seeds()
-            artifacts = list()
-            for genre in result["genres"]:
-                artifacts.append(TextArtifact(str(genre)))
-            return ListArtifact(artifacts)
+            result = self._request("recommendation_genre_seeds")
+            return self._to_list_artifact(result["genres"])
 
         except Exception as e:
             return ErrorArtifact(str(e))
@@ -503,11 +1049,8 @@ class SpotifyClient(BaseTool):
     )
     def get_available_markets(self, params: dict) -> TextArtifact | ErrorArtifact:
         try:
-            result = self.client.available_markets()
-            artifacts = list()
-            for market in result["markets"]:
-                artifacts.append(TextArtifact(str(market)))
-            return ListArtifact(artifacts)
+            result = self._request("available_markets")
+            return self._to_list_artifact(result["markets"])
 
         except Exception as e:
             return ErrorArtifact(str(e))
@@ -551,11 +1094,11 @@ class SpotifyClient(BaseTool):
         id: str = vals.get("id")
         market: str = vals.get("market", "US")
         fields: str = vals.get("fields")
-        additional_types: str = vals.get("additional_types")
+        additional_types: list = vals.get("additional_types", ["track", "episode"])
 
         try:
-            result = self.client.playlist(id, market=market, fields=fields, additional_types=additional_types)
-            return TextArtifact(str(result))
+            result = self._request("playlist", id, market=market, fields=fields, additional_types=additional_types)
+            return self._to_artifact(result, api_fields=fields)
 
         except Exception as e:
             return ErrorArtifact(str(e))
@@ -596,8 +1139,8 @@ class SpotifyClient(BaseTool):
         description: str = vals.get("description", None)
 
         try:
-            result = self.client.playlist_change_details(id, name=name, public=public, collaborative=collaborative, description=description)
-            return TextArtifact(str(result))
+            result = self._get_client().playlist_change_details(id, name=name, public=public, collaborative=collaborative, description=description)
+            return self._to_artifact(result)
 
         except Exception as e:
             return ErrorArtifact(str(e))
@@ -624,6 +1167,9 @@ class SpotifyClient(BaseTool):
                     A list of item types that your client supports besides the default track type. Valid types are: track and episode.
                     Note: This parameter was introduced to allow existing clients to maintain their current behaviour and might be deprecated in the future. In addition to providing this parameter, make sure that your client properly handles cases of new types in the future by checking against the type field of each object.
                 """)): list,
+                SchemaOptional(Literal("all_items", description=dedent("""
+                    If true, every item in the playlist is returned instead of only the first 100. Default: false.
+                """))): bool,
             }),
         }
     )
@@ -633,13 +1179,36 @@ class SpotifyClient(BaseTool):
         market: str = vals.get("market", "US")
         fields: str = vals.get("fields", None)
         additional_types: str = vals.get("additional_types", ["track", "episode"])
+        all_items: bool = vals.get("all_items", False)
 
         try:
-            result = self.client.playlist_items(id, market=market, fields=fields, additional_types=additional_types)
-            artifacts = list()
-            for track in result["items"]:
-                artifacts.append(TextArtifact(str(track)))
-            return ListArtifact(artifacts)
+            if all_items:
+                # Paging reads total and next, so a fields filter must keep them.
+                page_fields = with_fields(fields, ["total", "next"])
+                items = fetch_all_pages(
+                    self._limited(
+                        self._paged(
+                            lambda offset: self._request(
+                                "playlist_items",
+                                id,
+                                market=market,
+                                fields=page_fields,
+                                additional_types=additional_types,
+                                limit=PLAYLIST_ITEMS_PAGE_SIZE,
+                                offset=offset,
+                            ),
+                            PLAYLIST_ITEMS_PAGE_SIZE,
+                        )
+                    ),
+                    PLAYLIST_ITEMS_PAGE_SIZE,
+                    executor=self.executor,
+                    fetch_next=self._limited(self._get_client().next),
+                )
+            else:
+                items = self._request(
+                    "playlist_items", id, market=market, fields=fields, additional_types=additional_types
+                )["items"]
+            return self._to_list_artifact(items, api_fields=fields)
 
         except Exception as e:
             return ErrorArtifact(str(e))
@@ -682,8 +1251,8 @@ class SpotifyClient(BaseTool):
         snapshot_id: str = vals.get("snapshot_id", None)
 
         try:
-            result = self.client.playlist_reorder_items(id, range_start=range_start, insert_before=insert_before, range_length=range_length, snapshot_id=snapshot_id)
-            return TextArtifact(str(result))
+            result = self._get_client().playlist_reorder_items(id, range_start=range_start, insert_before=insert_before, range_length=range_length, snapshot_id=snapshot_id)
+            return self._to_artifact(result)
 
         except Exception as e:
             return ErrorArtifact(str(e))
@@ -711,8 +1280,8 @@ class SpotifyClient(BaseTool):
         uris: list = vals.get("uris")
 
         try:
-            result = self.client.playlist_replace_items(id, uris)
-            return TextArtifact(str(result))
+            result = self._get_client().playlist_replace_items(id, uris)
+            return self._to_artifact(result)
 
         except Exception as e:
             return ErrorArtifact(str(e))
@@ -742,8 +1311,8 @@ class SpotifyClient(BaseTool):
         position: int = vals.get("position", 0)
 
         try:
-            result = self.client.playlist_add_items(id, tracks, position=position)
-            return TextArtifact(str(result))
+            result = self._get_client().playlist_add_items(id, tracks, position=position)
+            return self._to_artifact(result)
 
         except SpotifyException as se:
             if se.http_status == 403 or se.http_status == 401:
@@ -780,8 +1349,8 @@ class SpotifyClient(BaseTool):
         snapshot_id: str = vals.get("snapshot_id", None)
 
         try:
-            result = self.client.playlist_remove_all_occurrences_of_items(id, uris, snapshot_id=snapshot_id)
-            return TextArtifact(str(result))
+            result = self._get_client().playlist_remove_all_occurrences_of_items(id, uris, snapshot_id=snapshot_id)
+            return self._to_artifact(result)
 
         except Exception as e:
             return ErrorArtifact(str(e))
@@ -806,14 +1375,15 @@ class SpotifyClient(BaseTool):
         offset: int = vals.get("offset", 0)
 
         try:
-            result = self.client.current_user_playlists(limit=limit, offset=offset)
-            artifacts = list()
-            for playlist in result["items"]:
-                artifacts.append(TextArtifact(str(playlist)))
-            return ListArtifact(artifacts)
+            result = self._request("current_user_playlists", limit=limit, offset=offset)
+            return self._to_list_artifact(result["items"])
 
         except Exception as e:
             return ErrorArtifact(str(e))
+
+    def iter_current_user_playlists(self) -> Iterator[dict]:
+        """Yields every playlist owned or followed by the current user, fetching pages as they are consumed."""
+        return self._iter_pages("current_user_playlists")
         
     # playlist-read-private
     # playlist-read-collaborative
@@ -840,15 +1410,16 @@ class SpotifyClient(BaseTool):
         offset: int = vals.get("offset", 0)
 
         try:
-            result = self.client.user_playlists(user_id, limit=limit, offset=offset)
-            artifacts = list()
-            for playlist in result["items"]:
-                artifacts.append(TextArtifact(str(playlist)))
-            return ListArtifact(artifacts)
+            result = self._request("user_playlists", user_id, limit=limit, offset=offset)
+            return self._to_list_artifact(result["items"])
 
         except Exception as e:
             return ErrorArtifact(str(e))
 
+    def iter_user_playlists(self, user_id: str) -> Iterator[dict]:
+        """Yields every playlist owned or followed by a user, fetching pages as they are consumed."""
+        return self._iter_pages("user_playlists", user_id)
+
     @activity(
         config={
             "description": "Can be used to create a Spotify playlist",
@@ -877,8 +1448,8 @@ class SpotifyClient(BaseTool):
         description: str = vals.get("description", "")
 
         try:
-            result = self.client.user_playlist_create(self.client.me()["id"], name, public=public, collaborative=collaborative, description=description)
-            return TextArtifact(str(result))
+            result = self._get_client().user_playlist_create(self._request("me")["id"], name, public=public, collaborative=collaborative, description=description)
+            return self._to_artifact(result)
 
         except SpotifyException as se:
             if se.http_status == 403 or se.http_status == 401:
@@ -917,14 +1488,19 @@ class SpotifyClient(BaseTool):
         offset: int = vals.get("offset", 0)
 
         try:
-            result = self.client.featured_playlists(locale=locale, country=country, timestamp=timestamp, limit=limit, offset=offset)
-            artifacts = list()
-            for playlist in result["playlists"]["items"]:
-                artifacts.append(TextArtifact(str(playlist)))
-            return ListArtifact(artifacts)
+            result = self._request("featured_playlists", locale=locale, country=country, timestamp=timestamp, limit=limit, offset=offset)
+            return self._to_list_artifact(result["playlists"]["items"])
 
         except Exception as e:
             return ErrorArtifact(str(e))
+
+    def iter_featured_playlists(
+        self, locale: Optional[str] = None, country: Optional[str] = None, timestamp: Optional[str] = None
+    ) -> Iterator[dict]:
+        """Yields every featured playlist, fetching pages as they are consumed."""
+        return self._iter_pages(
+            "featured_playlists", key="playlists", locale=locale, country=country, timestamp=timestamp
+        )
         
     @activity(
         config={
@@ -954,14 +1530,15 @@ class SpotifyClient(BaseTool):
         offset: int = vals.get("offset", 0)
 
         try:
-            result = self.client.category_playlists(category_id, country=country, limit=limit, offset=offset)
-            artifacts = list()
-            for playlist in result["playlists"]["items"]:
-                artifacts.append(TextArtifact(str(playlist)))
-            return ListArtifact(artifacts)
+            result = self._request("category_playlists", category_id, country=country, limit=limit, offset=offset)
+            return self._to_list_artifact(result["playlists"]["items"])
 
         except Exception as e:
             return ErrorArtifact(str(e))
+
+    def iter_category_playlists(self, category_id: str, country: Optional[str] = None) -> Iterator[dict]:
+        """Yields every playlist tagged with a category, fetching pages as they are consumed."""
+        return self._iter_pages("category_playlists", category_id, key="playlists", country=country)
     
     @activity(
         config={
@@ -979,11 +1556,9 @@ class SpotifyClient(BaseTool):
         id: str = vals.get("id")
 
         try:
-            result = self.client.playlist_cover_image(id)
-            artifacts = list()
-            for image in result:
-                artifacts.append(TextArtifact(str(image)))
-            return ListArtifact(artifacts)
+            result = self._request("playlist_cover_image", id)
+            # Images are not entities, so slimming or summarizing them would leave nothing of them.
+            return self._to_list_artifact(result, slim_fields=None, summaries=False)
 
         except Exception as e:
             return ErrorArtifact(str(e))
@@ -1010,8 +1585,8 @@ class SpotifyClient(BaseTool):
         image: str = vals.get("image")
 
         try:
-            result = self.client.playlist_upload_cover_image(id, image)
-            return TextArtifact(str(result))
+            result = self._get_client().playlist_upload_cover_image(id, image)
+            return self._to_artifact(result)
 
         except Exception as e:
             return ErrorArtifact(str(e))
@@ -1042,6 +1617,10 @@ class SpotifyClient(BaseTool):
                     An ISO 3166-1 alpha-2 country code. If a country code is specified, only content that is playable in that market is returned. Note: Playlist results are not affected by the market parameter.
                     Examples: market=US
                 """)): str,
+                SchemaOptional(Literal("fields", description=dedent("""
+                    A list of the fields to return for each object. Use dots to select nested fields, e.g. ["name", "artists.name", "album.name"].
+                    Default: every field except available_markets, images and external_urls.
+                """))): list,
             }),
         }
     )
@@ -1052,12 +1631,8 @@ class SpotifyClient(BaseTool):
         market: str = vals.get("market", "US")
 
         try:
-            res = self.client.search(q=url_encode(q), type=",".join(type), market=market)
-            artifacts = list()
-            for key in res.keys():
-                for item in res[key]["items"]:
-                    artifacts.append(TextArtifact(f"{key}: {item}"))
-            return ListArtifact(artifacts)
+            res = self._request("search", q=url_encode(q), type=",".join(type), market=market)
+            return self._to_search_artifact(res, self._fields("search", vals))
 
         except Exception as e:
             return ErrorArtifact(str(e))
@@ -1084,6 +1659,10 @@ class SpotifyClient(BaseTool):
                     An ISO 3166-1 alpha-2 country code or the string from_token.
                     Provide this parameter if you want to apply Track Relinking.
                 """)): str,
+                SchemaOptional(Literal("fields", description=dedent("""
+                    A list of the fields to return for each object. Use dots to select nested fields, e.g. ["name", "artists.name", "album.name"].
+                    Default: every field except available_markets, images and external_urls.
+                """))): list,
             }),
         }
     )
@@ -1093,8 +1672,14 @@ class SpotifyClient(BaseTool):
         market: str = vals.get("market", "US")
 
         try:
-            result = self.client.track(id, market=market)
-            return TextArtifact(str(result))
+            result = self._get_entity(
+                "track",
+                id,
+                market,
+                lambda: self._request("track", id, market=market),
+                lambda ids: self._request("tracks", ids, market=market)["tracks"],
+            )
+            return self._to_artifact(result, self._fields("get_track", vals))
 
         except Exception as e:
             return ErrorArtifact(str(e))
@@ -1104,13 +1689,17 @@ class SpotifyClient(BaseTool):
             "description": "Can be used to get Spotify catalog information for multiple tracks based on their Spotify IDs.",
             "schema": Schema({
                 Literal("ids", description=dedent("""
-                    A list of the Spotify IDs for the tracks. Maximum: 50 IDs.
+                    A list of the Spotify IDs for the tracks. Lists longer than 50 IDs are fetched in batches of 50.
                     Spotify IDs are 22-character strings that start with sp.
                 """)): list,
                 Literal("market", description=dedent("""
                     An ISO 3166-1 alpha-2 country code or the string from_token.
                     Provide this parameter if you want to apply Track Relinking.
                 """)): str,
+                SchemaOptional(Literal("fields", description=dedent("""
+                    A list of the fields to return for each object. Use dots to select nested fields, e.g. ["name", "artists.name", "album.name"].
+                    Default: every field except available_markets, images and external_urls.
+                """))): list,
             }),
         }
     )
@@ -1120,11 +1709,10 @@ class SpotifyClient(BaseTool):
         market: str = vals.get("market", "US")
 
         try:
-            result = self.client.tracks(ids, market=market)
-            artifacts = list()
-            for track in result["tracks"]:
-                artifacts.append(TextArtifact(str(track)))
-            return ListArtifact(artifacts)
+            result = self._cached_many(
+                "track", ids, market, lambda ids: self._request("tracks", ids, market=market)["tracks"]
+            )
+            return self._to_list_artifact(result, self._fields("get_tracks", vals))
 
         except Exception as e:
             return ErrorArtifact(str(e))
@@ -1144,6 +1732,10 @@ class SpotifyClient(BaseTool):
                     An ISO 3166-1 alpha-2 country code or the string from_token.
                     Provide this parameter if you want to apply Track Relinking.
                 """)): str,
+                SchemaOptional(Literal("fields", description=dedent("""
+                    A list of the fields to return for each object. Use dots to select nested fields, e.g. ["name", "artists.name", "album.name"].
+                    Default: every field except available_markets, images and external_urls.
+                """))): list,
             }),
         }
     )
@@ -1154,11 +1746,75 @@ class SpotifyClient(BaseTool):
         market: str = vals.get("market", "US")
 
         try:
-            result = self.client.current_user_saved_tracks(limit=limit, offset=offset, market=market)
-            artifacts = list()
-            for track in result["items"]:
-                artifacts.append(TextArtifact(str(track)))
-            return ListArtifact(artifacts)
+            result = self._request("current_user_saved_tracks", limit=limit, offset=offset, market=market)
+            return self._to_list_artifact(result["items"], self._fields("get_current_users_saved_tracks", vals))
+
+        except Exception as e:
+            return ErrorArtifact(str(e))
+
+    def iter_saved_tracks(self, market: Optional[str] = "US") -> Iterator[dict]:
+        """Yields every track saved in the current user's library, fetching pages as they are consumed."""
+        return self._iter_pages("current_user_saved_tracks", market=market)
+
+    def _export_path(self, path: str) -> str:
+        """Resolves a path given to an activity inside `export_directory`, refusing any that would leave it."""
+        if os.path.isabs(path):
+            raise ValueError(f"Export paths must be relative to the export directory: {path}")
+        directory = os.path.realpath(self.export_directory)
+        resolved = os.path.realpath(os.path.join(directory, path))
+        if resolved == directory or os.path.commonpath([directory, resolved]) != directory:
+            raise ValueError(f"Export paths must stay inside the export directory: {path}")
+        return resolved
+
+    def export_saved_tracks(self, path: str, market: Optional[str] = "US") -> int:
+        """Writes every track saved in the current user's library to `path` as NDJSON and returns the number written.
+
+        Once the first page gives the library size, up to `max_concurrency` of the following pages are fetched at once
+        and written in library order as they arrive. The file is written under a temporary name and only moved to
+        `path` once it is complete.
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        serializer = JsonResultSerializer()
+        partial_path = f"{path}.partial"
+        count = 0
+        saved_ids = []
+        try:
+            with open(partial_path, "w", encoding="utf-8") as f:
+                for item in self._iter_pages("current_user_saved_tracks", market=market, prefetch=self.max_concurrency):
+                    f.write(serializer.serialize(item) + "\n")
+                    count += 1
+                    saved_ids.append(item["track"]["id"])
+            os.replace(partial_path, path)
+        except BaseException:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+            raise
+        self._remember_saved("tracks", saved_ids, True)
+        return count
+
+    @activity(
+        config={
+            "description": "Can be used to export every song saved in the current Spotify user's 'Your Music' library to a file.",
+            "schema": Schema({
+                Literal("path", description=dedent("""
+                    The file to write the tracks to, one JSON object per line, relative to the export directory.
+                """)): str,
+                SchemaOptional(Literal("market", description=dedent("""
+                    An ISO 3166-1 alpha-2 country code or the string from_token.
+                    Provide this parameter if you want to apply Track Relinking.
+                """))): str,
+            }),
+        }
+    )
+    def export_current_users_saved_tracks(self, params: dict) -> TextArtifact | ErrorArtifact:
+        vals: dict = params.get("values")
+        path: str = vals.get("path")
+        market: str = vals.get("market", "US")
+
+        try:
+            path = self._export_path(path)
+            count = self.export_saved_tracks(path, market=market)
+            return TextArtifact(f"Successfully exported {count} saved tracks to: {path}")
 
         except Exception as e:
             return ErrorArtifact(str(e))
@@ -1169,7 +1825,7 @@ class SpotifyClient(BaseTool):
             "description": "Can be used to save one or more tracks to the current user's 'Your Music' library.",
             "schema": Schema({
                 Literal("ids", description=dedent("""
-                    A list of the Spotify IDs for the tracks. Maximum: 50 IDs.
+                    A list of the Spotify IDs for the tracks. Lists longer than 50 IDs are sent in batches of 50.
                     Spotify IDs are 22-character strings that start with sp.
                 """)): list,
             }),
@@ -1180,11 +1836,9 @@ class SpotifyClient(BaseTool):
         ids: list = vals.get("ids")
 
         try:
-            self.client.current_user_saved_tracks_add(ids)
-            artifacts = list()
-            for id in ids:
-                artifacts.append(TextArtifact(f"Sucessfully saved track: {id} to user's library"))
-            return ListArtifact(artifacts)
+            self._write_many("saved_tracks", ids, self._get_client().current_user_saved_tracks_add)
+            self._remember_saved("tracks", ids, True)
+            return ListArtifact([TextArtifact(f"Sucessfully saved track: {id} to user's library") for id in ids])
         
         except Exception as e:
             return ErrorArtifact(str(e))
@@ -1195,7 +1849,7 @@ class SpotifyClient(BaseTool):
             "description": "Can be used to remove one or more tracks from the current user's 'Your Music' library.",
             "schema": Schema({
                 Literal("ids", description=dedent("""
-                    A list of the Spotify IDs for the tracks. Maximum: 50 IDs.
+                    A list of the Spotify IDs for the tracks. Lists longer than 50 IDs are sent in batches of 50.
                     Spotify IDs are 22-character strings that start with sp.
                 """)): list,
             }),
@@ -1206,11 +1860,9 @@ class SpotifyClient(BaseTool):
         ids: list = vals.get("ids")
 
         try:
-            self.client.current_user_saved_tracks_delete(ids)
-            artifacts = list()
-            for id in ids:
-                artifacts.append(TextArtifact(f"Sucessfully removed track: {id} from user's library"))
-            return ListArtifact(artifacts)
+            self._write_many("saved_tracks", ids, self._get_client().current_user_saved_tracks_delete)
+            self._remember_saved("tracks", ids, False)
+            return ListArtifact([TextArtifact(f"Sucessfully removed track: {id} from user's library") for id in ids])
         
         except Exception as e:
             return ErrorArtifact(str(e))
@@ -1221,7 +1873,7 @@ class SpotifyClient(BaseTool):
             "description": "Can be used to check if one or more tracks is already saved in the current Spotify user's 'Your Music' library.",
             "schema": Schema({
                 Literal("ids", description=dedent("""
-                    A list of the Spotify IDs for the tracks. Maximum: 50 IDs.
+                    A list of the Spotify IDs for the tracks. Lists longer than 50 IDs are checked in batches of 50.
                     Spotify IDs are 22-character strings that start with sp.
                 """)): list,
             }),
@@ -1232,11 +1884,8 @@ class SpotifyClient(BaseTool):
         ids: list = vals.get("ids")
 
         try:
-            result = self.client.current_user_saved_tracks_contains(ids)
-            artifacts = list()
-            for is_saved in result:
-                artifacts.append(TextArtifact(str(is_saved)))
-            return ListArtifact(artifacts)
+            result = self._contains("tracks", ids, lambda ids: self._request("current_user_saved_tracks_contains", ids))
+            return self._to_list_artifact(result)
 
         except Exception as e:
             return ErrorArtifact(str(e))
@@ -1245,8 +1894,8 @@ class SpotifyClient(BaseTool):
         config={
             "description": "Can be used to get audio features for multiple tracks based on their Spotify IDs.",
             "schema": Schema({
-                Literal("id", description=dedent("""
-                    The Spotify IDs for the track.
+                Literal("ids", description=dedent("""
+                    A list of the Spotify IDs for the tracks. Lists longer than 100 IDs are fetched in batches of 100.
                     Spotify IDs are 22-character strings that start with sp.
                 """)): list,
             }),
@@ -1257,11 +1906,8 @@ class SpotifyClient(BaseTool):
         ids: list = vals.get("ids")
 
         try:
-            result = self.client.audio_features(ids)
-            artifacts = list()
-            for track in result["audio_features"]:
-                artifacts.append(TextArtifact(str(track)))
-            return ListArtifact(artifacts)
+            result = self._cached_many("audio_features", ids, None, lambda ids: self._request("audio_features", ids))
+            return self._to_list_artifact(result, slim_fields=AUDIO_FEATURES_SLIM_FIELDS, summaries=False)
 
         except Exception as e:
             return ErrorArtifact(str(e))
@@ -1282,8 +1928,101 @@ class SpotifyClient(BaseTool):
         id: str = vals.get("id")
 
         try:
-            result = self.client.audio_analysis(id)
-            return TextArtifact(str(result))
+            result = self._request("audio_analysis", id)
+            return self._to_artifact(result, slim_fields=AUDIO_ANALYSIS_SLIM_FIELDS, summaries=False)
+
+        except Exception as e:
+            return ErrorArtifact(str(e))
+
+    #####################
+    ###    LIBRARY    ###
+    #####################
+
+    def sync_saved_library(self, library: str, market: Optional[str] = "US") -> list:
+        """Returns the items saved to the current user's `library` ("tracks" or "albums") since the last sync.
+
+        Saved items are listed newest first, so paging stops at the first item older than the user's watermark and a
+        sync with few new saves costs a single request. The first sync returns the whole library.
+        """
+        method, entity_key = SAVED_LIBRARIES[library]
+        # The budget user is who the tool acts for, so when it is set, GET /me is not needed to key the watermark.
+        user_id = self.budget_user_id if self.budget_user_id is not None else self._get_current_user_id()
+        watermark = self.watermark_store.get(user_id, library)
+        # Without a watermark every page is needed, so they can be read ahead.
+        prefetch = self.max_concurrency if watermark is None else 0
+        items = self._iter_pages(method, market=market, prefetch=prefetch)
+
+        new_items = list(take_new_items(items, entity_key, watermark))
+        self._remember_saved(library, [item[entity_key]["id"] for item in new_items], True)
+        if new_items:
+            self.watermark_store.set(user_id, library, advance_watermark(watermark, new_items, entity_key))
+        return new_items
+
+    @activity(
+        config={
+            "description": "Can be used to get the tracks or albums saved to the current user's library since the last sync.",
+            "schema": Schema({
+                Literal("library", description=dedent("""
+                    The library to sync. Allowed values: "tracks", "albums"
+                """)): Or("tracks", "albums"),
+                SchemaOptional(Literal("market", description=dedent("""
+                    An ISO 3166-1 alpha-2 country code or the string from_token.
+                    Provide this parameter if you want to apply Track Relinking.
+                """))): str,
+                SchemaOptional(Literal("fields", description=dedent("""
+                    A list of the fields to return for each object. Use dots to select nested fields, e.g. ["name", "artists.name", "album.name"].
+                    Default: every field except available_markets, images and external_urls.
+                """))): list,
+            }),
+        }
+    )
+    def sync_current_user_saved_library(self, params: dict) -> TextArtifact | ListArtifact | ErrorArtifact:
+        vals: dict = params.get("values")
+        library: str = vals.get("library")
+        market: str = vals.get("market", "US")
+
+        try:
+            new_items = self.sync_saved_library(library, market=market)
+            if not new_items:
+                return TextArtifact(f"No {library} were saved since the last sync")
+            return self._to_list_artifact(new_items, self._fields("sync_current_user_saved_library", vals))
+
+        except Exception as e:
+            return ErrorArtifact(str(e))
+
+    #####################
+    ###    RESULTS    ###
+    #####################
+
+    @activity(
+        config={
+            "description": "Can be used to read more items from a large result that was stored instead of returned in full.",
+            "schema": Schema({
+                Literal("handle", description=dedent("""
+                    The handle of the stored result, as given in the note at the end of the previous page.
+                """)): str,
+                Literal("offset", description=dedent("""
+                    The index of the first item to return. Default: 0 (i.e., the first item).
+                """)): int,
+                SchemaOptional(Literal("limit", description=dedent("""
+                    The maximum number of items to return. Default: 50.
+                """))): int,
+            }),
+        }
+    )
+    def read_result_page(self, params: dict) -> ListArtifact | ErrorArtifact:
+        vals: dict = params.get("values")
+        handle: str = vals.get("handle")
+        offset: int = vals.get("offset", 0)
+        limit: int = vals.get("limit", self.result_page_size)
+
+        try:
+            if self.result_store is None:
+                raise ValueError("Result storage is disabled")
+            page, total = self.result_store.get(handle, offset, limit)
+            return self._to_page_artifact(handle, page, offset, total)
 
+        except KeyError:
+            return ErrorArtifact(f"No stored result with handle: {handle}. It may have expired.")
         except Exception as e:
             return ErrorArtifact(str(e))
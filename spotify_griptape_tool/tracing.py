@@ -0,0 +1,133 @@
+from __future__ import annotations
+from collections import defaultdict, deque
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional
+import requests
+from requests.adapters import BaseAdapter
+from griptape.utils import import_optional_dependency
+from spotify_griptape_tool.batching import chunked
+from spotify_griptape_tool.metrics import endpoint_label
+
+if TYPE_CHECKING:
+    from opentelemetry.trace import Span, Tracer
+
+# Attributes for the request spans started in the current context, e.g. the page or chunk being fetched.
+_request_attributes: ContextVar[dict] = ContextVar("spotify_request_attributes", default={})
+
+
+@contextmanager
+def request_attributes(**attributes: Any) -> Iterator[None]:
+    """Adds `attributes` to every request span started inside the block, under the `spotify.` namespace."""
+    token = _request_attributes.set({**_request_attributes.get(), **{f"spotify.{k}": v for k, v in attributes.items()}})
+    try:
+        yield
+    finally:
+        _request_attributes.reset(token)
+
+
+def numbered_pages(fetch_page: Callable[[int], Any], page_size: int) -> Callable[[int], Any]:
+    """Wraps a fetch of the page at an offset so its request spans carry the page number."""
+
+    def fetch(offset: int) -> Any:
+        with request_attributes(page=offset // page_size):
+            return fetch_page(offset)
+
+    return fetch
+
+
+def numbered_chunks(fetch: Callable[[list], list], ids: list, chunk_size: int) -> Callable[[list], list]:
+    """Wraps the `fetch` of a `fetch_in_chunks` call so its request spans carry the index of the chunk they fetch."""
+    chunk_index = _chunk_indexes(ids, chunk_size)
+
+    def fetch_chunk(chunk: list) -> list:
+        with request_attributes(chunk=chunk_index(chunk)):
+            return fetch(chunk)
+
+    return fetch_chunk
+
+
+def _chunk_indexes(ids: list, chunk_size: int) -> Callable[[list], int]:
+    # Chunks only arrive as their contents, and identical chunks are handed out in order.
+    indexes = defaultdict(deque)
+    for index, chunk in enumerate(chunked(ids, chunk_size)):
+        indexes[tuple(chunk)].append(index)
+    return lambda chunk: indexes[tuple(chunk)].popleft()
+
+
+def request_span(tracer: Optional[Tracer], method: str, url: str):
+    """Context manager for a client span around one Web API request; does nothing without a `tracer`."""
+    if tracer is None:
+        return nullcontext()
+    trace = import_optional_dependency("opentelemetry.trace")
+    endpoint = endpoint_label(url)
+    return tracer.start_as_current_span(
+        f"{method} {endpoint}",
+        kind=trace.SpanKind.CLIENT,
+        attributes={
+            "http.request.method": method,
+            "url.full": url,
+            "spotify.endpoint": endpoint,
+            "http.request.resend_count": 0,
+            **_request_attributes.get(),
+        },
+    )
+
+
+def record_response(span: Optional[Span], status: int, bytes_received: int, resend_count: Optional[int] = None) -> None:
+    if span is None:
+        return
+    span.set_attribute("http.response.status_code", status)
+    span.set_attribute("http.response.body.size", bytes_received)
+    if resend_count:
+        span.set_attribute("http.request.resend_count", resend_count)
+    if status >= 400:
+        record_error(span, f"HTTP {status}")
+
+
+def record_error(span: Span, message: str) -> None:
+    trace = import_optional_dependency("opentelemetry.trace")
+    span.set_status(trace.Status(trace.StatusCode.ERROR, message))
+
+
+def add_cache_event(cache: str, hits: int, misses: int) -> None:
+    """Records a cache lookup on the current span, normally the activity's."""
+    trace = import_optional_dependency("opentelemetry.trace")
+    trace.get_current_span().add_event("cache lookup", {"spotify.cache": cache, "hits": hits, "misses": misses})
+
+
+def with_current_context(fetch: Callable) -> Callable:
+    """Makes spans started by `fetch` children of the current span, even when it runs on another thread."""
+    context = import_optional_dependency("opentelemetry.context")
+    parent = context.get_current()
+
+    def run(*args, **kwargs) -> Any:
+        token = context.attach(parent)
+        try:
+            return fetch(*args, **kwargs)
+        finally:
+            context.detach(token)
+
+    return run
+
+
+class TracingTransport(BaseAdapter):
+    """requests transport adapter that wraps each request sent through `inner` in a client span.
+
+    Retries made by urllib3 inside `inner` are reported as the span's `http.request.resend_count`.
+    """
+
+    def __init__(self, tracer: Tracer, inner: BaseAdapter) -> None:
+        super().__init__()
+        self.tracer = tracer
+        self.inner = inner
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        with request_span(self.tracer, request.method, request.url) as span:
+            response = self.inner.send(request, **kwargs)
+            retries = getattr(response.raw, "retries", None)
+            record_response(span, response.status_code, len(response.content), len(getattr(retries, "history", ())))
+            return response
+
+    def close(self) -> None:
+        self.inner.close()
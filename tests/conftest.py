@@ -0,0 +1,19 @@
+import pytest
+from spotify_griptape_tool.tool import SpotifyClient
+
+TOOL_ARGS = {
+    "client_id": "id",
+    "client_secret": "secret",
+    "authorization_redirect_uri": "http://localhost/callback",
+    "user_token": "mock",
+}
+
+
+@pytest.fixture
+def make_tool():
+    """Builds a tool of `tool_class` with test credentials, overridden by any keyword arguments."""
+
+    def make(tool_class: type = SpotifyClient, **kwargs) -> SpotifyClient:
+        return tool_class(**{**TOOL_ARGS, **kwargs})
+
+    return make
@@ -0,0 +1,118 @@
+import asyncio
+import json
+import httpx
+import pytest
+from griptape.artifacts import TextArtifact
+from spotify_griptape_tool.async_tool import AsyncSpotifyClient
+from spotify_griptape_tool.mock_server import MockSpotifyServer, make_id
+
+
+def to_json(value):
+    return json.dumps(value, separators=(",", ":"))
+
+
+@pytest.fixture
+def mock_tool(make_tool):
+    def make(handler, **kwargs) -> AsyncSpotifyClient:
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return make_tool(AsyncSpotifyClient, http_client=http_client, **kwargs)
+
+    return make
+
+
+class TestAsyncSpotifyClient:
+    def test_get_album(self, mock_tool):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"id": "a", "name": "Album"})
+
+        tool = mock_tool(handler)
+        result = asyncio.run(tool.arun_activity("get_album", {"values": {"id": "a", "market": "US"}}))
+
+        assert result.value == to_json({"id": "a", "name": "Album"})
+        assert requests[0].url.path == "/v1/albums/a"
+        assert requests[0].headers["Authorization"] == "Bearer mock"
+
+    def test_get_tracks_fetches_chunks_concurrently(self, mock_tool):
+        def handler(request):
+            ids = request.url.params["ids"].split(",")
+            return httpx.Response(200, json={"tracks": [{"id": id} for id in ids]})
+
+        tool = mock_tool(handler)
+        tool.result_store = None
+        ids = [f"{i:022d}" for i in range(120)]
+        result = asyncio.run(tool.arun_activity("get_tracks", {"values": {"ids": ids, "market": "US"}}))
+
+        assert [artifact.value for artifact in result.value] == [to_json({"id": id}) for id in ids]
+
+    def test_errors_become_error_artifacts(self, mock_tool):
+        def handler(request):
+            return httpx.Response(404, json={"error": {"status": 404, "message": "Not found"}})
+
+        tool = mock_tool(handler)
+        result = asyncio.run(tool.arun_activity("get_artist", {"values": {"id": "missing"}}))
+
+        assert "Not found" in result.value
+
+    def test_playlist_items_pages_are_fetched_in_parallel(self, mock_tool):
+        def handler(request):
+            offset = int(request.url.params["offset"])
+            items = [{"n": n} for n in range(offset, min(offset + 100, 250))]
+            return httpx.Response(200, content=json.dumps({"items": items, "total": 250}))
+
+        tool = mock_tool(handler)
+        tool.result_store = None
+        result = asyncio.run(tool.arun_activity("get_playlist_items", {"values": {"id": "p", "all_items": True}}))
+
+        assert len(result.value) == 250
+
+    def test_concurrent_activities_are_bounded_by_the_activity_executor(self, mock_tool):
+        in_flight = []
+        peak = 0
+
+        async def handler(request):
+            nonlocal peak
+            in_flight.append(request)
+            peak = max(peak, len(in_flight))
+            await asyncio.sleep(0.05)
+            in_flight.remove(request)
+            return httpx.Response(200, json={"id": request.url.path.split("/")[-1]})
+
+        tool = mock_tool(handler, max_concurrent_activities=8)
+
+        async def main():
+            activities = (tool.arun_activity("get_artist", {"values": {"id": f"a{n}"}}) for n in range(16))
+            return await asyncio.gather(*activities)
+
+        results = asyncio.run(main())
+
+        assert [json.loads(result.value)["id"] for result in results] == [f"a{n}" for n in range(16)]
+        assert peak == 8
+
+    def test_retries_statuses_in_the_retry_policy(self, mock_tool):
+        statuses = [503, 200]
+
+        def handler(request):
+            return httpx.Response(statuses.pop(0), headers={"Retry-After": "0"}, json={"id": "a"})
+
+        tool = mock_tool(handler)
+        result = asyncio.run(tool.arun_activity("get_artist", {"values": {"id": "a"}}))
+
+        assert result.value == to_json({"id": "a"})
+        assert statuses == []
+
+    def test_activities_run_through_griptape(self, make_tool):
+        with MockSpotifyServer() as server:
+            tool = make_tool(AsyncSpotifyClient, api_base_url=server.base_url)
+            result = tool.try_run(tool.get_album, None, None, {"id": make_id("album", 1), "market": "US"})
+
+        assert isinstance(result, TextArtifact)
+        assert json.loads(result.value)["name"] == "Album 1"
+
+    def test_unknown_activities_are_rejected(self, mock_tool):
+        tool = mock_tool(lambda request: httpx.Response(200))
+
+        with pytest.raises(ValueError):
+            asyncio.run(tool.arun_activity("missing", {"values": {}}))
@@ -0,0 +1,92 @@
+import threading
+import time
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from spotify_griptape_tool.batching import MicroBatcher, chunked, fetch_in_chunks, fill_missing
+
+
+class TestBatching:
+    def test_chunked(self):
+        assert chunked([1, 2, 3, 4, 5], 2) == [[1, 2], [3, 4], [5]]
+        assert chunked([], 2) == []
+
+    def test_fetch_in_chunks_preserves_input_order(self):
+        calls = []
+
+        def fetch(ids):
+            calls.append(ids)
+            return [f"item-{id}" for id in ids]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            result = fetch_in_chunks(fetch, list(range(7)), 3, executor=executor)
+
+        assert result == [f"item-{i}" for i in range(7)]
+        assert sorted(calls) == [[0, 1, 2], [3, 4, 5], [6]]
+
+    def test_fetch_in_chunks_waits_for_running_chunks_before_raising(self):
+        started = threading.Event()
+        finished = []
+
+        def fetch(ids):
+            if ids == [0]:
+                started.wait(timeout=5)
+                raise ValueError("boom")
+            started.set()
+            time.sleep(0.05)
+            finished.append(ids)
+            return ids
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            with pytest.raises(ValueError):
+                fetch_in_chunks(fetch, [0, 1], 1, executor=executor)
+            assert finished == [[1]]
+
+    def test_fill_missing_fetches_each_missing_id_once(self):
+        fetches = []
+
+        def fetch(ids):
+            fetches.append(ids)
+            return [id.upper() for id in ids]
+
+        results, fetched = fill_missing(["a", "b", "a", "c", "b"], [None, "cached", None, None, "cached"], fetch)
+
+        assert results == ["A", "cached", "A", "C", "cached"]
+        assert fetched == {"a": "A", "c": "C"}
+        assert fetches == [["a", "c"]]
+
+    def test_fill_missing_rejects_misaligned_results(self):
+        with pytest.raises(ValueError):
+            fill_missing(["a", "b"], [None, None], lambda ids: ["A"])
+
+
+class TestMicroBatcher:
+    def test_lookups_within_window_share_one_request(self):
+        calls = []
+
+        def fetch(ids):
+            calls.append(ids)
+            return [{"id": id} for id in ids]
+
+        batcher = MicroBatcher(fetch=fetch, max_batch_size=50, window=0.05)
+        futures = [batcher.submit(id) for id in ["a", "b", "a"]]
+
+        assert [future.result(timeout=1) for future in futures] == [{"id": "a"}, {"id": "b"}, {"id": "a"}]
+        assert calls == [["a", "b"]]
+
+    def test_full_batch_is_sent_immediately(self):
+        calls = []
+
+        def fetch(ids):
+            calls.append(ids)
+            return ids
+
+        batcher = MicroBatcher(fetch=fetch, max_batch_size=2, window=60)
+        futures = [batcher.submit(id) for id in ["a", "b"]]
+
+        assert [future.result(timeout=1) for future in futures] == ["a", "b"]
+
+    def test_missing_results_fail_their_future(self):
+        batcher = MicroBatcher(fetch=lambda ids: [None for _ in ids], max_batch_size=50, window=0.01)
+
+        with pytest.raises(LookupError):
+            batcher.submit("a").result(timeout=1)
@@ -0,0 +1,156 @@
+import asyncio
+import pytest
+from griptape.artifacts import ErrorArtifact
+from spotify_griptape_tool.async_tool import AsyncSpotifyClient
+from spotify_griptape_tool.budget import BudgetExceededError, CallBudget
+from spotify_griptape_tool.mock_server import MockSpotifyServer, MockTransport, make_id
+from spotify_griptape_tool.tool import SpotifyClient
+
+ALBUM_URL = f"https://api.spotify.com/v1/albums/{make_id('album', 1)}"
+
+
+@pytest.fixture
+def budgeted_tool(make_tool):
+    def make(server: MockSpotifyServer, budget: CallBudget, **kwargs) -> SpotifyClient:
+        return make_tool(api_base_url=server.base_url, transport=MockTransport(server), call_budget=budget, **kwargs)
+
+    return make
+
+
+class TestCallBudget:
+    def test_limits_calls_per_run(self):
+        budget = CallBudget(per_run=2)
+
+        budget.charge("a", None, "GET", ALBUM_URL)
+        budget.charge("a", None, "GET", ALBUM_URL)
+        with pytest.raises(BudgetExceededError, match="2 calls per run"):
+            budget.charge("a", None, "GET", ALBUM_URL)
+        budget.charge("b", None, "GET", ALBUM_URL)
+
+        assert budget.summary("a") == {
+            "run_id": "a",
+            "user_id": None,
+            "calls": 2,
+            "calls_by_endpoint": {"GET albums/{id}": 2},
+            "rejected": 1,
+            "limit": 2,
+            "remaining": 0,
+        }
+
+    def test_limits_calls_per_user_across_runs(self):
+        budget = CallBudget(per_user=2)
+
+        budget.charge("a", "alice", "GET", ALBUM_URL)
+        budget.charge("b", "alice", "GET", ALBUM_URL)
+        budget.charge("c", "bob", "GET", ALBUM_URL)
+        with pytest.raises(BudgetExceededError, match="per user"):
+            budget.charge("d", "alice", "GET", ALBUM_URL)
+
+    def test_per_user_limit_needs_a_user(self):
+        budget = CallBudget(per_user=1)
+
+        for run_id in "abc":
+            budget.charge(run_id, None, "GET", ALBUM_URL)
+        budget.charge("d", "alice", "GET", ALBUM_URL)
+
+    def test_limits_calls_per_minute(self, mocker):
+        clock = mocker.patch("spotify_griptape_tool.budget.time.monotonic", return_value=120.0)
+        budget = CallBudget(per_minute=1)
+
+        budget.charge("a", "alice", "GET", ALBUM_URL)
+        with pytest.raises(BudgetExceededError, match="1 calls per minute"):
+            budget.charge("b", "bob", "GET", ALBUM_URL)
+        clock.return_value = 180.0
+        budget.charge("b", "bob", "GET", ALBUM_URL)
+
+    def test_end_run_forgets_the_run(self):
+        budget = CallBudget(per_run=1)
+        budget.charge("a", None, "GET", ALBUM_URL)
+
+        assert budget.end_run("a")["calls"] == 1
+        assert budget.summary("a")["calls"] == 0
+
+    def test_idle_runs_are_forgotten(self, mocker):
+        clock = mocker.patch("spotify_griptape_tool.budget.time.monotonic", return_value=0.0)
+        budget = CallBudget(run_ttl=60)
+        budget.charge("a", None, "GET", ALBUM_URL)
+        budget.charge("b", None, "GET", ALBUM_URL)
+        clock.return_value = 30.0
+        budget.charge("a", None, "GET", ALBUM_URL)
+
+        clock.return_value = 70.0
+        budget.charge("c", None, "GET", ALBUM_URL)
+
+        assert list(budget._runs) == ["a", "c"]
+        assert budget.summary("a")["calls"] == 2
+
+    def test_rejects_unknown_modes(self):
+        with pytest.raises(ValueError):
+            CallBudget(mode="degrade")
+
+
+class TestBudgetedTool:
+    def test_reject_mode_refuses_activities_once_spent(self, budgeted_tool):
+        server = MockSpotifyServer()
+        tool = budgeted_tool(server, CallBudget(per_run=1))
+        params = {"values": {"id": make_id("artist", 1)}}
+
+        assert not isinstance(tool.get_artist(params), ErrorArtifact)
+        # Even though the response cache could answer it.
+        result = tool.get_artist(params)
+
+        assert isinstance(result, ErrorArtifact)
+        assert "1 calls per run" in result.value
+        assert sum(server.requests.values()) == 1
+        assert tool.cost_summary()["rejected"] == 1
+
+    def test_cache_only_mode_keeps_answering_from_caches(self, budgeted_tool):
+        server = MockSpotifyServer()
+        tool = budgeted_tool(server, CallBudget(per_run=1, mode="cache_only"))
+        cached = {"values": {"id": make_id("artist", 1)}}
+
+        tool.get_artist(cached)
+
+        assert not isinstance(tool.get_artist(cached), ErrorArtifact)
+        assert isinstance(tool.get_artist({"values": {"id": make_id("artist", 2)}}), ErrorArtifact)
+        assert sum(server.requests.values()) == 1
+        assert tool.cost_summary()["rejected"] == 1
+
+    def test_counts_every_request_of_a_fan_out(self, budgeted_tool):
+        server = MockSpotifyServer()
+        tool = budgeted_tool(server, CallBudget())
+
+        tool.get_playlist_items({"values": {"id": make_id("playlist", 1), "all_items": True}})
+        tool.search({"values": {"q": "doxy", "type": ["track"]}})
+        summary = tool.end_run()
+
+        assert summary["calls"] == sum(server.requests.values())
+        assert summary["calls_by_endpoint"]["GET playlists/{id}/items"] == 3
+        assert summary["calls_by_endpoint"]["GET search"] == 1
+        assert tool.cost_summary()["calls"] == 0
+
+    def test_tools_share_a_budget(self, budgeted_tool):
+        server = MockSpotifyServer()
+        budget = CallBudget(per_user=1)
+        first = budgeted_tool(server, budget, budget_user_id="alice")
+        second = budgeted_tool(server, budget, budget_user_id="alice")
+
+        first.get_artist({"values": {"id": make_id("artist", 1)}})
+
+        assert isinstance(second.get_artist({"values": {"id": make_id("artist", 2)}}), ErrorArtifact)
+
+    def test_cost_summary_needs_a_budget(self, make_tool):
+        with pytest.raises(ValueError):
+            make_tool().cost_summary()
+
+    def test_async_attempts_are_charged(self, make_tool):
+        budget = CallBudget(per_run=1)
+        with MockSpotifyServer() as server:
+            tool = make_tool(AsyncSpotifyClient, api_base_url=server.base_url, call_budget=budget)
+            ids = [make_id("track", n) for n in range(60)]
+            result = asyncio.run(tool.arun_activity("get_tracks", {"values": {"ids": ids}}))
+
+        assert isinstance(result, ErrorArtifact)
+        assert "1 calls per run" in result.value
+        assert tool.cost_summary()["calls"] == 1
+        assert tool.cost_summary()["rejected"] == 1
@@ -0,0 +1,60 @@
+from spotify_griptape_tool.cache import MemoryResponseCache, SqliteResponseCache
+
+
+class TestMemoryResponseCache:
+    def test_get_set(self):
+        cache = MemoryResponseCache()
+
+        cache.set(("album", "a", "US"), {"id": "a"}, 60)
+
+        assert cache.get(("album", "a", "US")) == {"id": "a"}
+        assert cache.get(("album", "a", "GB")) is None
+
+    def test_expired_entries_are_dropped(self, mocker):
+        monotonic = mocker.patch("spotify_griptape_tool.cache.time.monotonic", return_value=100.0)
+        cache = MemoryResponseCache()
+        cache.set(("track", "t", "US"), {"id": "t"}, 10)
+
+        monotonic.return_value = 111.0
+
+        assert cache.get(("track", "t", "US")) is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = MemoryResponseCache(max_size=2)
+        cache.set(("artist", "a", None), 1, 60)
+        cache.set(("artist", "b", None), 2, 60)
+        cache.get(("artist", "a", None))
+
+        cache.set(("artist", "c", None), 3, 60)
+
+        assert cache.get(("artist", "a", None)) == 1
+        assert cache.get(("artist", "b", None)) is None
+        assert cache.get(("artist", "c", None)) == 3
+
+
+class TestSqliteResponseCache:
+    def test_entries_are_shared_between_instances(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        SqliteResponseCache(path=path).set(("album", "a", "US"), {"id": "a", "name": "Album"}, 60)
+
+        assert SqliteResponseCache(path=path).get(("album", "a", "US")) == {"id": "a", "name": "Album"}
+
+    def test_expired_entries_are_misses(self, tmp_path, mocker):
+        now = mocker.patch("spotify_griptape_tool.cache.time.time", return_value=100.0)
+        cache = SqliteResponseCache(path=str(tmp_path / "cache.db"))
+        cache.set(("track", "t", "US"), {"id": "t"}, 10)
+
+        now.return_value = 111.0
+
+        assert cache.get(("track", "t", "US")) is None
+
+    def test_prune_enforces_max_size(self, tmp_path):
+        cache = SqliteResponseCache(path=str(tmp_path / "cache.db"), max_size=2)
+        for i in range(4):
+            cache.set(("artist", str(i), None), {"id": i}, 60 + i)
+
+        cache.prune()
+
+        assert len(cache) == 2
+        assert cache.get(("artist", "3", None)) == {"id": 3}
@@ -0,0 +1,135 @@
+import io
+import threading
+import time
+import pytest
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from spotipy import SpotifyException
+from urllib3 import HTTPResponse
+from urllib3.util import Retry
+from urllib3.util.retry import RequestHistory
+from spotify_griptape_tool.concurrency import AdaptiveConcurrencyLimiter, LimiterTransport
+
+
+class TestAdaptiveConcurrencyLimiter:
+    def test_limit_grows_additively_while_healthy(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=10, initial_limit=2)
+
+        # Roughly one more slot per full round of requests at the current limit.
+        for _ in range(2 + 3):
+            limiter.call(lambda: None)
+
+        assert limiter.limit == 3
+
+    def test_limit_never_exceeds_max(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=3, initial_limit=3)
+
+        for _ in range(10):
+            limiter.call(lambda: None)
+
+        assert limiter.limit == 3
+
+    @pytest.mark.parametrize("status", [429, 500, 503])
+    def test_overload_halves_the_limit(self, status):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=8)
+
+        def overloaded():
+            raise SpotifyException(status, -1, "overloaded")
+
+        with pytest.raises(SpotifyException):
+            limiter.call(overloaded)
+
+        assert limiter.limit == 4
+        assert limiter.in_flight == 0
+
+    def test_client_errors_do_not_shrink_the_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=8)
+
+        def not_found():
+            raise SpotifyException(404, -1, "not found")
+
+        with pytest.raises(SpotifyException):
+            limiter.call(not_found)
+
+        assert limiter.limit == 8
+
+    def test_slow_responses_shrink_the_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=8, latency_threshold=0.5)
+
+        limiter.acquire()
+        limiter.release(latency=1.0)
+
+        assert limiter.limit == 4
+
+    def test_limit_does_not_drop_below_min(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=4, min_limit=2)
+
+        for _ in range(5):
+            limiter.acquire()
+            limiter.release(0, overloaded=True)
+
+        assert limiter.limit == 2
+
+    def test_in_flight_calls_are_capped_at_the_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=2, increase=0)
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def work():
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.01)
+            with lock:
+                active.pop()
+
+        threads = [threading.Thread(target=limiter.call, args=(work,)) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert max(peak) == 2
+
+    def test_held_calls_leave_the_limit_to_recorded_responses(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=8)
+
+        def throttled():
+            raise SpotifyException(429, -1, "rate limited")
+
+        with pytest.raises(SpotifyException):
+            limiter.hold(throttled)
+        assert limiter.limit == 8
+        limiter.record(None, overloaded=True)
+
+        assert limiter.limit == 4
+        assert limiter.in_flight == 0
+
+
+class TestLimiterTransport:
+    class Inner(BaseAdapter):
+        def __init__(self, statuses):
+            super().__init__()
+            self.statuses = statuses
+
+        def send(self, request, **kwargs):
+            *retried, status = self.statuses
+            history = tuple(RequestHistory(request.method, request.url, None, code, None) for code in retried)
+            raw = HTTPResponse(
+                body=io.BytesIO(b"{}"), status=status, preload_content=False, retries=Retry(history=history)
+            )
+            return HTTPAdapter().build_response(request, raw)
+
+        def close(self):
+            pass
+
+    def test_records_attempts_retried_inside_the_inner_adapter(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=8)
+        session = requests.Session()
+        session.mount("https://", LimiterTransport(limiter, self.Inner([429, 503, 200])))
+
+        response = session.get("https://api.spotify.com/v1/albums/a")
+
+        assert response.status_code == 200
+        assert limiter.limit == 2
@@ -0,0 +1,30 @@
+from spotify_griptape_tool.membership import MembershipCache
+
+
+class TestMembershipCache:
+    def test_unknown_ids_are_none(self):
+        cache = MembershipCache()
+        cache.set_many("user", "tracks", {"a": True, "b": False})
+
+        assert cache.get_many("user", "tracks", ["a", "b", "c"]) == [True, False, None]
+        assert cache.get_many("other", "tracks", ["a"]) == [None]
+        assert cache.get_many("user", "albums", ["a"]) == [None]
+
+    def test_entries_expire(self, mocker):
+        monotonic = mocker.patch("spotify_griptape_tool.membership.time.monotonic", return_value=100.0)
+        cache = MembershipCache(ttl=60)
+        cache.set_many("user", "tracks", {"a": True})
+
+        monotonic.return_value = 161.0
+
+        assert cache.get_many("user", "tracks", ["a"]) == [None]
+
+    def test_clear_one_user(self):
+        cache = MembershipCache()
+        cache.set_many("user", "tracks", {"a": True})
+        cache.set_many("other", "tracks", {"a": True})
+
+        cache.clear("user")
+
+        assert cache.get_many("user", "tracks", ["a"]) == [None]
+        assert cache.get_many("other", "tracks", ["a"]) == [True]
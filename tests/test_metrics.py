@@ -0,0 +1,146 @@
+import asyncio
+import urllib.request
+import pytest
+from griptape.artifacts import ErrorArtifact
+from spotify_griptape_tool.async_tool import AsyncSpotifyClient
+from spotify_griptape_tool.concurrency import AdaptiveConcurrencyLimiter
+from spotify_griptape_tool.metrics import Histogram, MetricsRegistry, endpoint_label
+from spotify_griptape_tool.mock_server import MockSpotifyServer, make_id
+
+
+class TestEndpointLabel:
+    def test_replaces_ids(self):
+        assert endpoint_label(f"https://api.spotify.com/v1/albums/{make_id('album', 1)}/tracks?limit=5") == (
+            "albums/{id}/tracks"
+        )
+        assert endpoint_label("https://api.spotify.com/v1/users/some.user/playlists") == "users/{user_id}/playlists"
+        assert endpoint_label("https://api.spotify.com/v1/browse/categories/jazz/playlists") == (
+            "browse/categories/{category_id}/playlists"
+        )
+        assert endpoint_label("https://api.spotify.com/v1/me/library/contains") == "me/library/contains"
+
+
+class TestHistogram:
+    def test_estimates_quantiles_within_buckets(self):
+        histogram = Histogram((0.1, 0.2, 0.4))
+        for value in [0.05] * 50 + [0.15] * 40 + [0.3] * 10:
+            histogram.observe(value)
+
+        assert histogram.count == 100
+        assert histogram.quantile(0.5) == pytest.approx(0.1)
+        assert histogram.quantile(0.7) == pytest.approx(0.15)
+        assert histogram.quantile(0.99) == pytest.approx(0.38)
+        assert Histogram((0.1,)).quantile(0.5) is None
+
+
+class TestMetricsRegistry:
+    def test_renders_prometheus_text(self):
+        metrics = MetricsRegistry(buckets=(0.1, 1.0))
+        metrics.observe_activity("get_album", 0.05, error=False)
+        metrics.observe_activity("get_album", 0.5, error=True)
+        metrics.observe_request("GET", "https://api.spotify.com/v1/albums/x", 429, 0.2, 0, 64)
+        metrics.observe_cache("response", hits=3, misses=1)
+
+        text = metrics.render()
+
+        assert 'spotify_activity_duration_seconds_bucket{activity="get_album",le="0.1"} 1' in text
+        assert 'spotify_activity_duration_seconds_bucket{activity="get_album",le="+Inf"} 2' in text
+        assert 'spotify_activity_duration_seconds_count{activity="get_album"} 2' in text
+        assert 'spotify_activity_calls_total{activity="get_album",outcome="error"} 1' in text
+        assert 'spotify_api_requests_total{method="GET",endpoint="albums/x",status="429"} 1' in text
+        assert 'spotify_api_response_bytes_total{method="GET",endpoint="albums/x"} 64' in text
+        assert 'spotify_cache_lookups_total{cache="response",result="hit"} 3' in text
+        assert metrics.cache_hit_ratio("response") == 0.75
+
+    def test_renders_concurrency_limits(self):
+        metrics = MetricsRegistry()
+        limiter = AdaptiveConcurrencyLimiter(max_limit=8)
+        metrics.watch_limiter(limiter)
+        limiter.acquire()
+        limiter.release(0.01, overloaded=True)
+
+        text = metrics.render()
+
+        assert "# TYPE spotify_concurrency_limit gauge" in text
+        assert 'spotify_concurrency_limit{limiter="default"} 4' in text
+        assert 'spotify_concurrency_in_flight{limiter="default"} 0' in text
+        assert metrics.snapshot()["limiters"] == {"default": {"limit": 4, "in_flight": 0}}
+
+    def test_serves_metrics_endpoint(self):
+        metrics = MetricsRegistry()
+        metrics.observe_activity("search", 0.01, error=False)
+        server = metrics.serve(port=0)
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{server.server_address[1]}/metrics") as response:
+                body = response.read().decode()
+        finally:
+            server.shutdown()
+
+        assert 'spotify_activity_calls_total{activity="search",outcome="ok"} 1' in body
+
+
+class TestInstrumentedTool:
+    @pytest.fixture
+    def server(self):
+        return MockSpotifyServer()
+
+    def test_records_activities_requests_and_cache(self, server, make_tool):
+        tool = make_tool(api_base_url=server.base_url, metrics=MetricsRegistry())
+        server.mount(tool._get_client()._session)
+        id = make_id("album", 1)
+
+        tool.get_album({"values": {"id": id, "market": "US"}})
+        tool.get_album({"values": {"id": id, "market": "US"}})
+        tool.read_result_page({"values": {"handle": "missing", "offset": 0}})
+        snapshot = tool.metrics.snapshot()
+
+        assert snapshot["activities"]["get_album"]["count"] == 2
+        assert snapshot["activities"]["read_result_page"]["errors"] == 1
+        assert snapshot["requests"]["GET albums/{id}"]["count"] == 1
+        assert snapshot["requests"]["GET albums/{id}"]["statuses"] == {"200": 1}
+        assert snapshot["requests"]["GET albums/{id}"]["bytes_received"] > 0
+        assert snapshot["cache_hit_ratios"]["response"] == 0.5
+        assert snapshot["limiters"]["default"]["limit"] == tool.concurrency_limiter.limit
+
+    def test_counts_attempts_retried_by_the_session(self, make_tool):
+        with MockSpotifyServer(rate_limit_probability=0.5, retry_after=0, seed=0) as server:
+            tool = make_tool(api_base_url=server.base_url, metrics=MetricsRegistry())
+            for n in range(3):
+                tool.get_album({"values": {"id": make_id("album", n), "market": "US"}})
+
+        statuses = tool.metrics.snapshot()["requests"]["GET albums/{id}"]["statuses"]
+        assert statuses == {"200": 3, "429": 2}
+        assert sum(statuses.values()) == server.requests["GET albums/(?P<id>\\w+)"]
+
+    def test_activities_keep_their_config(self, make_tool):
+        tool = make_tool()
+
+        assert tool.get_album.name == "get_album"
+        assert tool.get_album.config["description"]
+        assert tool.activity_name(tool.get_album) == "get_album"
+
+    def test_disabled_by_default(self, server, make_tool):
+        tool = make_tool(api_base_url=server.base_url)
+        server.mount(tool._get_client()._session)
+
+        result = tool.get_artist({"values": {"id": make_id("artist", 1)}})
+
+        assert tool.metrics is None
+        assert not isinstance(result, ErrorArtifact)
+        assert tool._get_client()._session.hooks["response"] == []
+
+    def test_async_activities_are_timed_to_completion(self, make_tool):
+        with MockSpotifyServer(latency=lambda rng: 0.05) as server:
+            tool = make_tool(AsyncSpotifyClient, api_base_url=server.base_url, metrics=MetricsRegistry())
+            asyncio.run(tool.arun_activity("get_artist", {"values": {"id": make_id("artist", 1)}}))
+
+        snapshot = tool.metrics.snapshot()
+        assert snapshot["activities"]["get_artist"]["sum"] >= 0.05
+        assert snapshot["requests"]["GET artists/{id}"]["statuses"] == {"200": 1}
+
+    def test_async_activities_are_counted_once(self, make_tool):
+        tool = make_tool(AsyncSpotifyClient, metrics=MetricsRegistry())
+
+        asyncio.run(tool.arun_activity("read_result_page", {"values": {"handle": "missing", "offset": 0}}))
+
+        assert tool.metrics.snapshot()["activities"]["read_result_page"]["count"] == 1
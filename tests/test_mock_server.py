@@ -0,0 +1,70 @@
+import asyncio
+import json
+import pytest
+import requests
+from spotify_griptape_tool.async_tool import AsyncSpotifyClient
+from spotify_griptape_tool.mock_server import MockSpotifyServer, make_id
+
+
+@pytest.fixture
+def server():
+    with MockSpotifyServer(saved_tracks=120, playlist_size=230) as server:
+        yield server
+
+
+class TestMockSpotifyServer:
+    def test_serves_deterministic_catalog_objects(self, server, make_tool):
+        tool = make_tool(api_base_url=server.base_url, excluded_fields=frozenset())
+        id = make_id("track", 7)
+
+        first = json.loads(tool.get_track({"values": {"id": id, "market": "US"}}).value)
+        tracks = tool.get_tracks({"values": {"ids": [id, make_id("track", 8)], "market": "US"}})
+
+        assert first["name"] == "Track 7"
+        assert len(first["available_markets"]) == 180
+        assert json.loads(tracks.value[0].value) == first
+        assert server.requests["GET tracks/(?P<id>\\w+)"] == 1
+        assert server.requests["GET tracks/?"] == 1
+
+    def test_pages_follow_limit_and_offset(self, server, make_tool):
+        tool = make_tool(api_base_url=server.base_url, result_store=None, result_shaper=None)
+
+        result = tool.get_playlist_items({"values": {"id": make_id("playlist", 1), "all_items": True}})
+
+        assert len(result.value) == 230
+        assert server.requests["GET playlists/(?P<id>\\w+)/(tracks|items)"] == 3
+
+    def test_library_changes_are_visible(self, server, make_tool):
+        tool = make_tool(api_base_url=server.base_url, membership_cache=None)
+        id = make_id("track", 999)
+
+        tool.save_tracks_for_user({"values": {"ids": [id]}})
+        saved = tool.check_current_users_saved_tracks({"values": {"ids": [id, make_id("track", 998)]}})
+        newest = tool.get_current_users_saved_tracks({"values": {"limit": 1, "offset": 0, "market": "US"}})
+
+        assert [artifact.value for artifact in saved.value] == ["true", "false"]
+        assert json.loads(newest.value[0].value)["track"]["id"] == id
+
+    def test_transport_serves_in_process(self, make_tool):
+        server = MockSpotifyServer()
+        tool = make_tool(api_base_url=server.base_url, result_store=None, result_shaper=None)
+        server.mount(tool._get_client()._session)
+
+        result = tool.get_artist_albums({"values": {"id": make_id("artist", 2), "limit": 50, "offset": 0}})
+
+        assert len(result.value) == 40
+        assert server.requests["GET artists/(?P<id>\\w+)/albums"] == 1
+
+    def test_injects_rate_limits(self):
+        with MockSpotifyServer(rate_limit_probability=1.0, retry_after=3) as server:
+            response = requests.get(f"{server.base_url}tracks/{make_id('track', 1)}")
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "3"
+
+    def test_async_client_uses_the_base_url(self, server, make_tool):
+        tool = make_tool(AsyncSpotifyClient, api_base_url=server.base_url)
+
+        result = asyncio.run(tool.arun_activity("get_album", {"values": {"id": make_id("album", 3), "market": "US"}}))
+
+        assert json.loads(result.value)["name"] == "Album 3"
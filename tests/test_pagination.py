@@ -0,0 +1,94 @@
+import threading
+import time
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from spotify_griptape_tool.pagination import fetch_all_pages, iter_items
+
+
+def make_page(offset, limit, total, with_total=True):
+    page = {"items": list(range(offset, min(offset + limit, total)))}
+    page["next"] = f"offset={offset + limit}" if offset + limit < total else None
+    if with_total:
+        page["total"] = total
+    return page
+
+
+class TestFetchAllPages:
+    def test_fetches_remaining_offsets_when_total_is_known(self):
+        offsets = []
+
+        def fetch_page(offset):
+            offsets.append(offset)
+            return make_page(offset, 10, 35)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            items = fetch_all_pages(fetch_page, 10, executor=executor)
+
+        assert items == list(range(35))
+        assert sorted(offsets) == [0, 10, 20, 30]
+
+    def test_waits_for_running_pages_before_raising(self):
+        started = threading.Event()
+        finished = []
+
+        def fetch_page(offset):
+            if offset == 10:
+                started.wait(timeout=5)
+                raise ValueError("boom")
+            if offset == 20:
+                started.set()
+                time.sleep(0.05)
+                finished.append(offset)
+            return make_page(offset, 10, 30)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            with pytest.raises(ValueError):
+                fetch_all_pages(fetch_page, 10, executor=executor)
+            assert finished == [20]
+
+    def test_follows_next_links_without_total(self):
+        def fetch_next(page):
+            return make_page(int(page["next"].split("=")[1]), 10, 25, with_total=False)
+
+        items = fetch_all_pages(lambda offset: make_page(offset, 10, 25, with_total=False), 10, fetch_next=fetch_next)
+
+        assert items == list(range(25))
+
+
+class TestIterItems:
+    def test_yields_items_lazily_with_read_ahead(self):
+        offsets = []
+
+        def fetch_page(offset):
+            offsets.append(offset)
+            return make_page(offset, 10, 45)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            items = iter_items(fetch_page, 10, executor=executor, prefetch=1)
+            first = [next(items) for _ in range(5)]
+            fetched_before_exhausting_first_page = len(offsets)
+            rest = list(items)
+
+        assert first + rest == list(range(45))
+        assert fetched_before_exhausting_first_page <= 2
+        assert sorted(offsets) == [0, 10, 20, 30, 40]
+
+    def test_closing_waits_for_pages_in_flight(self):
+        finished = []
+
+        def fetch_page(offset):
+            if offset:
+                time.sleep(0.05)
+                finished.append(offset)
+            return make_page(offset, 10, 45)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            items = iter_items(fetch_page, 10, executor=executor, prefetch=1)
+            next(items)
+            items.close()
+            assert finished == [10]
+
+    def test_follows_next_without_total(self):
+        items = iter_items(lambda offset: make_page(offset, 10, 25, with_total=False), 10)
+
+        assert list(items) == list(range(25))
@@ -0,0 +1,56 @@
+from spotify_griptape_tool.projection import (
+    api_field_names,
+    drop_fields,
+    parse_fields,
+    project,
+    select_fields,
+    with_fields,
+)
+
+TRACK = {
+    "id": "t",
+    "name": "Song",
+    "available_markets": ["US", "GB"],
+    "album": {"id": "a", "name": "Album", "images": [{"url": "x"}], "available_markets": ["US"]},
+    "artists": [{"id": "r1", "name": "One", "external_urls": {}}, {"id": "r2", "name": "Two", "external_urls": {}}],
+}
+
+
+class TestProjection:
+    def test_parse_fields_builds_a_tree(self):
+        assert parse_fields(["id", "album.name", "album.id"]) == {"id": None, "album": {"name": None, "id": None}}
+
+    def test_whole_field_wins_over_nested_fields(self):
+        assert parse_fields(["album.name", "album"]) == {"album": None}
+        assert parse_fields(["album", "album.name"]) == {"album": None}
+
+    def test_select_fields_maps_over_lists(self):
+        result = select_fields(TRACK, parse_fields(["name", "album.name", "artists.name", "missing"]))
+
+        assert result == {"name": "Song", "album": {"name": "Album"}, "artists": [{"name": "One"}, {"name": "Two"}]}
+
+    def test_drop_fields_removes_keys_at_any_depth(self):
+        result = drop_fields(TRACK, frozenset({"available_markets", "images", "external_urls"}))
+
+        assert result == {
+            "id": "t",
+            "name": "Song",
+            "album": {"id": "a", "name": "Album"},
+            "artists": [{"id": "r1", "name": "One"}, {"id": "r2", "name": "Two"}],
+        }
+
+    def test_requested_fields_are_not_excluded(self):
+        result = project(TRACK, ["album.images"], frozenset({"images"}))
+
+        assert result == {"album": {"images": [{"url": "x"}]}}
+
+    def test_api_field_names_leave_out_exclusions(self):
+        names = api_field_names("tracks.items(added_at,track(name,album(!images,external_urls)))")
+
+        assert names == frozenset({"tracks", "items", "added_at", "track", "name", "album", "external_urls"})
+        assert api_field_names(None) == frozenset()
+
+    def test_with_fields_adds_only_missing_top_level_names(self):
+        assert with_fields("items(track(name,total))", ["total", "next"]) == "items(track(name,total)),total,next"
+        assert with_fields("next,items.track,total", ["total", "next"]) == "next,items.track,total"
+        assert with_fields(None, ["total"]) is None
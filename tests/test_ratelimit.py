@@ -0,0 +1,63 @@
+import pytest
+import requests
+from spotify_griptape_tool.ratelimit import RateLimitedSession, RateLimiter
+
+
+def make_response(status_code, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    return response
+
+
+class TestRateLimiter:
+    def test_burst_is_free_then_requests_are_paced(self, mocker):
+        mocker.patch("spotify_griptape_tool.ratelimit.time.monotonic", return_value=100.0)
+        limiter = RateLimiter(rate=10, burst=3)
+
+        delays = [limiter.reserve() for _ in range(5)]
+
+        assert delays[:3] == [0, 0, 0]
+        assert delays[3:] == [pytest.approx(0.1), pytest.approx(0.2)]
+
+    def test_pause_delays_every_caller(self, mocker):
+        mocker.patch("spotify_griptape_tool.ratelimit.time.monotonic", return_value=100.0)
+        limiter = RateLimiter(rate=10, burst=10)
+
+        limiter.pause(5)
+
+        assert limiter.reserve() == 5
+        assert limiter.reserve() == 5
+
+    def test_queue_depth_counts_waiting_callers(self, mocker):
+        limiter = RateLimiter(rate=1, burst=1)
+        depths = []
+        mocker.patch(
+            "spotify_griptape_tool.ratelimit.time.sleep", side_effect=lambda _: depths.append(limiter.queue_depth)
+        )
+
+        limiter.acquire()
+        limiter.acquire()
+
+        assert depths == [1]
+        assert limiter.queue_depth == 0
+
+
+class TestRateLimitedSession:
+    def test_429_pauses_limiter_and_retries(self, mocker):
+        clock = [100.0]
+        mocker.patch("spotify_griptape_tool.ratelimit.time.monotonic", side_effect=lambda: clock[0])
+        sleep = mocker.patch(
+            "spotify_griptape_tool.ratelimit.time.sleep",
+            side_effect=lambda delay: clock.__setitem__(0, clock[0] + delay),
+        )
+        limiter = RateLimiter(rate=1000, burst=1000)
+        send = mocker.patch(
+            "requests.Session.request", side_effect=[make_response(429, {"Retry-After": "2"}), make_response(200)]
+        )
+
+        response = RateLimitedSession(limiter).request("GET", "https://api.spotify.com/v1/me")
+
+        assert response.status_code == 200
+        assert send.call_count == 2
+        sleep.assert_called_once_with(2.0)
@@ -0,0 +1,94 @@
+import gzip
+import json
+import pytest
+from griptape.artifacts import ErrorArtifact
+from spotify_griptape_tool.mock_server import MockSpotifyServer, MockTransport, make_id
+from spotify_griptape_tool.replay import Cassette, Interaction, RecordingTransport, ReplayTransport, request_key
+from spotify_griptape_tool.tool import SpotifyClient
+
+
+@pytest.fixture
+def replay_tool(make_tool):
+    def make(transport) -> SpotifyClient:
+        return make_tool(transport=transport, response_cache=None, membership_cache=None, result_store=None)
+
+    return make
+
+
+def record(replay_tool, server, activities):
+    tool = replay_tool(RecordingTransport(inner=MockTransport(server)))
+    results = [getattr(tool, name)({"values": values}) for name, values in activities]
+    return tool.transport.cassette, results
+
+
+class TestRequestKey:
+    def test_ignores_host_and_query_order(self):
+        assert request_key("GET", "https://api.spotify.com/v1/tracks?ids=a&market=US") == request_key(
+            "GET", "http://spotify.mock/v1/tracks?market=US&ids=a"
+        )
+
+    def test_distinguishes_bodies(self):
+        assert request_key("PUT", "https://api.spotify.com/v1/me", '{"a":1}') != request_key(
+            "PUT", "https://api.spotify.com/v1/me", '{"a":2}'
+        )
+
+
+class TestRecordReplay:
+    def test_replays_recorded_results_without_the_server(self, tmp_path, replay_tool):
+        server = MockSpotifyServer(playlist_size=230)
+        activities = [
+            ("get_album", {"id": make_id("album", 1), "market": "US"}),
+            ("get_playlist_items", {"id": make_id("playlist", 1), "market": "US", "all_items": True}),
+        ]
+        cassette, recorded = record(replay_tool, server, activities)
+        cassette.save(str(tmp_path / "session.ndjson.gz"))
+
+        tool = replay_tool(ReplayTransport(Cassette.load(str(tmp_path / "session.ndjson.gz")), latency_scale=0))
+        replayed = [getattr(tool, name)({"values": values}) for name, values in activities]
+
+        assert len(cassette) == sum(server.requests.values()) == 4
+        assert [result.to_text() for result in replayed] == [result.to_text() for result in recorded]
+
+    def test_repeated_requests_replay_in_order(self, replay_tool):
+        server = MockSpotifyServer()
+        id = make_id("track", 1234)
+        check = ("check_current_users_saved_tracks", {"ids": [id]})
+        cassette, _ = record(replay_tool, server, [check, ("save_tracks_for_user", {"ids": [id]}), check])
+
+        tool = replay_tool(ReplayTransport(cassette, latency_scale=0))
+        results = [tool.check_current_users_saved_tracks({"values": {"ids": [id]}}) for _ in range(3)]
+
+        assert [result.value[0].value for result in results] == ["false", "true", "true"]
+
+    def test_scales_recorded_latency(self, mocker, replay_tool):
+        sleep = mocker.patch("spotify_griptape_tool.replay.time.sleep")
+        key = request_key("GET", "https://api.spotify.com/v1/tracks/abc?market=US")
+        cassette = Cassette([Interaction(key, 200, {}, json.dumps({"id": "abc"}).encode(), 0.2)])
+
+        result = replay_tool(ReplayTransport(cassette, latency_scale=0.5)).get_track({"values": {"id": "abc"}})
+
+        assert json.loads(result.value)["id"] == "abc"
+        sleep.assert_called_once_with(pytest.approx(0.1))
+
+    def test_unrecorded_request_is_an_error(self, replay_tool):
+        tool = replay_tool(ReplayTransport(Cassette(), latency_scale=0))
+
+        result = tool.get_track({"values": {"id": "abc"}})
+
+        assert isinstance(result, ErrorArtifact)
+        assert "No recorded response for: GET /v1/tracks/abc" in result.value
+
+    def test_records_errors_with_retry_after(self, replay_tool):
+        server = MockSpotifyServer(rate_limit_probability=1.0, retry_after=2)
+        cassette, _ = record(replay_tool, server, [("get_track", {"id": make_id("track", 1)})])
+
+        assert cassette.interactions[0].status == 429
+        assert cassette.interactions[0].headers["Retry-After"] == "2"
+
+    def test_rejects_unknown_cassette_versions(self, tmp_path):
+        path = str(tmp_path / "session.ndjson.gz")
+        with gzip.open(path, "wt") as f:
+            f.write('{"version": 99}\n')
+
+        with pytest.raises(ValueError):
+            Cassette.load(path)
@@ -0,0 +1,64 @@
+import os
+import pytest
+from spotify_griptape_tool.results import MemoryResultStore
+
+
+class TestMemoryResultStore:
+    def test_reads_pages_back(self):
+        store = MemoryResultStore()
+        handle = store.put([{"n": n} for n in range(10)])
+
+        assert store.get(handle, 3, 4) == ([{"n": 3}, {"n": 4}, {"n": 5}, {"n": 6}], 10)
+        assert store.get(handle, 8, 4) == ([{"n": 8}, {"n": 9}], 10)
+        assert store.get(handle, 20, 4) == ([], 10)
+
+    @pytest.mark.parametrize("offset, limit", [(-1, 4), (0, 0), (0, -5)])
+    def test_rejects_out_of_range_pages(self, offset, limit):
+        store = MemoryResultStore()
+        handle = store.put([{"n": n} for n in range(10)])
+
+        with pytest.raises(ValueError):
+            store.get(handle, offset, limit)
+
+    def test_spills_oldest_results_to_disk(self, tmp_path):
+        store = MemoryResultStore(max_memory_size=100, spill_directory=str(tmp_path))
+        first = store.put([{"name": f"Track {n}"} for n in range(10)])
+        second = store.put([{"n": 1}])
+
+        assert os.listdir(tmp_path) == [f"{first}.ndjson"]
+        assert store.memory_size == len('{"n":1}')
+        assert store.get(first, 8, 5) == ([{"name": "Track 8"}, {"name": "Track 9"}], 10)
+        assert store.get(second, 0, 5) == ([{"n": 1}], 1)
+
+    def test_deleting_a_spilled_result_removes_its_file(self, tmp_path):
+        store = MemoryResultStore(max_memory_size=0, spill_directory=str(tmp_path))
+        handle = store.put([{"n": 1}])
+
+        store.delete(handle)
+
+        assert os.listdir(tmp_path) == []
+        with pytest.raises(KeyError):
+            store.get(handle, 0, 1)
+
+    def test_results_expire(self, mocker):
+        monotonic = mocker.patch("spotify_griptape_tool.results.time.monotonic", return_value=100.0)
+        store = MemoryResultStore(ttl=60)
+        handle = store.put([{"n": 1}])
+
+        monotonic.return_value = 161.0
+
+        with pytest.raises(KeyError):
+            store.get(handle, 0, 1)
+        assert store.memory_size == 0
+
+    def test_least_recently_read_results_are_dropped(self):
+        store = MemoryResultStore(max_results=2)
+        first = store.put([1])
+        second = store.put([2])
+        store.get(first, 0, 1)
+
+        store.put([3])
+
+        assert store.get(first, 0, 1) == ([1], 1)
+        with pytest.raises(KeyError):
+            store.get(second, 0, 1)
@@ -0,0 +1,25 @@
+import json
+import pytest
+from spotify_griptape_tool.serialization import JsonResultSerializer, ReprResultSerializer
+
+
+class TestJsonResultSerializer:
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_output_is_compact_json(self, use_orjson):
+        serializer = JsonResultSerializer(use_orjson=use_orjson)
+
+        result = serializer.serialize({"name": "Björk", "explicit": False, "preview_url": None, "artists": [1, 2]})
+
+        assert result == '{"name":"Björk","explicit":false,"preview_url":null,"artists":[1,2]}'
+
+    def test_falls_back_to_json_without_orjson(self, mocker):
+        mocker.patch("spotify_griptape_tool.serialization.import_optional_dependency", side_effect=ImportError)
+        dumps = mocker.spy(json, "dumps")
+
+        assert JsonResultSerializer().serialize({"id": "a"}) == '{"id":"a"}'
+        dumps.assert_called_once()
+
+
+class TestReprResultSerializer:
+    def test_output_matches_str(self):
+        assert ReprResultSerializer().serialize({"id": "a"}) == str({"id": "a"})
@@ -0,0 +1,119 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, current_thread, main_thread
+import httpx
+from spotify_griptape_tool.async_tool import AsyncSpotifyClient
+from spotify_griptape_tool.mock_server import MockSpotifyServer, MockTransport, make_id
+from spotify_griptape_tool.session import SessionPool
+
+
+class TestSessionPool:
+    def test_creates_each_value_once(self):
+        pool = SessionPool()
+        release = Event()
+        calls = []
+
+        def create():
+            calls.append(1)
+            release.wait(1)
+            return object()
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(pool.get, "key", create) for _ in range(4)]
+            release.set()
+            values = {id(future.result()) for future in futures}
+
+        assert len(calls) == 1
+        assert len(values) == 1
+        assert pool.get("key", lambda: None) is futures[0].result()
+
+
+class TestLazyConstruction:
+    def test_construction_does_not_authenticate(self, mocker, make_tool):
+        exchange = mocker.patch("spotify_griptape_tool.tool.SpotifyOAuth.get_access_token", return_value="token")
+
+        tool = make_tool(user_token=None, authorization_code="code")
+
+        exchange.assert_not_called()
+        assert tool._client is None
+        assert tool._get_client()._auth_headers() == {"Authorization": "Bearer token"}
+        exchange.assert_any_call("code", as_dict=False)
+
+    def test_listing_activities_does_not_authenticate(self, mocker, make_tool):
+        exchange = mocker.patch(
+            "spotify_griptape_tool.tool.SpotifyOAuth.get_access_token", side_effect=RuntimeError("invalid_grant")
+        )
+        tool = make_tool(AsyncSpotifyClient, user_token=None, authorization_code="code")
+
+        activities = tool.activities()
+
+        assert tool.find_activity("get_artist") in activities
+        exchange.assert_not_called()
+        assert tool._client is None and tool._http_client is None
+        assert "invalid_grant" in tool.get_artist({"values": {"id": "a"}}).value
+
+    def test_client_is_set_up_on_first_activity(self, make_tool):
+        server = MockSpotifyServer()
+        tool = make_tool(api_base_url=server.base_url, transport=MockTransport(server))
+
+        assert tool._client is None
+        tool.get_artist({"values": {"id": make_id("artist", 1)}})
+
+        assert tool._get_client().prefix == server.base_url
+        assert sum(server.requests.values()) == 1
+
+    def test_pooled_tools_share_tokens_and_connections(self, mocker, make_tool):
+        exchange = mocker.patch("spotify_griptape_tool.tool.SpotifyOAuth.get_access_token", return_value="token")
+        pool = SessionPool()
+
+        first = make_tool(user_token=None, authorization_code="code", session_pool=pool)
+        second = make_tool(user_token=None, authorization_code="code", session_pool=pool)
+
+        assert (
+            first._get_client()._auth_headers()
+            == second._get_client()._auth_headers()
+            == {"Authorization": "Bearer token"}
+        )
+        assert [call for call in exchange.call_args_list if call.args == ("code",)] == [
+            mocker.call("code", as_dict=False)
+        ]
+        assert first._get_client().auth_manager is second._get_client().auth_manager
+        assert first._get_client()._session is not second._get_client()._session
+        assert first._get_client()._session.get_adapter("https://") is second._get_client()._session.get_adapter(
+            "https://"
+        )
+
+    def test_user_tokens_are_refreshed(self, mocker, make_tool):
+        def token(access_token, expires_in):
+            return mocker.Mock(
+                json=lambda: {"access_token": access_token, "expires_in": expires_in, "refresh_token": "r"}
+            )
+
+        post = mocker.patch("requests.Session.post", side_effect=[token("first", 0), token("second", 3600)])
+        pool = SessionPool()
+        first = make_tool(user_token=None, authorization_code="code", session_pool=pool)
+        second = make_tool(user_token=None, authorization_code="code", session_pool=pool)
+
+        assert first._get_client()._auth_headers() == {"Authorization": "Bearer second"}
+        assert second._get_client()._auth_headers() == {"Authorization": "Bearer second"}
+        assert post.call_args_list[1].kwargs["data"]["grant_type"] == "refresh_token"
+
+    def test_async_tools_authenticate_off_the_event_loop(self, mocker, make_tool):
+        threads = []
+        mocker.patch(
+            "spotify_griptape_tool.tool.SpotifyOAuth.get_access_token",
+            side_effect=lambda *args, **kwargs: threads.append(current_thread()) or "token",
+        )
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, json={})))
+        tool = make_tool(AsyncSpotifyClient, user_token=None, authorization_code="code", http_client=http_client)
+
+        asyncio.run(tool.arun_activity("get_artist", {"values": {"id": "a"}}))
+
+        assert threads
+        assert main_thread() not in threads
+
+    def test_async_http_client_is_created_on_first_use(self, make_tool):
+        tool = make_tool(AsyncSpotifyClient)
+
+        assert tool._http_client is None
+        assert tool._get_client()._session.get_adapter("https://").http_client is tool._get_http_client()
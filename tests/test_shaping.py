@@ -0,0 +1,78 @@
+import json
+from spotify_griptape_tool.shaping import AUDIO_FEATURES_SLIM_FIELDS, ResultShaper, slim, summarize
+
+TRACK = {
+    "type": "track",
+    "id": "t1",
+    "name": "Doxy",
+    "uri": "spotify:track:t1",
+    "popularity": 50,
+    "artists": [{"type": "artist", "id": "a1", "name": "Miles Davis", "href": "https://api.spotify.com/v1/artists/a1"}],
+    "album": {"type": "album", "id": "b1", "name": "Bags' Groove", "label": "Prestige"},
+}
+
+
+SHORTENED = "Items were shortened to fit the output size limit."
+
+
+def serialize(value):
+    return json.dumps(value, separators=(",", ":"))
+
+
+class TestResultShaper:
+    def test_small_results_are_left_whole(self):
+        texts = ResultShaper(max_size=10_000).shape([TRACK], serialize)
+
+        assert texts == [serialize(TRACK)]
+
+    def test_slims_results_that_do_not_fit(self):
+        size = len(serialize(slim(TRACK))) + len(SHORTENED)
+
+        texts = ResultShaper(max_size=size).shape([TRACK], serialize)
+
+        assert texts == [serialize(slim(TRACK)), SHORTENED]
+        assert "popularity" not in texts[0] and "href" not in texts[0]
+
+    def test_summarizes_results_when_slim_objects_do_not_fit(self):
+        texts = ResultShaper(max_size=120).shape([TRACK, {"track": TRACK}], serialize)
+
+        assert texts == ["track: Doxy by Miles Davis (t1)"] * 2 + [SHORTENED]
+
+    def test_keeps_what_fits_and_counts_the_rest(self):
+        texts = ResultShaper(max_size=170).shape([TRACK] * 20, serialize)
+
+        assert texts[:-1] == ["track: Doxy by Miles Davis (t1)"] * 3
+        assert texts[-1] == "Showing 3 of 20 items to fit the output size limit. 17 more were left out."
+        assert sum(len(text) for text in texts) <= 170
+
+    def test_single_results_are_never_truncated(self):
+        texts = ResultShaper(max_size=1).shape([TRACK], serialize, truncate=False)
+
+        assert texts == ["track: Doxy by Miles Davis (t1)", SHORTENED]
+
+    def test_labels_prefix_each_item(self):
+        texts = ResultShaper(max_size=100).shape([TRACK], serialize, labels=["tracks"])
+
+        assert texts == ["tracks: track: Doxy by Miles Davis (t1)", SHORTENED]
+
+    def test_other_payloads_keep_their_own_slim_fields(self):
+        features = {"type": "audio_features", "id": "t1", "track_href": "https://api.spotify.com/v1/tracks/t1"}
+        features.update(danceability=0.5, energy=0.7, tempo=120.0)
+        size = len(serialize(slim(features, AUDIO_FEATURES_SLIM_FIELDS))) + len(SHORTENED)
+
+        texts = ResultShaper(max_size=size).shape(
+            [features], serialize, slim_fields=AUDIO_FEATURES_SLIM_FIELDS, summaries=False
+        )
+
+        assert json.loads(texts[0]) == {"id": "t1", "danceability": 0.5, "energy": 0.7, "tempo": 120.0}
+        assert texts[1] == SHORTENED
+
+    def test_unshortened_items_are_truncated_to_at_least_one(self):
+        texts = ResultShaper(max_size=1).shape([TRACK] * 3, serialize, slim_fields=None, summaries=False)
+
+        assert texts == [serialize(TRACK), "Showing 1 of 3 items to fit the output size limit. 2 more were left out."]
+
+    def test_summarize_uses_playlist_owner(self):
+        playlist = {"type": "playlist", "id": "p", "name": "Mix", "owner": {"display_name": "Matt"}}
+
+        assert summarize(playlist) == "playlist: Mix by Matt (p)"
@@ -0,0 +1,69 @@
+import threading
+import time
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from spotify_griptape_tool.mock_server import MockSpotifyServer, MockTransport
+from spotify_griptape_tool.singleflight import SingleFlight, normalize_params
+
+
+class TestSingleFlight:
+    def test_concurrent_calls_share_one_execution(self):
+        single_flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            release.wait(1)
+            return {"id": "a"}
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            leader = executor.submit(single_flight.do, "key", fetch)
+            while "key" not in single_flight._calls:
+                time.sleep(0.001)
+            followers = [executor.submit(single_flight.do, "key", fetch) for _ in range(3)]
+            time.sleep(0.05)
+            release.set()
+            results = [future.result(timeout=1) for future in [leader, *followers]]
+
+        assert results == [{"id": "a"}] * 4
+        assert len(calls) == 1
+
+    def test_exceptions_are_propagated(self):
+        def fetch():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            SingleFlight().do("key", fetch)
+
+    def test_completed_calls_are_not_retained(self):
+        single_flight = SingleFlight()
+
+        assert single_flight.do("key", lambda: 1) == 1
+        assert single_flight.do("key", lambda: 2) == 2
+
+    def test_normalize_params(self):
+        assert normalize_params({"b": [1, 2], "a": None}) == normalize_params({"a": None, "b": (1, 2)})
+
+
+class TestToolRequests:
+    def test_calls_with_different_credentials_are_not_shared(self, mocker, make_tool):
+        server = MockSpotifyServer()
+        single_flight = SingleFlight()
+        do = mocker.spy(SingleFlight, "do")
+        tools = [
+            make_tool(
+                user_token=user_token,
+                api_base_url=server.base_url,
+                transport=MockTransport(server),
+                single_flight=single_flight,
+            )
+            for user_token in ["alice", "bob", "alice"]
+        ]
+
+        for tool in tools:
+            tool._request("current_user")
+
+        first, second, third = [call.args[1] for call in do.call_args_list]
+        assert first != second
+        assert first == third
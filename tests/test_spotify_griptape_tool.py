@@ -1,15 +1,382 @@
-from griptape.artifacts import TextArtifact
-from spotify_griptape_tool.tool import SpotifyClient
+import json
+import threading
+import time
+import pytest
+from griptape.artifacts import ErrorArtifact
+from spotipy import SpotifyException
+from spotify_griptape_tool.mock_server import MockSpotifyServer, make_id
+from spotify_griptape_tool.shaping import ResultShaper
 
 
-class TestReverseStringTool:
-    def test_reverse_string(self):
-        value = "some_value"
+def to_json(value):
+    return json.dumps(value, separators=(",", ":"))
 
-        tool = SpotifyClient()
 
-        params = {"values": {"input": value}}
-        result = tool.reverse_string(params)
+class TestSpotifyClient:
+    @pytest.fixture
+    def client(self, mocker):
+        return mocker.MagicMock()
 
-        assert isinstance(result, TextArtifact), "Expected TextArtifact instance"
-        assert result.value == value[::-1]
+    @pytest.fixture
+    def tool(self, make_tool, client):
+        return make_tool(client=client)
+
+    def test_get_album_is_cached(self, tool, client):
+        client.album.return_value = {"id": "a"}
+
+        first = tool.get_album({"values": {"id": "a", "market": "US"}})
+        second = tool.get_album({"values": {"id": "a", "market": "US"}})
+
+        assert first.value == second.value
+        client.album.assert_called_once_with("a", market="US")
+
+    def test_cache_disabled_with_zero_ttl(self, tool, client):
+        tool.cache_ttls["artist"] = 0
+        client.artist.return_value = {"id": "a"}
+
+        tool.get_artist({"values": {"id": "a"}})
+        tool.get_artist({"values": {"id": "a"}})
+
+        assert client.artist.call_count == 2
+
+    def test_output_leaves_out_bulky_fields(self, tool, client):
+        client.track.return_value = {"id": "a", "available_markets": ["US"], "album": {"images": [], "id": "b"}}
+
+        result = tool.get_track({"values": {"id": "a", "market": "US"}})
+
+        assert result.value == to_json({"id": "a", "album": {"id": "b"}})
+
+    def test_output_is_projected_onto_requested_fields(self, tool, client):
+        tool.projections["get_tracks"] = ["name"]
+        client.tracks.return_value = {"tracks": [{"id": "a", "name": "A", "album": {"name": "B"}}]}
+
+        default = tool.get_tracks({"values": {"ids": ["a"], "market": "US"}})
+        requested = tool.get_tracks({"values": {"ids": ["a"], "market": "US", "fields": ["id", "album.name"]}})
+
+        assert default.value[0].value == to_json({"name": "A"})
+        assert requested.value[0].value == to_json({"id": "a", "album": {"name": "B"}})
+
+    def test_playlist_fields_asked_of_the_api_are_kept(self, tool, client):
+        client.playlist.return_value = {"name": "P", "images": [{"url": "x"}], "external_urls": {}}
+
+        result = tool.get_playlist({"values": {"id": "p", "market": "US", "fields": "name,images"}})
+
+        assert result.value == to_json({"name": "P", "images": [{"url": "x"}]})
+
+    def test_large_list_output_is_shaped_to_the_budget(self, tool, client):
+        tool.result_store = None
+        tool.result_shaper = ResultShaper(max_size=500)
+        client.album_tracks.return_value = {
+            "items": [{"type": "track", "id": str(i), "name": f"Track {i}", "popularity": i} for i in range(100)]
+        }
+
+        result = tool.get_album_tracks({"values": {"id": "a", "market": "US"}})
+
+        assert result.value[0].value == "track: Track 0 (0)"
+        assert result.value[-1].value.endswith(f"{100 - (len(result.value) - 1)} more were left out.")
+        assert sum(len(artifact.value) for artifact in result.value) <= 500
+
+    def test_reading_a_page_before_the_start_is_an_error(self, tool):
+        handle = tool.result_store.put([{"n": n} for n in range(10)])
+
+        result = tool.read_result_page({"values": {"handle": handle, "offset": -3}})
+
+        assert isinstance(result, ErrorArtifact)
+        assert "offset must not be negative" in result.value
+
+    def test_shaped_output_points_to_the_stored_result(self, tool, client):
+        tool.result_shaper = ResultShaper(max_size=500)
+        client.album_tracks.return_value = {
+            "items": [{"type": "track", "id": str(i), "name": f"Track {i}", "popularity": i} for i in range(40)]
+        }
+
+        result = tool.get_album_tracks({"values": {"id": "a", "market": "US"}})
+        shown = len(result.value) - 1
+        note = result.value[-1].value
+        handle = note.split("handle ")[1].split()[0]
+        full = tool.read_result_page({"values": {"handle": handle, "offset": 0}})
+
+        assert note.startswith(f"Showing items 1-{shown} of 40, shortened to fit the output size limit.")
+        assert note.endswith(f"use read_result_page with handle {handle} and offset 0.")
+        assert full.value[0].value == to_json({"type": "track", "id": "0", "name": "Track 0", "popularity": 0})
+        assert full.value[-1].value.endswith(f"with handle {handle} and offset {len(full.value) - 1}.")
+
+    def test_audio_analysis_is_slimmed_to_its_summary_and_stored_in_full(self, tool, client):
+        tool.result_shaper = ResultShaper(max_size=2_000)
+        analysis = {
+            "track": {"duration": 207.9, "tempo": 118.2, "key": 5, "mode": 1, "codestring": "eJx" * 100},
+            "sections": [{"start": 0.0, "duration": 30.0, "tempo": 118.2}],
+            "segments": [{"start": n / 4, "duration": 0.25, "pitches": [0.5] * 12} for n in range(900)],
+        }
+        client.audio_analysis.return_value = analysis
+
+        result = tool.get_audio_analysis({"values": {"id": "t"}})
+        text, note = result.value.split("\n")
+        handle = note.split("handle ")[1].split()[0]
+        full = tool.read_result_page({"values": {"handle": handle, "offset": 0}})
+
+        assert json.loads(text) == {
+            "track": {"duration": 207.9, "tempo": 118.2, "key": 5, "mode": 1},
+            "sections": [{"start": 0.0, "duration": 30.0, "tempo": 118.2}],
+        }
+        assert note.startswith("The result was shortened to fit the output size limit.")
+        assert [artifact.value for artifact in full.value] == [to_json(analysis)]
+
+    def test_get_tracks_only_fetches_uncached_ids(self, tool, client):
+        client.track.return_value = {"id": "a"}
+        client.tracks.return_value = {"tracks": [{"id": "b"}]}
+        tool.get_track({"values": {"id": "a", "market": "US"}})
+
+        result = tool.get_tracks({"values": {"ids": ["a", "b", "a"], "market": "US"}})
+
+        assert [artifact.value for artifact in result.value] == [
+            to_json({"id": "a"}),
+            to_json({"id": "b"}),
+            to_json({"id": "a"}),
+        ]
+        client.tracks.assert_called_once_with(["b"], market="US")
+
+    def test_get_albums_splits_long_id_lists(self, tool, client):
+        client.albums.side_effect = lambda ids, market: {"albums": [{"id": id} for id in ids]}
+        ids = [str(i) for i in range(45)]
+
+        result = tool.get_albums({"values": {"ids": ids, "market": "US"}})
+
+        assert [artifact.value for artifact in result.value] == [to_json({"id": id}) for id in ids]
+        assert sorted(len(call.args[0]) for call in client.albums.call_args_list) == [5, 20, 20]
+
+    def test_throttled_attempts_lower_the_concurrency_limit(self, make_tool):
+        # The session's urllib3 retries absorb the 429s, so the activity itself succeeds.
+        with MockSpotifyServer(rate_limit_probability=0.3, retry_after=0) as server:
+            tool = make_tool(api_base_url=server.base_url, result_store=None)
+            tool.get_tracks({"values": {"ids": [make_id("track", n) for n in range(1000)], "market": "US"}})
+
+        assert tool.concurrency_limiter.limit < tool.max_concurrency
+
+    def test_concurrent_get_track_calls_are_batched(self, tool, client):
+        tool.batch_window = 0.05
+        client.tracks.side_effect = lambda ids, market: {"tracks": [{"id": id} for id in ids]}
+
+        results = list(
+            tool.executor.map(lambda id: tool.get_track({"values": {"id": id, "market": "US"}}), ["a", "b", "c"])
+        )
+
+        assert [result.value for result in results] == [to_json({"id": id}) for id in ["a", "b", "c"]]
+        client.tracks.assert_called_once()
+        client.track.assert_not_called()
+
+    def test_identical_concurrent_requests_share_one_call(self, tool, client):
+        release = threading.Event()
+
+        def playlist(*args, **kwargs):
+            release.wait(1)
+            return {"id": "p"}
+
+        client.playlist.side_effect = playlist
+        futures = [tool.executor.submit(tool.get_playlist, {"values": {"id": "p"}}) for _ in range(3)]
+        time.sleep(0.05)
+        release.set()
+
+        assert [future.result(timeout=1).value for future in futures] == [to_json({"id": "p"})] * 3
+        client.playlist.assert_called_once()
+
+    def test_large_results_are_stored_and_read_by_page(self, tool, client):
+        client.current_user_saved_tracks.return_value = {"items": [{"n": n} for n in range(120)]}
+
+        first = tool.get_current_users_saved_tracks({"values": {"limit": 50, "offset": 0, "market": "US"}})
+        note = first.value[-1].value
+        handle = note.split("handle ")[1].split(" ")[0]
+        second = tool.read_result_page({"values": {"handle": handle, "offset": 50}})
+        last = tool.read_result_page({"values": {"handle": handle, "offset": 100}})
+
+        assert [artifact.value for artifact in first.value[:-1]] == [to_json({"n": n}) for n in range(50)]
+        assert note.startswith("Showing items 1-50 of 120.")
+        assert [artifact.value for artifact in second.value[:-1]] == [to_json({"n": n}) for n in range(50, 100)]
+        assert [artifact.value for artifact in last.value] == [to_json({"n": n}) for n in range(100, 120)]
+        client.current_user_saved_tracks.assert_called_once()
+
+    def test_export_saved_tracks_writes_every_page_in_order(self, tool, client, tmp_path):
+        def saved_tracks(limit, offset, market):
+            time.sleep(0.01 if offset % 100 else 0)
+            return {"items": [{"track": {"id": str(n)}} for n in range(offset, min(offset + limit, 230))], "total": 230}
+
+        client.current_user_saved_tracks.side_effect = saved_tracks
+        tool.export_directory = str(tmp_path / "exports")
+        path = tmp_path / "exports" / "library" / "saved.ndjson"
+
+        result = tool.export_current_users_saved_tracks({"values": {"path": "library/saved.ndjson"}})
+
+        assert result.value == f"Successfully exported 230 saved tracks to: {path}"
+        assert [json.loads(line) for line in path.read_text().splitlines()] == [
+            {"track": {"id": str(n)}} for n in range(230)
+        ]
+        assert sorted(call.kwargs["offset"] for call in client.current_user_saved_tracks.call_args_list) == [
+            0,
+            50,
+            100,
+            150,
+            200,
+        ]
+
+    def test_failed_export_leaves_no_file(self, tool, client, tmp_path):
+        def saved_tracks(limit, offset, market):
+            if offset:
+                raise SpotifyException(500, -1, "server error")
+            return {"items": [{"n": n} for n in range(limit)], "total": 100}
+
+        client.current_user_saved_tracks.side_effect = saved_tracks
+        tool.export_directory = str(tmp_path)
+
+        result = tool.export_current_users_saved_tracks({"values": {"path": "saved.ndjson"}})
+
+        assert isinstance(result, ErrorArtifact)
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.parametrize("path", ["/tmp/saved.ndjson", "../saved.ndjson", "library/../../saved.ndjson", "."])
+    def test_export_paths_must_stay_in_the_export_directory(self, tool, client, tmp_path, path):
+        tool.export_directory = str(tmp_path / "exports")
+
+        result = tool.export_current_users_saved_tracks({"values": {"path": path}})
+
+        assert isinstance(result, ErrorArtifact)
+        assert "export directory" in result.value
+        assert list(tmp_path.iterdir()) == []
+        client.current_user_saved_tracks.assert_not_called()
+
+    def test_incremental_sync_returns_only_new_saves(self, tool, client):
+        library = [{"added_at": f"2024-01-{day:02d}T00:00:00Z", "track": {"id": str(day)}} for day in range(28, 0, -1)]
+
+        def saved_tracks(limit, offset, market):
+            return {"items": library[offset : offset + limit], "total": len(library), "next": None}
+
+        client.current_user.return_value = {"id": "user"}
+        client.current_user_saved_tracks.side_effect = saved_tracks
+        first = tool.sync_current_user_saved_library({"values": {"library": "tracks"}})
+        library.insert(0, {"added_at": "2024-02-01T00:00:00Z", "track": {"id": "new"}})
+
+        second = tool.sync_current_user_saved_library({"values": {"library": "tracks"}})
+        third = tool.sync_current_user_saved_library({"values": {"library": "tracks"}})
+
+        assert len(first.value) == 28
+        assert [artifact.value for artifact in second.value] == [to_json(library[0])]
+        assert third.value == "No tracks were saved since the last sync"
+        assert client.current_user_saved_tracks.call_count == 3
+        client.current_user.assert_called_once()
+
+    def test_sync_keys_the_watermark_by_the_budget_user(self, tool, client):
+        client.current_user_saved_albums.return_value = {
+            "items": [{"added_at": "2024-01-01T00:00:00Z", "album": {"id": "a"}}],
+            "total": 1,
+            "next": None,
+        }
+        tool.budget_user_id = "user"
+
+        tool.sync_current_user_saved_library({"values": {"library": "albums"}})
+
+        assert tool.watermark_store.get("user", "albums") is not None
+        client.current_user.assert_not_called()
+
+    def test_saved_track_checks_only_ask_about_unknown_ids(self, tool, client):
+        client.current_user_saved_tracks_contains.side_effect = lambda ids: [False] * len(ids)
+        tool.save_tracks_for_user({"values": {"ids": ["a"]}})
+        tool.check_current_users_saved_tracks({"values": {"ids": ["b"]}})
+        ids = ["a", "b"] + [str(n) for n in range(60)]
+
+        result = tool.check_current_users_saved_tracks({"values": {"ids": ids}})
+
+        assert [artifact.value for artifact in result.value[:3]] == ["true", "false", "false"]
+        assert [call.args[0] for call in client.current_user_saved_tracks_contains.call_args_list] == [
+            ["b"],
+            [str(n) for n in range(50)],
+            [str(n) for n in range(50, 60)],
+        ]
+        client.current_user.assert_not_called()
+
+    def test_removing_albums_updates_membership(self, tool, client):
+        client.current_user_saved_albums_contains.return_value = [True]
+        tool.check_current_user_saved_albums({"values": {"ids": ["a"]}})
+
+        tool.remove_from_current_user_saved_albums({"values": {"ids": ["a"]}})
+        result = tool.check_current_user_saved_albums({"values": {"ids": ["a"]}})
+
+        assert result.value[0].value == "Album with id: a is saved: False"
+        client.current_user_saved_albums_contains.assert_called_once()
+
+    def test_membership_is_kept_per_user(self, tool, client):
+        client.current_user_saved_albums_contains.return_value = [True]
+        tool.check_current_user_saved_albums({"values": {"ids": ["a"]}})
+
+        client._auth = "other user"
+        tool.check_current_user_saved_albums({"values": {"ids": ["a"]}})
+        tool.budget_user_id = "user"
+        tool.check_current_user_saved_albums({"values": {"ids": ["a"]}})
+        tool.check_current_user_saved_albums({"values": {"ids": ["a"]}})
+
+        assert client.current_user_saved_albums_contains.call_count == 3
+
+    def test_saved_album_checks_line_up_with_duplicate_ids(self, tool, client):
+        tool.membership_cache = None
+        client.current_user_saved_albums_contains.side_effect = lambda ids: [id.startswith("s") for id in ids]
+        ids = ["s1", "u1", "s1"] + [f"u{n}" for n in range(2, 30)]
+
+        result = tool.check_current_user_saved_albums({"values": {"ids": ids}})
+
+        assert [artifact.value for artifact in result.value[:3]] == [
+            "Album with id: s1 is saved: True",
+            "Album with id: u1 is saved: False",
+            "Album with id: s1 is saved: True",
+        ]
+        assert len(result.value) == len(ids)
+        assert [len(call.args[0]) for call in client.current_user_saved_albums_contains.call_args_list] == [20, 11]
+
+    def test_saving_many_tracks_is_sent_in_chunks(self, tool, client):
+        ids = [str(n) for n in range(120)]
+
+        tool.save_tracks_for_user({"values": {"ids": ids}})
+
+        assert [call.args[0] for call in client.current_user_saved_tracks_add.call_args_list] == [
+            ids[:50],
+            ids[50:100],
+            ids[100:],
+        ]
+
+    def test_read_result_page_with_unknown_handle(self, tool):
+        result = tool.read_result_page({"values": {"handle": "missing", "offset": 0}})
+
+        assert isinstance(result, ErrorArtifact)
+
+    def test_get_playlist_items_fetches_every_page(self, tool, client):
+        tool.result_store = None
+
+        def playlist_items(id, limit, offset, **kwargs):
+            return {"items": [{"n": n} for n in range(offset, min(offset + limit, 250))], "total": 250}
+
+        client.playlist_items.side_effect = playlist_items
+
+        result = tool.get_playlist_items({"values": {"id": "p", "all_items": True}})
+
+        assert [artifact.value for artifact in result.value] == [to_json({"n": n}) for n in range(250)]
+        assert client.playlist_items.call_count == 3
+
+    def test_get_playlist_items_keeps_paging_fields_in_the_filter(self, tool, client):
+        tool.result_store = None
+
+        def playlist_items(id, limit, offset, fields, **kwargs):
+            page = {"items": [{"n": n} for n in range(offset, min(offset + limit, 250))], "total": 250}
+            return {key: page[key] for key in fields.split(",") if key in page}
+
+        client.playlist_items.side_effect = playlist_items
+
+        result = tool.get_playlist_items({"values": {"id": "p", "fields": "items", "all_items": True}})
+
+        assert len(result.value) == 250
+        assert client.playlist_items.call_args.kwargs["fields"] == "items,total,next"
+
+    def test_iter_featured_playlists_unwraps_paging_object(self, tool, client):
+        def featured_playlists(limit, offset, **kwargs):
+            items = [{"n": n} for n in range(offset, min(offset + limit, 120))]
+            return {"playlists": {"items": items, "total": 120}}
+
+        client.featured_playlists.side_effect = featured_playlists
+
+        assert list(tool.iter_featured_playlists()) == [{"n": n} for n in range(120)]
@@ -0,0 +1,49 @@
+from spotify_griptape_tool.sync import FileWatermarkStore, advance_watermark, take_new_items
+
+
+def saved(id, added_at):
+    return {"added_at": added_at, "track": {"id": id}}
+
+
+class TestIncrementalSync:
+    def test_takes_items_newer_than_the_watermark(self):
+        items = [
+            saved("c", "2024-03-01T00:00:00Z"),
+            saved("b", "2024-02-01T00:00:00Z"),
+            saved("a", "2024-01-01T00:00:00Z"),
+        ]
+        watermark = {"added_at": "2024-02-01T00:00:00Z", "ids": ["b"]}
+
+        assert list(take_new_items(items, "track", watermark)) == items[:1]
+
+    def test_keeps_unseen_items_saved_at_the_watermark(self):
+        items = [saved("c", "2024-02-01T00:00:00Z"), saved("b", "2024-02-01T00:00:00Z")]
+        watermark = {"added_at": "2024-02-01T00:00:00Z", "ids": ["b"]}
+
+        new_items = list(take_new_items(items, "track", watermark))
+
+        assert new_items == items[:1]
+        assert advance_watermark(watermark, new_items, "track") == {
+            "added_at": "2024-02-01T00:00:00Z",
+            "ids": ["b", "c"],
+        }
+
+    def test_stops_consuming_at_the_watermark(self):
+        consumed = []
+
+        def items():
+            for item in [saved("b", "2024-02-01T00:00:00Z"), saved("a", "2024-01-01T00:00:00Z")]:
+                consumed.append(item)
+                yield item
+            raise AssertionError("read past the watermark")
+
+        list(take_new_items(items(), "track", {"added_at": "2024-01-15T00:00:00Z", "ids": []}))
+
+        assert len(consumed) == 2
+
+    def test_file_store_persists_watermarks(self, tmp_path):
+        path = str(tmp_path / "watermarks.json")
+        FileWatermarkStore(path).set("user", "tracks", {"added_at": "2024-01-01T00:00:00Z", "ids": ["a"]})
+
+        assert FileWatermarkStore(path).get("user", "tracks") == {"added_at": "2024-01-01T00:00:00Z", "ids": ["a"]}
+        assert FileWatermarkStore(path).get("user", "albums") is None
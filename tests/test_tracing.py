@@ -0,0 +1,146 @@
+import asyncio
+import pytest
+from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.trace import SpanKind, StatusCode
+from griptape.artifacts import ErrorArtifact
+from spotify_griptape_tool.async_tool import AsyncSpotifyClient
+from spotify_griptape_tool.mock_server import MockOtlpCollector, MockSpotifyServer, MockTransport, make_id
+from spotify_griptape_tool.tool import SpotifyClient
+from spotify_griptape_tool.tracing import TracingTransport
+
+
+@pytest.fixture
+def exporter():
+    return InMemorySpanExporter()
+
+
+@pytest.fixture
+def tracer(exporter):
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    return provider.get_tracer("test")
+
+
+@pytest.fixture
+def traced_tool(make_tool):
+    def make(server: MockSpotifyServer, tracer, **kwargs) -> SpotifyClient:
+        # Passed as the transport rather than mounted afterwards, so the tracing transport wraps it.
+        return make_tool(api_base_url=server.base_url, transport=MockTransport(server), tracer=tracer, **kwargs)
+
+    return make
+
+
+def split_spans(exporter) -> tuple:
+    spans = exporter.get_finished_spans()
+    activities = [span for span in spans if span.kind == SpanKind.INTERNAL]
+    requests = [span for span in spans if span.kind == SpanKind.CLIENT]
+    return activities, requests
+
+
+class TestTracedTool:
+    def test_requests_are_children_of_their_activity(self, exporter, tracer, traced_tool):
+        tool = traced_tool(MockSpotifyServer(), tracer)
+
+        tool.get_album({"values": {"id": make_id("album", 1), "market": "US"}})
+        [activity], [request] = split_spans(exporter)
+
+        assert activity.name == "SpotifyClient.get_album"
+        assert activity.attributes["spotify.activity"] == "get_album"
+        assert request.name == "GET albums/{id}"
+        assert request.parent.span_id == activity.context.span_id
+        assert request.attributes["spotify.endpoint"] == "albums/{id}"
+        assert request.attributes["http.response.status_code"] == 200
+        assert request.attributes["http.response.body.size"] > 0
+
+    def test_pages_fetched_on_executor_threads_keep_their_parent(self, exporter, tracer, traced_tool):
+        tool = traced_tool(MockSpotifyServer(playlist_size=250), tracer)
+
+        result = tool.get_playlist_items({"values": {"id": make_id("playlist", 1), "all_items": True}})
+        [activity], requests = split_spans(exporter)
+
+        assert not isinstance(result, ErrorArtifact)
+        assert len(requests) == 3
+        assert {request.parent.span_id for request in requests} == {activity.context.span_id}
+        assert sorted(request.attributes["spotify.page"] for request in requests) == [0, 1, 2]
+
+    def test_chunks_are_numbered(self, exporter, tracer, traced_tool):
+        tool = traced_tool(MockSpotifyServer(), tracer)
+
+        tool.get_artists({"values": {"ids": [make_id("artist", n) for n in range(120)]}})
+        [activity], requests = split_spans(exporter)
+
+        assert sorted(request.attributes["spotify.chunk"] for request in requests) == [0, 1, 2]
+        assert {request.parent.span_id for request in requests} == {activity.context.span_id}
+
+    def test_cache_lookups_are_span_events(self, exporter, tracer, traced_tool):
+        tool = traced_tool(MockSpotifyServer(), tracer)
+        params = {"values": {"id": make_id("artist", 1)}}
+
+        tool.get_artist(params)
+        tool.get_artist(params)
+        activities, requests = split_spans(exporter)
+
+        assert len(requests) == 1
+        assert [dict(event.attributes) for activity in activities for event in activity.events] == [
+            {"spotify.cache": "response", "hits": 0, "misses": 1},
+            {"spotify.cache": "response", "hits": 1, "misses": 0},
+        ]
+
+    def test_errors_set_span_status(self, exporter, tracer, traced_tool):
+        tool = traced_tool(MockSpotifyServer(rate_limit_probability=1.0), tracer)
+
+        result = tool.get_track({"values": {"id": make_id("track", 1), "market": "US"}})
+        [activity], [request] = split_spans(exporter)
+
+        assert isinstance(result, ErrorArtifact)
+        assert activity.status.status_code == StatusCode.ERROR
+        assert request.status.status_code == StatusCode.ERROR
+        assert request.attributes["http.response.status_code"] == 429
+
+    def test_retries_are_counted(self, exporter, tracer, make_tool):
+        # With this seed the first attempt is throttled and the retry succeeds.
+        with MockSpotifyServer(rate_limit_probability=0.5, retry_after=0, seed=1) as server:
+            tool = make_tool(api_base_url=server.base_url, tracer=tracer)
+            result = tool.get_track({"values": {"id": make_id("track", 1), "market": "US"}})
+
+        [_], [request] = split_spans(exporter)
+        assert not isinstance(result, ErrorArtifact)
+        assert sum(server.requests.values()) == 2
+        assert request.attributes["http.request.resend_count"] == 1
+        assert request.attributes["http.response.status_code"] == 200
+
+    def test_disabled_by_default(self, make_tool):
+        server = MockSpotifyServer()
+        tool = make_tool(api_base_url=server.base_url, transport=MockTransport(server))
+
+        assert tool.tracer is None
+        assert not isinstance(tool._get_client()._session.get_adapter(server.base_url), TracingTransport)
+
+    def test_async_requests_are_children_of_their_activity(self, exporter, tracer, make_tool):
+        with MockSpotifyServer() as server:
+            tool = make_tool(AsyncSpotifyClient, api_base_url=server.base_url, tracer=tracer)
+            asyncio.run(tool.arun_activity("get_tracks", {"values": {"ids": [make_id("track", n) for n in range(60)]}}))
+
+        [activity], requests = split_spans(exporter)
+        assert activity.name == "AsyncSpotifyClient.get_tracks"
+        assert sorted(request.attributes["spotify.chunk"] for request in requests) == [0, 1]
+        assert {request.parent.span_id for request in requests} == {activity.context.span_id}
+
+
+class TestMockOtlpCollector:
+    def test_receives_exported_spans(self, traced_tool):
+        with MockOtlpCollector() as collector:
+            provider = TracerProvider()
+            provider.add_span_processor(SimpleSpanProcessor(OTLPSpanExporter(endpoint=collector.traces_url)))
+            tool = traced_tool(MockSpotifyServer(), provider.get_tracer("test"))
+            tool.get_album({"values": {"id": make_id("album", 1), "market": "US"}})
+            provider.shutdown()
+
+        spans = {span["name"]: span for span in collector.spans}
+        activity, request = spans["SpotifyClient.get_album"], spans["GET albums/{id}"]
+        assert request["parent_span_id"] == activity["span_id"]
+        assert request["trace_id"] == activity["trace_id"]
+        assert request["attributes"]["http.response.status_code"] == 200